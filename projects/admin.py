@@ -1,5 +1,6 @@
 from django.contrib import admin
 from .models import (
+    Job,
     Project,
     ProjectMembership,
     ProjectRating,
@@ -71,3 +72,18 @@ class ProjectApplicationAdmin(admin.ModelAdmin):
 class TagAdmin(admin.ModelAdmin):
     list_display = ("name",)
     search_fields = ("name",)
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = (
+        "name",
+        "status",
+        "priority",
+        "attempts",
+        "run_at",
+        "finished_at",
+    )
+    list_filter = ("status", "name")
+    search_fields = ("name", "dedup_key", "last_error")
+    readonly_fields = ("started_at", "finished_at", "locked_by", "created_at")
@@ -1,3 +1,5 @@
+import atexit
+
 from django.apps import AppConfig
 
 
@@ -6,4 +8,7 @@ class ProjectsConfig(AppConfig):
     name = "projects"
 
     def ready(self):
-        pass
+        import projects.signals  # noqa: F401
+        from projects.service.db_pool import close_pools
+
+        atexit.register(close_pools)
@@ -0,0 +1,120 @@
+import random
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils.deprecation import MiddlewareMixin
+
+# Set on responses to requests that wrote; while the browser sends it back,
+# that user's reads stay on the primary.
+STICKY_COOKIE = "db_primary"
+
+# Always read from the primary: a session a replica has not caught up with
+# yet (just created on login, just deleted on logout) must not be used.
+PRIMARY_ONLY_APPS = {"sessions"}
+
+_request_state = ContextVar("db_request_state", default=None)
+
+
+WRITE_STATEMENTS = ("INSERT", "UPDATE", "DELETE")
+
+
+class _RequestState:
+    def __init__(self, use_primary):
+        self.use_primary = use_primary
+        self.wrote = False
+
+    def watch_writes(self, execute, sql, params, many, context):
+        # Routers are also asked for a write database when a related object
+        # is merely assigned, so writes are detected from the SQL itself.
+        if sql.lstrip()[:6].upper() in WRITE_STATEMENTS:
+            self.wrote = True
+        return execute(sql, params, many, context)
+
+
+def get_replicas():
+    return getattr(settings, "DATABASE_REPLICAS", [])
+
+
+class PrimaryReplicaRouter:
+    """
+    Send reads made while serving a request to a random replica from
+    ``settings.DATABASE_REPLICAS`` and everything else to the primary.
+
+    Reads stay on the primary when no request is being served (management
+    commands, workers), for sessions, inside a transaction on the primary,
+    after the request wrote, and for requests pinned by
+    ``ReplicaRoutingMiddleware``.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _request_state.get()
+        replicas = get_replicas()
+
+        if (
+            state is None
+            or model._meta.app_label in PRIMARY_ONLY_APPS
+            or state.use_primary
+            or state.wrote
+            or not replicas
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *get_replicas()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive the schema through replication.
+        return db not in get_replicas()
+
+
+class ReplicaRoutingMiddleware(MiddlewareMixin):
+    """
+    Scope ``PrimaryReplicaRouter`` decisions to the request. Unsafe methods
+    and requests from a browser that wrote in the last
+    ``REPLICA_STICKY_SECONDS`` use the primary only, so a redirect after a
+    write (e.g. create a task, then open it) never reads a lagging replica.
+    """
+
+    def process_request(self, request):
+        if not get_replicas():
+            return
+
+        use_primary = (
+            request.method not in ("GET", "HEAD", "OPTIONS")
+            or STICKY_COOKIE in request.COOKIES
+        )
+        state = request._db_state = _RequestState(use_primary)
+        request._db_state_stack = ExitStack()
+        request._db_state_stack.enter_context(
+            connections[DEFAULT_DB_ALIAS].execute_wrapper(state.watch_writes)
+        )
+        _request_state.set(state)
+
+    def process_response(self, request, response):
+        state = getattr(request, "_db_state", None)
+        if state is None:
+            return response
+
+        _request_state.set(None)
+        request._db_state_stack.close()
+
+        if state.wrote:
+            response.set_cookie(
+                STICKY_COOKIE,
+                "1",
+                max_age=settings.REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
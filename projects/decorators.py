@@ -1,13 +1,16 @@
 from django.contrib import messages
 from django.shortcuts import redirect, get_object_or_404
 
-from projects.models import ProjectMembership, ProjectApplication, Project
+from projects.models import ProjectApplication
+from projects.service.access import get_project_access
+from projects.service.membership_cache import get_cached_membership
 
 
 def validate_permissions_application_review(func):
     def wrapper(request, *args, **kwargs):
         user = request.user
-        project = get_object_or_404(Project, pk=kwargs["project_pk"])
+        access = get_project_access(request, kwargs["project_pk"])
+        project = access.project
 
         if user.is_anonymous:
             messages.warning(
@@ -15,14 +18,7 @@ def validate_permissions_application_review(func):
             )
             return redirect("projects:applications_list", project.pk)
 
-        membership_opj = ProjectMembership.objects.filter(
-            user=user, project=project
-        ).first()
-
-        has_permission = membership_opj.has_permission(
-            "manage_open_roles_perm"
-        )
-        if not has_permission:
+        if not access.has_permission("manage_open_roles_perm"):
             messages.warning(
                 request,
                 "You do not have permission to review this application.",
@@ -37,11 +33,15 @@ def validate_permissions_application_review(func):
 
 def validate_application_status(func):
     def wrapper(request, *args, **kwargs):
-        application_pk = kwargs.get("application_pk")
-        application = get_object_or_404(ProjectApplication, pk=application_pk)
-        project = application.project
+        application = get_object_or_404(
+            ProjectApplication.objects.select_related("user", "role"),
+            pk=kwargs.get("application_pk"),
+            project_id=kwargs["project_pk"],
+        )
+        project = get_project_access(request, kwargs["project_pk"]).project
+        application.project = project
 
-        if application.status in ["approved", "rejected"]:
+        if application.status in ["accepted", "rejected"]:
             messages.warning(
                 request, "This application has already been processed."
             )
@@ -55,15 +55,11 @@ def validate_application_status(func):
 
 def validate_is_member(func):
     def wrapper(request, *args, **kwargs):
-        print("Validating is member...")
         application = kwargs["application"]
         project = application.project
 
-        if (
-            ProjectMembership.objects.filter(
-                project=project, user=application.user
-            ).exists()
-            or project.owner == application.user
+        if project.owner_id == application.user_id or get_cached_membership(
+            application.user_id, project.pk
         ):
             messages.warning(
                 request,
@@ -66,6 +66,37 @@ class TaskForm(forms.ModelForm):
         )
 
 
+class TaskImportForm(forms.Form):
+    file = forms.FileField(
+        widget=forms.ClearableFileInput(
+            attrs={"class": "form-control", "accept": ".csv,.jsonl"}
+        ),
+    )
+    format = forms.ChoiceField(
+        choices=[
+            ("", "Detect from file name"),
+            ("csv", "CSV"),
+            ("jsonl", "JSON Lines"),
+        ],
+        required=False,
+        widget=forms.Select(attrs={"class": "form-control"}),
+    )
+
+    def clean(self):
+        cleaned_data = super().clean()
+        upload = cleaned_data.get("file")
+
+        if upload and not cleaned_data.get("format"):
+            extension = upload.name.rsplit(".", 1)[-1].lower()
+            if extension not in ("csv", "jsonl"):
+                raise forms.ValidationError(
+                    "Choose a format for files not ending in .csv or .jsonl."
+                )
+            cleaned_data["format"] = extension
+
+        return cleaned_data
+
+
 class TaskSearchForm(forms.Form):
     title = forms.CharField(
         max_length=255,
@@ -111,7 +142,7 @@ class ProjectSearchForm(forms.Form):
         widget=forms.TextInput(
             attrs={
                 "class": "form-control",
-                "placeholder": "Project Name",
+                "placeholder": "Search projects",
             }
         ),
     )
@@ -353,9 +384,7 @@ class ProjectMembershipForm(forms.ModelForm):
         self.fields["user"].disabled = True
         self.fields["user"].required = False
         if self.project:
-            self.fields["user"].queryset = Project.objects.get(
-                id=self.project.id
-            ).members.all()
+            self.fields["user"].queryset = self.project.members.all()
 
     def clean(self):
         cleaned_data = super().clean()
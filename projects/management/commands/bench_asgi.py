@@ -0,0 +1,91 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.service.interface_bench import (
+    INTERFACES,
+    run_interface_benchmark,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay the same logged-in read requests (project list, search, "
+        "project detail, leaderboard, profiles) against the WSGI and the "
+        "ASGI handler in-process and compare throughput and p50/p95/p99 "
+        "latency. The WSGI side is served by worker threads (as many as "
+        "--concurrency unless --wsgi-threads is given), the ASGI side by "
+        "one event loop."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=20,
+            help="Clients with a request in flight at any time.",
+        )
+        parser.add_argument(
+            "--wsgi-threads",
+            type=int,
+            help="Threads of the simulated WSGI worker; defaults to "
+            "--concurrency.",
+        )
+        parser.add_argument(
+            "--db-latency",
+            type=float,
+            default=0,
+            help="Milliseconds added to every query to simulate a remote "
+            "database.",
+        )
+        parser.add_argument(
+            "--sample-size",
+            type=int,
+            default=1000,
+            help="Rows sampled per table to pick request targets from.",
+        )
+        parser.add_argument("--seed", type=int)
+        parser.add_argument("--host", default="localhost")
+        parser.add_argument("--output", help="Write the JSON results here.")
+
+    def handle(self, *args, **options):
+        """Entrypoint for command"""
+        try:
+            results = run_interface_benchmark(
+                requests=options["requests"],
+                concurrency=options["concurrency"],
+                wsgi_threads=options["wsgi_threads"],
+                db_latency=options["db_latency"] / 1000,
+                sample_size=options["sample_size"],
+                seed=options["seed"],
+                host=options["host"],
+            )
+        except ValueError as error:
+            raise CommandError(error)
+
+        self.stdout.write(
+            f"{'interface':<10} {'reqs':>6} {'err':>4} {'rps':>8} "
+            f"{'p50':>8} {'p95':>8} {'p99':>8}"
+        )
+        for interface in INTERFACES:
+            row = results[interface]
+            self.stdout.write(
+                f"{interface:<10} {row['requests']:>6} {row['errors']:>4} "
+                f"{row['throughput_rps']:>8} {row['p50_ms']:>8} "
+                f"{row['p95_ms']:>8} {row['p99_ms']:>8}"
+            )
+
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                json.dump(results, output, indent=2)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"ASGI served {results['speedup']['throughput']}x the WSGI "
+                f"throughput; p95 {results['asgi']['p95_ms']} ms vs "
+                f"{results['wsgi']['p95_ms']} ms at concurrency "
+                f"{results['concurrency']} with {results['wsgi_threads']} "
+                f"WSGI thread(s)."
+            )
+        )
@@ -0,0 +1,85 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.models import Project
+from projects.service.task_import import (
+    IMPORT_CHUNK_SIZE,
+    IMPORT_FORMATS,
+    import_tasks,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Import tasks into a project from a CSV or JSON Lines file shaped "
+        "like the task export. Invalid rows are reported and skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("project_id", type=int)
+        parser.add_argument("path")
+        parser.add_argument(
+            "--format",
+            choices=IMPORT_FORMATS,
+            help="Defaults to the file extension.",
+        )
+        parser.add_argument(
+            "--created-by",
+            help="Username recorded as the tasks' creator. Defaults to the "
+            "project owner.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=IMPORT_CHUNK_SIZE,
+            help="Rows inserted per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        """Entrypoint for command"""
+        project = (
+            Project.objects.select_related("owner")
+            .filter(pk=options["project_id"])
+            .first()
+        )
+        if project is None:
+            raise CommandError(f"Project {options['project_id']} not found.")
+
+        created_by = project.owner
+        if options["created_by"]:
+            created_by = (
+                get_user_model()
+                .objects.filter(username=options["created_by"])
+                .first()
+            )
+            if created_by is None:
+                raise CommandError(
+                    f"Developer {options['created_by']} not found."
+                )
+
+        import_format = options["format"] or (
+            options["path"].rsplit(".", 1)[-1].lower()
+        )
+        if import_format not in IMPORT_FORMATS:
+            raise CommandError(
+                "Pass --format for files not ending in .csv or .jsonl."
+            )
+
+        with open(options["path"], "rb") as stream:
+            result = import_tasks(
+                project,
+                created_by,
+                stream,
+                import_format,
+                chunk_size=options["chunk_size"],
+            )
+
+        for line, message in result.errors + result.warnings:
+            self.stderr.write(f"Line {line}: {message}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {result.created} task(s) into {project.name}; "
+                f"{len(result.errors)} row(s) skipped."
+            )
+        )
@@ -0,0 +1,99 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.service.load_test import DEFAULT_MIX, run_load_test
+
+
+def parse_mix(value):
+    mix = {}
+    for part in value.split(","):
+        flow, _, weight = part.partition("=")
+        if flow not in DEFAULT_MIX or not weight.isdigit():
+            raise CommandError(
+                f"Invalid mix entry {part!r}; expected flow=weight with "
+                f"flow in {', '.join(DEFAULT_MIX)}."
+            )
+        mix[flow] = int(weight)
+    return mix
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive the WSGI application in-process with concurrent simulated "
+        "developers replaying browse, search, detail, task-edit, apply and "
+        "rate flows, then report throughput, p50/p95/p99 latency and "
+        "queries per request for each view. The flows write data, so run "
+        "it against a disposable database filled by seed_scale."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=10)
+        parser.add_argument(
+            "--duration",
+            type=float,
+            default=30,
+            help="Seconds to run; ignored when --iterations is given.",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            help="Flows per simulated user instead of a fixed duration.",
+        )
+        parser.add_argument(
+            "--mix",
+            type=parse_mix,
+            default=DEFAULT_MIX,
+            help="Flow weights, e.g. browse=30,search=20,detail=25,"
+            "task_edit=10,apply=10,rate=5.",
+        )
+        parser.add_argument(
+            "--sample-size",
+            type=int,
+            default=1000,
+            help="Rows sampled per table to pick request targets from.",
+        )
+        parser.add_argument("--seed", type=int)
+        parser.add_argument("--host", default="localhost")
+        parser.add_argument("--output", help="Write the JSON results here.")
+
+    def handle(self, *args, **options):
+        """Entrypoint for command"""
+        try:
+            results = run_load_test(
+                users=options["users"],
+                mix=options["mix"],
+                duration=(
+                    None if options["iterations"] else options["duration"]
+                ),
+                iterations=options["iterations"],
+                sample_size=options["sample_size"],
+                seed=options["seed"],
+                host=options["host"],
+            )
+        except ValueError as error:
+            raise CommandError(error)
+
+        self.stdout.write(
+            f"{'view':<40} {'reqs':>6} {'err':>4} {'rps':>8} "
+            f"{'p50':>8} {'p95':>8} {'p99':>8} {'queries':>8}"
+        )
+        for view, route in results["routes"].items():
+            self.stdout.write(
+                f"{view:<40} {route['requests']:>6} {route['errors']:>4} "
+                f"{route['throughput_rps']:>8} {route['p50_ms']:>8} "
+                f"{route['p95_ms']:>8} {route['p99_ms']:>8} "
+                f"{route['queries_per_request']:>8}"
+            )
+
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                json.dump(results, output, indent=2)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{results['requests']} requests in {results['duration_s']}s "
+                f"({results['throughput_rps']} req/s, "
+                f"{results['errors']} errors)."
+            )
+        )
@@ -0,0 +1,78 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from projects.models import Project
+from projects.service.counters import COUNTER_FIELDS, actual_counters
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount every project's members, tasks by status, pending "
+        "applications and open roles, report projects whose stored counters "
+        "drifted and fix them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report drift, do not write anything.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        """Entrypoint for command"""
+        projects = (
+            Project.objects.annotate(**actual_counters())
+            .order_by("pk")
+            .iterator(chunk_size=options["batch_size"])
+        )
+
+        drifted = []
+        for project in projects:
+            changes = []
+
+            for field in COUNTER_FIELDS:
+                expected = getattr(project, f"actual_{field}")
+                if getattr(project, field) != expected:
+                    changes.append(
+                        f"{field} {getattr(project, field)} -> {expected}"
+                    )
+                    setattr(project, field, expected)
+
+            open_to_candidates = project.open_roles_count > 0
+            if project.open_to_candidates != open_to_candidates:
+                changes.append(
+                    f"open_to_candidates {project.open_to_candidates} -> "
+                    f"{open_to_candidates}"
+                )
+                project.open_to_candidates = open_to_candidates
+
+            if changes:
+                drifted.append(project)
+                self.stdout.write(
+                    f"Drift in project {project.pk} ({project.name}): "
+                    + ", ".join(changes)
+                )
+
+        if drifted and not options["dry_run"]:
+            now = timezone.now()
+            for project in drifted:
+                project.updated_at = now
+
+            # Recounting and writing back is not atomic with concurrent
+            # writes; a counter changed in between shows up on the next run.
+            with transaction.atomic():
+                Project.objects.bulk_update(
+                    drifted,
+                    COUNTER_FIELDS + ["open_to_candidates", "updated_at"],
+                    batch_size=options["batch_size"],
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(drifted)} project(s) drifted"
+                + (" (dry run)." if options["dry_run"] else ", fixed.")
+            )
+        )
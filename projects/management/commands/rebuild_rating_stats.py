@@ -0,0 +1,97 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from projects.models import (
+    RATING_SCALE,
+    RATING_STATS_FIELDS,
+    Project,
+    ProjectMembership,
+)
+from users.service.leaderboard import refresh_developers
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute every project's rating count, sum and histogram from "
+        "ProjectRating rows and report projects whose stored values drifted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report drift, do not write anything.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        """Entrypoint for command"""
+        actual = {
+            "actual_count": Count("ratings"),
+            "actual_sum": Sum("ratings__score", default=0),
+        }
+        for star in RATING_SCALE:
+            actual[f"actual_{star}"] = Count(
+                "ratings", filter=Q(ratings__score=star)
+            )
+
+        projects = (
+            Project.objects.annotate(**actual)
+            .order_by("pk")
+            .iterator(chunk_size=options["batch_size"])
+        )
+
+        drifted = []
+        for project in projects:
+            changed = False
+
+            for field in RATING_STATS_FIELDS:
+                expected = getattr(project, field.replace("ratings", "actual"))
+                if getattr(project, field) != expected:
+                    setattr(project, field, expected)
+                    changed = True
+
+            score = (
+                round(project.ratings_sum / project.ratings_count, 2)
+                if project.ratings_count
+                else 0
+            )
+            if project.score != score:
+                project.score = score
+                changed = True
+
+            if changed:
+                drifted.append(project)
+                self.stdout.write(
+                    f"Drift in project {project.pk} ({project.name})"
+                )
+
+        if drifted and not options["dry_run"]:
+            now = timezone.now()
+            for project in drifted:
+                project.updated_at = now
+
+            with transaction.atomic():
+                Project.objects.bulk_update(
+                    drifted,
+                    RATING_STATS_FIELDS + ["score", "updated_at"],
+                    batch_size=options["batch_size"],
+                )
+
+            member_ids = set(
+                ProjectMembership.objects.filter(
+                    project__in=drifted
+                ).values_list("user_id", flat=True)
+            )
+            get_user_model().objects.update_avg_project_scores(member_ids)
+            refresh_developers(member_ids)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(drifted)} project(s) drifted"
+                + (" (dry run)." if options["dry_run"] else ", fixed.")
+            )
+        )
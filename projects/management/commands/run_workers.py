@@ -0,0 +1,118 @@
+import multiprocessing
+import signal
+import threading
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from projects.service.jobs import Worker
+
+
+def _stop_on_signals(stop):
+    """Set ``stop`` on SIGTERM/SIGINT; return the handlers replaced."""
+
+    def handler(signum, frame):
+        stop.set()
+
+    return {
+        signum: signal.signal(signum, handler)
+        for signum in (signal.SIGTERM, signal.SIGINT)
+    }
+
+
+def run_worker_process(threads, poll_interval, burst):
+    """Run ``threads`` workers in this process until told to stop."""
+    stop = threading.Event()
+    previous = _stop_on_signals(stop)
+    try:
+        _run_workers(stop, threads, poll_interval, burst)
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+
+
+def _run_workers(stop, threads, poll_interval, burst):
+    if threads == 1:
+        Worker(stop, poll_interval).run(burst)
+        return
+
+    pool = [
+        threading.Thread(
+            target=lambda: Worker(stop, poll_interval).run(burst),
+            name=f"job-worker-{index}",
+        )
+        for index in range(threads)
+    ]
+    for thread in pool:
+        thread.start()
+    # Joining with a timeout keeps the main thread able to take signals.
+    while any(thread.is_alive() for thread in pool):
+        for thread in pool:
+            thread.join(timeout=0.5)
+
+
+class Command(BaseCommand):
+    help = (
+        "Run background jobs from the database queue. Starts --processes "
+        "worker processes with --threads workers each; SIGTERM or Ctrl+C "
+        "lets every worker finish its current job before exiting."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--processes", type=int, default=1)
+        parser.add_argument("--threads", type=int, default=1)
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds an idle worker waits before looking again.",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Exit once no job is ready instead of waiting for more.",
+        )
+
+    def handle(self, *args, **options):
+        """Entrypoint for command"""
+        processes, threads = options["processes"], options["threads"]
+        if processes < 1 or threads < 1:
+            raise CommandError("--processes and --threads must be at least 1.")
+
+        worker_args = (threads, options["poll_interval"], options["burst"])
+        self.stdout.write(
+            f"Starting {processes} process(es) x {threads} thread(s)."
+        )
+
+        if processes == 1:
+            run_worker_process(*worker_args)
+        else:
+            self.run_processes(processes, worker_args)
+
+        self.stdout.write(self.style.SUCCESS("Workers stopped."))
+
+    def run_processes(self, processes, worker_args):
+        # Forked children must not share the parent's database connections.
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+        children = [
+            context.Process(
+                target=run_worker_process,
+                args=worker_args,
+                name=f"job-worker-process-{index}",
+            )
+            for index in range(processes)
+        ]
+        for child in children:
+            child.start()
+
+        def stop_children(signum, frame):
+            for child in children:
+                if child.is_alive():
+                    child.terminate()
+
+        signal.signal(signal.SIGTERM, stop_children)
+        signal.signal(signal.SIGINT, stop_children)
+
+        for child in children:
+            child.join()
@@ -0,0 +1,400 @@
+import random
+import time
+from collections import Counter, defaultdict
+from itertools import accumulate
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from projects.models import (
+    Project,
+    ProjectApplication,
+    ProjectMembership,
+    ProjectOpenRole,
+    ProjectRating,
+    Tag,
+    Task,
+)
+from projects.service.bulk_load import load_rows, next_pk, reset_sequences
+from projects.service.counters import TASK_STATUS_COUNTERS
+from projects.service.membership_cache import PROJECT_PERMISSIONS
+from projects.service.search import rebuild_index
+from users.service.leaderboard import rebuild_leaderboard
+
+ADJECTIVES = [
+    "Agile",
+    "Bright",
+    "Clever",
+    "Distributed",
+    "Open",
+    "Rapid",
+    "Secure",
+    "Smart",
+    "Green",
+    "Quantum",
+]
+NOUNS = [
+    "Tracker",
+    "Marketplace",
+    "Planner",
+    "Platform",
+    "Assistant",
+    "Dashboard",
+    "Wallet",
+    "Portal",
+    "Engine",
+    "Hub",
+]
+TAG_NAMES = [
+    "backend",
+    "frontend",
+    "api",
+    "database",
+    "devops",
+    "design",
+    "qa",
+    "docs",
+    "security",
+    "performance",
+]
+
+
+def _weighted(weights):
+    return list(weights), list(accumulate(weights.values()))
+
+
+STAGES = _weighted(
+    {
+        "initiation": 3,
+        "planning": 3,
+        "design": 2,
+        "implementation": 5,
+        "testing": 2,
+        "deployed": 4,
+    }
+)
+SCORES = _weighted({1: 1, 2: 1, 3: 2, 4: 4, 5: 5})
+TASK_STATUSES = _weighted({"todo": 5, "in_progress": 3, "done": 4})
+APPLICATION_STATUSES = _weighted({"pending": 5, "accepted": 1, "rejected": 2})
+
+
+class _Writer:
+    """Buffer unsaved rows per model and load them in batches."""
+
+    def __init__(self, batch_size):
+        self.batch_size = batch_size
+        self.pending = defaultdict(list)
+        self.counts = Counter()
+
+    def add(self, obj):
+        rows = self.pending[type(obj)]
+        rows.append(obj)
+        if len(rows) >= self.batch_size:
+            self.flush(type(obj))
+
+    def flush(self, model=None):
+        for model in [model] if model else list(self.pending):
+            self.counts[model] += load_rows(
+                model, self.pending.pop(model, []), self.batch_size
+            )
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a large synthetic dataset for load testing: developers, "
+        "projects with power-law team sizes, a long tail of tasks, open "
+        "roles, applications and ratings. Rows are bulk loaded (COPY on "
+        "Postgres) without model side effects; counters, the search index "
+        "and the leaderboard are rebuilt at the end. Every generated "
+        "developer can log in with the password 'password'."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--developers", type=int, default=1000)
+        parser.add_argument("--projects", type=int, default=200)
+        parser.add_argument("--tasks", type=int, default=10000)
+        parser.add_argument("--max-team-size", type=int, default=50)
+        parser.add_argument(
+            "--alpha",
+            type=float,
+            default=1.5,
+            help="Pareto shape of team sizes and task counts; "
+            "lower values give a heavier tail.",
+        )
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--seed", type=int, help="Random seed for repeatable datasets."
+        )
+
+    def handle(self, *args, **options):
+        """Entrypoint for command"""
+        if options["developers"] < 1:
+            raise CommandError("--developers must be at least 1.")
+
+        self.random = random.Random(options["seed"])
+        self.alpha = options["alpha"]
+        self.max_team_size = options["max_team_size"]
+        self.writer = _Writer(options["batch_size"])
+
+        started = time.monotonic()
+        developer_model = get_user_model()
+        models = [
+            developer_model,
+            Tag,
+            Project,
+            ProjectMembership,
+            ProjectOpenRole,
+            ProjectApplication,
+            ProjectRating,
+            Task,
+            Task.tags.through,
+        ]
+        self.ids = {model: next_pk(model) for model in models}
+
+        with transaction.atomic():
+            first_developer = self.ids[developer_model]
+            self.developer_ids = self.seed_developers(options["developers"])
+            self.tag_ids = self.seed_tags()
+            self.seed_projects(options["projects"], options["tasks"])
+            self.writer.flush()
+
+            reset_sequences(*models)
+
+            developer_model.objects.update_avg_project_scores(
+                developer_model.objects.filter(pk__gte=first_developer).values(
+                    "pk"
+                )
+            )
+
+        rebuild_index()
+        rebuild_leaderboard(batch_size=options["batch_size"])
+
+        for model, count in self.writer.counts.items():
+            self.stdout.write(f"{model._meta.label}: {count}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {sum(self.writer.counts.values())} rows in "
+                f"{time.monotonic() - started:.1f}s."
+            )
+        )
+
+    def next_id(self, model):
+        pk = self.ids[model]
+        self.ids[model] += 1
+        return pk
+
+    def pareto(self, limit):
+        return min(limit, int(self.random.paretovariate(self.alpha)))
+
+    def weighted(self, choices, k=None):
+        population, cum_weights = choices
+        picked = self.random.choices(
+            population, cum_weights=cum_weights, k=k or 1
+        )
+        return picked if k is not None else picked[0]
+
+    def pick_developers(self, count, exclude=()):
+        """Return ``count`` distinct developer ids not in ``exclude``."""
+        count = min(count, len(self.developer_ids) - len(exclude))
+        picked = set()
+        while len(picked) < count:
+            developer_id = self.random.choice(self.developer_ids)
+            if developer_id not in exclude:
+                picked.add(developer_id)
+        return list(picked)
+
+    def seed_developers(self, count):
+        developer_model = get_user_model()
+        password = make_password("password")
+        positions = [value for value, _ in developer_model.POSITION_CHOICES]
+
+        for _ in range(count):
+            pk = self.next_id(developer_model)
+            self.writer.add(
+                developer_model(
+                    id=pk,
+                    username=f"seed{pk}",
+                    email=f"seed{pk}@example.com",
+                    password=password,
+                    position=self.random.choice(positions),
+                )
+            )
+
+        self.writer.flush(developer_model)
+        start = self.ids[developer_model] - count
+        return range(start, start + count)
+
+    def seed_tags(self):
+        tags = dict(
+            Tag.objects.filter(name__in=TAG_NAMES).values_list("name", "id")
+        )
+        for name in TAG_NAMES:
+            if name not in tags:
+                tags[name] = self.next_id(Tag)
+                self.writer.add(Tag(id=tags[name], name=name))
+
+        self.writer.flush(Tag)
+        return list(tags.values())
+
+    def task_counts(self, projects, tasks):
+        """
+        Split ``tasks`` across ``projects`` proportionally to Pareto
+        weights, so a few projects hold most of the tasks.
+        """
+        if not projects:
+            return []
+
+        weights = [
+            self.random.paretovariate(self.alpha) for _ in range(projects)
+        ]
+        total = sum(weights)
+        counts = [int(tasks * weight / total) for weight in weights]
+
+        for index in self.random.choices(
+            range(projects), weights, k=tasks - sum(counts)
+        ):
+            counts[index] += 1
+
+        return counts
+
+    def seed_projects(self, projects, tasks):
+        domains = [value for value, _ in Project.DOMEN_CHOICES]
+        roles = [value for value, _ in ProjectMembership.ROLE_CHOICES]
+
+        for task_count in self.task_counts(projects, tasks):
+            pk = self.next_id(Project)
+            stage = self.weighted(STAGES)
+            owner_id = self.random.choice(self.developer_ids)
+            member_ids = [owner_id] + self.pick_developers(
+                self.pareto(self.max_team_size) - 1, exclude={owner_id}
+            )
+            project = Project(
+                id=pk,
+                name=f"{self.random.choice(ADJECTIVES)} "
+                f"{self.random.choice(NOUNS)} {pk}",
+                description=f"Synthetic project {pk} for load testing.",
+                domain=self.random.choice(domains),
+                development_stage=stage,
+                deploy_url=(
+                    f"https://seed{pk}.example.com"
+                    if stage == "deployed"
+                    else ""
+                ),
+                owner_id=owner_id,
+                member_count=len(member_ids),
+            )
+
+            for member_id in member_ids:
+                self.writer.add(
+                    ProjectMembership(
+                        id=self.next_id(ProjectMembership),
+                        project_id=pk,
+                        user_id=member_id,
+                        role=self.random.choice(roles),
+                        **{
+                            perm: self.random.random() < 0.2
+                            for perm in PROJECT_PERMISSIONS
+                        },
+                    )
+                )
+
+            if stage == "deployed":
+                self.seed_ratings(project, member_ids)
+            else:
+                self.seed_open_roles(project, member_ids)
+
+            self.seed_tasks(project, member_ids, task_count)
+            self.writer.add(project)
+
+    def seed_open_roles(self, project, member_ids):
+        applicants = set()
+
+        for _ in range(self.pareto(10) - 1):
+            role_id = self.next_id(ProjectOpenRole)
+            project.open_to_candidates = True
+            project.open_roles_count += 1
+            self.writer.add(
+                ProjectOpenRole(
+                    id=role_id,
+                    project_id=project.pk,
+                    role_name=self.random.choice(
+                        ProjectMembership.ROLE_CHOICES
+                    )[0],
+                )
+            )
+
+            for user_id in self.pick_developers(
+                self.pareto(100) - 1, exclude=set(member_ids) | applicants
+            ):
+                applicants.add(user_id)
+                status = self.weighted(APPLICATION_STATUSES)
+                if status == "pending":
+                    project.pending_applications_count += 1
+                self.writer.add(
+                    ProjectApplication(
+                        id=self.next_id(ProjectApplication),
+                        project_id=project.pk,
+                        role_id=role_id,
+                        user_id=user_id,
+                        status=status,
+                    )
+                )
+
+    def seed_ratings(self, project, member_ids):
+        raters = self.pick_developers(
+            self.pareto(1000) - 1, exclude=set(member_ids)
+        )
+        scores = self.weighted(SCORES, k=len(raters)) if raters else []
+
+        for user_id, score in zip(raters, scores):
+            self.writer.add(
+                ProjectRating(
+                    id=self.next_id(ProjectRating),
+                    project_id=project.pk,
+                    rated_by_id=user_id,
+                    score=score,
+                )
+            )
+            setattr(
+                project,
+                f"ratings_{score}",
+                getattr(project, f"ratings_{score}") + 1,
+            )
+
+        project.ratings_count = len(scores)
+        project.ratings_sum = sum(scores)
+        if scores:
+            project.score = round(project.ratings_sum / len(scores), 2)
+
+    def seed_tasks(self, project, member_ids, count):
+        assignees = member_ids + [None]
+
+        for _ in range(count):
+            task_id = self.next_id(Task)
+            status = self.weighted(TASK_STATUSES)
+            counter = TASK_STATUS_COUNTERS[status]
+            setattr(project, counter, getattr(project, counter) + 1)
+            self.writer.add(
+                Task(
+                    id=task_id,
+                    project_id=project.pk,
+                    title=f"Task {task_id}",
+                    status=status,
+                    assignee_id=self.random.choice(assignees),
+                    created_by_id=self.random.choice(member_ids),
+                )
+            )
+
+            for tag_id in self.random.sample(
+                self.tag_ids, self.random.randint(0, 3)
+            ):
+                self.writer.add(
+                    Task.tags.through(
+                        id=self.next_id(Task.tags.through),
+                        task_id=task_id,
+                        tag_id=tag_id,
+                    )
+                )
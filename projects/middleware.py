@@ -0,0 +1,138 @@
+import random
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from django.utils.deprecation import MiddlewareMixin
+
+from projects.service.metrics import registry
+from projects.service.nplusone import (
+    NPlusOneDetector,
+    NPlusOneError,
+    get_config,
+    logger,
+)
+
+
+def _wrap_connections(wrapper):
+    stack = ExitStack()
+    for alias in connections:
+        stack.enter_context(connections[alias].execute_wrapper(wrapper))
+    return stack
+
+
+class RequestMetricsMiddleware(MiddlewareMixin):
+    """
+    Time every request, the SQL it runs and the template it renders, add a
+    ``Server-Timing`` header and feed the per-view histograms served at
+    ``/metrics``. Keep it first in ``MIDDLEWARE`` so the total covers the
+    whole stack and template rendering happens inside its hooks.
+
+    Template time is only measured for ``TemplateResponse`` objects, which
+    is what the class-based views return. Under ASGI ``MiddlewareMixin``
+    runs the request and response hooks in the request's thread-sensitive
+    thread, which is the thread whose connection the async ORM uses, so
+    the query wrappers see the queries of async views as well.
+    """
+
+    def process_request(self, request):
+        if not getattr(settings, "METRICS_ENABLED", True):
+            return
+
+        request._metrics = {"queries": 0, "db": 0.0, "template": None}
+        request._metrics_view = "unresolved"
+
+        def record_query(execute, sql, params, many, context):
+            started = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                request._metrics["db"] += time.perf_counter() - started
+                request._metrics["queries"] += 1
+
+        request._metrics_stack = _wrap_connections(record_query)
+        request._metrics_started = time.perf_counter()
+
+    def process_response(self, request, response):
+        if not hasattr(request, "_metrics"):
+            return response
+
+        request._metrics_stack.close()
+        total = time.perf_counter() - request._metrics_started
+
+        metrics = request._metrics
+        size = None if response.streaming else len(response.content)
+
+        registry.observe(
+            request._metrics_view,
+            request_duration_seconds=total,
+            db_duration_seconds=metrics["db"],
+            db_queries=metrics["queries"],
+            template_duration_seconds=metrics["template"],
+            response_size_bytes=size,
+        )
+
+        timings = [
+            f"total;dur={total * 1000:.1f}",
+            f'db;dur={metrics["db"] * 1000:.1f};'
+            f'desc="{metrics["queries"]} queries"',
+        ]
+        if metrics["template"] is not None:
+            timings.append(f'tpl;dur={metrics["template"] * 1000:.1f}')
+        response["Server-Timing"] = ", ".join(timings)
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view = getattr(view_func, "view_class", view_func)
+        request._metrics_view = getattr(view, "__name__", "unknown")
+
+    def process_template_response(self, request, response):
+        if not hasattr(request, "_metrics"):
+            return response
+
+        started = time.perf_counter()
+
+        def rendered(response):
+            request._metrics["template"] = time.perf_counter() - started
+
+        response.add_post_render_callback(rendered)
+        return response
+
+
+class NPlusOneMiddleware(MiddlewareMixin):
+    """
+    Run a sample of requests under ``NPlusOneDetector`` and surface the
+    repeated query groups according to ``settings.NPLUSONE["MODE"]``:
+    ``log`` writes a warning, ``header`` adds an ``X-NPlusOne`` header and
+    ``raise`` fails the request with ``NPlusOneError``.
+    """
+
+    def process_request(self, request):
+        config = get_config()
+        if config["MODE"] == "off" or random.random() >= config["SAMPLE_RATE"]:
+            return
+
+        request._nplusone = NPlusOneDetector(config["THRESHOLD"])
+        request._nplusone.start()
+
+    def process_response(self, request, response):
+        detector = getattr(request, "_nplusone", None)
+        if detector is None:
+            return response
+
+        detector.stop()
+        if not detector.problems:
+            return response
+
+        mode = get_config()["MODE"]
+        report = detector.report()
+        if mode == "raise":
+            raise NPlusOneError(f"N+1 queries in {request.path}:\n{report}")
+        if mode == "header":
+            response["X-NPlusOne"] = " | ".join(report.splitlines())[:4000]
+        else:
+            logger.warning("N+1 queries in %s:\n%s", request.path, report)
+
+        return response
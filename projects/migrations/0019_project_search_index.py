@@ -0,0 +1,62 @@
+from django.db import migrations
+
+POSTGRES_FORWARDS = [
+    """
+    ALTER TABLE projects_project ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(name, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX projects_project_search_vector_idx "
+    "ON projects_project USING gin (search_vector)",
+]
+
+POSTGRES_BACKWARDS = [
+    "DROP INDEX IF EXISTS projects_project_search_vector_idx",
+    "ALTER TABLE projects_project DROP COLUMN IF EXISTS search_vector",
+]
+
+SQLITE_FORWARDS = [
+    "CREATE VIRTUAL TABLE projects_project_fts "
+    "USING fts5(name, description, tokenize='porter unicode61')",
+    "INSERT INTO projects_project_fts (rowid, name, description) "
+    "SELECT id, name, description FROM projects_project",
+]
+
+SQLITE_BACKWARDS = [
+    "DROP TABLE IF EXISTS projects_project_fts",
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        vendor = schema_editor.connection.vendor
+        for statement in statements_by_vendor.get(vendor, []):
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0018_alter_project_uid"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run(
+                {
+                    "postgresql": POSTGRES_FORWARDS,
+                    "sqlite": SQLITE_FORWARDS,
+                }
+            ),
+            _run(
+                {
+                    "postgresql": POSTGRES_BACKWARDS,
+                    "sqlite": SQLITE_BACKWARDS,
+                }
+            ),
+        ),
+    ]
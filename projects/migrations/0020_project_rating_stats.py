@@ -0,0 +1,85 @@
+# Generated by Django 5.2.7 on 2026-10-17 19:51
+
+import django.core.validators
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def backfill_rating_stats(apps, schema_editor):
+    Project = apps.get_model("projects", "Project")
+
+    stats = {
+        "count": Count("ratings"),
+        "total": Sum("ratings__score", default=0),
+    }
+    for star in range(1, 6):
+        stats[f"star_{star}"] = Count("ratings", filter=Q(ratings__score=star))
+
+    projects = Project.objects.annotate(**stats).filter(count__gt=0)
+    for project in projects:
+        project.ratings_count = project.count
+        project.ratings_sum = project.total
+        for star in range(1, 6):
+            setattr(
+                project, f"ratings_{star}", getattr(project, f"star_{star}")
+            )
+        project.save(
+            update_fields=["ratings_count", "ratings_sum"]
+            + [f"ratings_{star}" for star in range(1, 6)]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0019_project_search_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="ratings_1",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="ratings_2",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="ratings_3",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="ratings_4",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="ratings_5",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="ratings_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="ratings_sum",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name="projectrating",
+            name="score",
+            field=models.IntegerField(
+                validators=[
+                    django.core.validators.MinValueValidator(1),
+                    django.core.validators.MaxValueValidator(5),
+                ]
+            ),
+        ),
+        migrations.RunPython(backfill_rating_stats, migrations.RunPython.noop),
+    ]
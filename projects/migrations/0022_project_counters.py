@@ -0,0 +1,91 @@
+# Generated by Django 5.2.7 on 2026-10-17 21:04
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+COUNTERS = {
+    "member_count": ("ProjectMembership", {}),
+    "todo_count": ("Task", {"status": "todo"}),
+    "in_progress_count": ("Task", {"status": "in_progress"}),
+    "done_count": ("Task", {"status": "done"}),
+    "pending_applications_count": (
+        "ProjectApplication",
+        {"status": "pending"},
+    ),
+    "open_roles_count": ("ProjectOpenRole", {}),
+}
+
+
+def backfill_counters(apps, schema_editor):
+    Project = apps.get_model("projects", "Project")
+
+    counts = {}
+    for field, (model_name, filters) in COUNTERS.items():
+        model = apps.get_model("projects", model_name)
+        counts[f"actual_{field}"] = Coalesce(
+            Subquery(
+                model.objects.filter(project=OuterRef("pk"), **filters)
+                .order_by()
+                .values("project")
+                .annotate(total=Count("pk"))
+                .values("total"),
+                output_field=IntegerField(),
+            ),
+            0,
+        )
+
+    projects = []
+    for project in Project.objects.annotate(**counts).iterator(
+        chunk_size=1000
+    ):
+        for field in COUNTERS:
+            setattr(project, field, getattr(project, f"actual_{field}"))
+        projects.append(project)
+
+        if len(projects) == 1000:
+            Project.objects.bulk_update(projects, list(COUNTERS))
+            projects = []
+
+    Project.objects.bulk_update(projects, list(COUNTERS))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0021_project_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="done_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="in_progress_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="member_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="open_roles_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="pending_applications_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="todo_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
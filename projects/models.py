@@ -1,9 +1,15 @@
 import shortuuid
 
 from team_mate.settings import base
-from django.db import models
-from django.db.models import Avg
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import models, transaction
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast, Coalesce, NullIf, Round
+from django.utils import timezone
+from projects.service.counters import COUNTER_FIELDS
+from projects.service.deferred import defer_once
 from projects.service.managers import ProjectManager
+from projects.service.search import index_project
 
 user_model = base.AUTH_USER_MODEL
 
@@ -17,7 +23,9 @@ class ProjectRating(models.Model):
         on_delete=models.CASCADE,
         related_name="given_project_ratings",
     )
-    score = models.IntegerField()
+    score = models.IntegerField(
+        validators=[MinValueValidator(1), MaxValueValidator(5)]
+    )
     comment = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -34,6 +42,13 @@ class ProjectRating(models.Model):
         super().save(*args, **kwargs)
 
 
+RATING_SCALE = range(1, 6)
+
+RATING_STATS_FIELDS = ["ratings_count", "ratings_sum"] + [
+    f"ratings_{star}" for star in RATING_SCALE
+]
+
+
 def generate_shortuuid():
     return shortuuid.uuid()
 
@@ -81,8 +96,27 @@ class Project(models.Model):
         max_length=22, unique=True, default=generate_shortuuid, editable=False
     )
     score = models.FloatField(default=0)
+    ratings_count = models.PositiveIntegerField(default=0)
+    ratings_sum = models.PositiveIntegerField(default=0)
+    ratings_1 = models.PositiveIntegerField(default=0)
+    ratings_2 = models.PositiveIntegerField(default=0)
+    ratings_3 = models.PositiveIntegerField(default=0)
+    ratings_4 = models.PositiveIntegerField(default=0)
+    ratings_5 = models.PositiveIntegerField(default=0)
+    # Kept in step with the related rows by the signals in
+    # projects/signals.py; rebuild_project_counters repairs any drift.
+    member_count = models.PositiveIntegerField(default=0)
+    todo_count = models.PositiveIntegerField(default=0)
+    in_progress_count = models.PositiveIntegerField(default=0)
+    done_count = models.PositiveIntegerField(default=0)
+    pending_applications_count = models.PositiveIntegerField(default=0)
+    open_roles_count = models.PositiveIntegerField(default=0)
     project_url = models.CharField(max_length=255, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Bumped whenever the project or its tasks, memberships, open roles or
+    # ratings change; the detail pages use it as their conditional GET
+    # validator.
+    updated_at = models.DateTimeField(auto_now=True)
 
     members = models.ManyToManyField(
         user_model, through="ProjectMembership", related_name="projects"
@@ -90,26 +124,100 @@ class Project(models.Model):
 
     objects = ProjectManager()
 
-    def update_open_to_candidates(self):
-        has_roles = self.open_roles.exists()
-
-        if self.open_to_candidates != has_roles:
-            self.open_to_candidates = has_roles
+    @property
+    def task_count(self):
+        return self.todo_count + self.in_progress_count + self.done_count
+
+    @property
+    def progress(self):
+        """Share of the project's tasks that are done, in percent."""
+        if not self.task_count:
+            return 0
+        return round(self.done_count * 100 / self.task_count)
+
+    @property
+    def has_ratings(self):
+        return self.ratings_count > 0
+
+    @property
+    def rating_histogram(self):
+        return [
+            {
+                "stars": star,
+                "count": getattr(self, f"ratings_{star}"),
+                "percent": (
+                    round(
+                        getattr(self, f"ratings_{star}")
+                        * 100
+                        / self.ratings_count
+                    )
+                    if self.ratings_count
+                    else 0
+                ),
+            }
+            for star in reversed(RATING_SCALE)
+        ]
+
+    def _apply_rating(self, score, step):
+        count = F("ratings_count") + step
+        total = F("ratings_sum") + score * step
+        avg = Cast(
+            Cast(total, FloatField()) / NullIf(count, 0),
+            models.DecimalField(max_digits=5, decimal_places=2),
+        )
+        updates = {
+            "ratings_count": count,
+            "ratings_sum": total,
+            "score": Coalesce(Round(avg, 2), 0, output_field=FloatField()),
+            "updated_at": timezone.now(),
+        }
+        if score in RATING_SCALE:
+            updates[f"ratings_{score}"] = F(f"ratings_{score}") + step
+
+        Project.objects.filter(pk=self.pk).update(**updates)
+        self.refresh_from_db(
+            fields=RATING_STATS_FIELDS + ["score", "updated_at"]
+        )
 
-            self.save(update_fields=["open_to_candidates"])
+    def add_rating(self, score):
+        self._apply_rating(score, 1)
 
-        return self.open_to_candidates
+    def remove_rating(self, score):
+        self._apply_rating(score, -1)
 
     def update_avg_score(self):
-        avg = self.ratings.aggregate(avg=Avg("score"))["avg"] or 0
-        self.score = round(avg, 2)
+        self.refresh_from_db(fields=["ratings_count", "ratings_sum"])
+        if self.ratings_count:
+            self.score = round(self.ratings_sum / self.ratings_count, 2)
+        else:
+            self.score = 0
         self.save(update_fields=["score"])
 
     def save(self, *args, **kwargs):
         is_new = self.pk is None
         Project.objects.validate_stage(self)
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "updated_at"}
+        elif not self._state.adding:
+            # The counters and rating stats are only ever changed in SQL;
+            # writing back the values loaded with this instance would undo
+            # concurrent changes.
+            sql_maintained = {*COUNTER_FIELDS, *RATING_STATS_FIELDS, "score"}
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in sql_maintained
+            ]
+
         super().save(*args, **kwargs)
 
+        if update_fields is None or {"name", "description"} & set(
+            update_fields
+        ):
+            index_project(self)
+
         if is_new:
             ProjectMembership.objects.get_or_create(
                 project=self,
@@ -198,6 +306,11 @@ class Task(models.Model):
     )
     tags = models.ManyToManyField(Tag, blank=True)
 
+    def save(self, *args, **kwargs):
+        # The counter signals lock the row to read its previous status.
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
     def __str__(self):
         return self.title
 
@@ -213,7 +326,7 @@ class ProjectOpenRole(models.Model):
     def delete(self, using=None, keep_parents=False):
         super().delete(using=using, keep_parents=keep_parents)
 
-        self.project.update_open_to_candidates()
+        defer_once(Project.objects.sync_open_to_candidates, self.project_id)
 
     def save(self, *args, **kwargs):
         is_new = self.pk is None
@@ -221,7 +334,9 @@ class ProjectOpenRole(models.Model):
         super().save(*args, **kwargs)
 
         if is_new:
-            self.project.update_open_to_candidates()
+            defer_once(
+                Project.objects.sync_open_to_candidates, self.project_id
+            )
 
     def __str__(self):
         return f"{self.project.name} - {self.role_name}"
@@ -247,3 +362,58 @@ class ProjectApplication(models.Model):
         ProjectOpenRole, on_delete=models.CASCADE, related_name="applications"
     )
     created_at = models.DateTimeField(auto_now_add=True)
+
+    def save(self, *args, **kwargs):
+        # The counter signals lock the row to read its previous status.
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+
+class Job(models.Model):
+    """
+    A background job waiting for, or handled by, ``manage.py run_workers``.
+    ``name`` is a handler registered with ``@background_job`` and ``kwargs``
+    its JSON keyword arguments; see ``projects.service.jobs``.
+    """
+
+    STATUS_CHOICES = [
+        ("queued", "Queued"),
+        ("running", "Running"),
+        ("done", "Done"),
+        ("failed", "Failed"),
+    ]
+
+    name = models.CharField(max_length=255)
+    kwargs = models.JSONField(default=dict, blank=True)
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default="queued"
+    )
+    priority = models.SmallIntegerField(default=0)
+    dedup_key = models.CharField(max_length=255, null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=100, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["status", "-priority", "run_at"],
+                name="projects_job_ready_idx",
+            ),
+        ]
+        constraints = [
+            # At most one waiting job per key; enqueue() reuses it.
+            models.UniqueConstraint(
+                fields=["dedup_key"],
+                condition=models.Q(status="queued"),
+                name="projects_job_unique_queued_dedup_key",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.get_status_display()})"
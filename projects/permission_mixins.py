@@ -1,17 +1,18 @@
 from django.contrib import messages
 from django.shortcuts import get_object_or_404, render, redirect
 
-from projects.models import Project, Task, ProjectOpenRole
+from projects.models import Task, ProjectOpenRole
+from projects.service.access import get_project_access
 
 
 class BasePermissionMixin:
     required_permission = None
 
     def is_owner(self):
-        return self.project.owner_id == self.user.id
+        return self.access.is_owner
 
     def is_member(self):
-        return self.project.members.filter(id=self.user.id).exists()
+        return self.access.is_member
 
     def applied_to_project(self):
         return self.project.applications.filter(
@@ -19,32 +20,53 @@ class BasePermissionMixin:
         ).exists()
 
     def is_rated(self):
-        return self.user.given_project_ratings.filter(
-            project=self.project
-        ).exists()
+        return self.access.is_rated
 
     def is_project_deployed(self):
         return self.project.development_stage == "deployed"
 
     def can_edit_task(self):
-        return (
-            self.user == self.task.created_by
-            or self.user == self.task.assignee
+        return self.user.pk in (
+            self.task.created_by_id,
+            self.task.assignee_id,
         )
 
+    def check_access(self, request):
+        """
+        Return a response to short-circuit the request, or ``None`` to let
+        the view run.
+        """
+        return None
+
     def dispatch(self, request, *args, **kwargs):
 
         self.user = request.user
+        project_pk = kwargs.get("project_pk")
 
-        if "project_pk" in kwargs:
-            self.project = get_object_or_404(Project, pk=kwargs["project_pk"])
         if "task_pk" in kwargs:
-            self.task = get_object_or_404(Task, pk=kwargs["task_pk"])
+            tasks = Task.objects.select_related("assignee", "created_by")
+            if project_pk is not None:
+                tasks = tasks.filter(project_id=project_pk)
+
+            self.task = get_object_or_404(tasks, pk=kwargs["task_pk"])
+            project_pk = self.task.project_id
+
+        if project_pk is not None:
+            self.access = get_project_access(request, project_pk)
+            self.project = self.access.project
+
+            if hasattr(self, "task"):
+                self.task.project = self.project
+
         if "role_pk" in kwargs:
             self.role = get_object_or_404(
-                ProjectOpenRole, pk=kwargs["role_pk"]
+                ProjectOpenRole, pk=kwargs["role_pk"], project_id=project_pk
             )
 
+        response = self.check_access(request)
+        if response is not None:
+            return response
+
         return super().dispatch(request, *args, **kwargs)
 
 
@@ -55,22 +77,9 @@ class ProjectPermissionRequiredMixin(BasePermissionMixin):
         if not self.required_permission:
             return True
 
-        if self.is_owner():
-            return True
-
-        has_permission = False
-
-        try:
-            user_obj = self.user.get_member_of(self.project)
-            has_permission = user_obj.has_permission(self.required_permission)
-        except Exception:
-            return has_permission
+        return self.access.has_permission(self.required_permission)
 
-        return has_permission
-
-    def dispatch(self, request, *args, **kwargs):
-
-        response = super().dispatch(request, *args, **kwargs)
+    def check_access(self, request):
 
         if not self.has_required_permission():
             return render(
@@ -83,14 +92,12 @@ class ProjectPermissionRequiredMixin(BasePermissionMixin):
                 },
             )
 
-        return response
+        return None
 
 
 class ProjectRatingPermissionMixin(BasePermissionMixin):
 
-    def dispatch(self, request, *args, **kwargs):
-
-        response = super().dispatch(request, *args, **kwargs)
+    def check_access(self, request):
 
         if self.is_member():
             return render(
@@ -122,7 +129,7 @@ class ProjectRatingPermissionMixin(BasePermissionMixin):
                 },
             )
 
-        return response
+        return None
 
 
 class TaskPermissionRequiredMixin(BasePermissionMixin):
@@ -136,9 +143,7 @@ class TaskPermissionRequiredMixin(BasePermissionMixin):
             return True
 
         if self.required_permission == "view_task" and (
-            self.is_owner()
-            or self.is_member()
-            or self.task.assignee == self.user
+            self.is_member() or self.task.assignee_id == self.user.pk
         ):
             return True
 
@@ -146,9 +151,7 @@ class TaskPermissionRequiredMixin(BasePermissionMixin):
             return True
         return False
 
-    def dispatch(self, request, *args, **kwargs):
-
-        response = super().dispatch(request, *args, **kwargs)
+    def check_access(self, request):
 
         if not self.has_required_permission():
             return render(
@@ -161,14 +164,12 @@ class TaskPermissionRequiredMixin(BasePermissionMixin):
                 },
             )
 
-        return response
+        return None
 
 
 class ApplicationPermissionRequiredMixin(BasePermissionMixin):
 
-    def dispatch(self, request, *args, **kwargs):
-
-        response = super().dispatch(request, *args, **kwargs)
+    def check_access(self, request):
 
         if self.is_member() or self.is_owner():
             messages.warning(request, "You cannot apply your own project.")
@@ -186,14 +187,12 @@ class ApplicationPermissionRequiredMixin(BasePermissionMixin):
                 "projects:project_open_roles_list", self.project.pk
             )
 
-        return response
+        return None
 
 
 class MembershipPermissionRequiredMixin(BasePermissionMixin):
 
-    def dispatch(self, request, *args, **kwargs):
-
-        response = super().dispatch(request, *args, **kwargs)
+    def check_access(self, request):
 
         if not self.is_member():
             return render(
@@ -205,4 +204,4 @@ class MembershipPermissionRequiredMixin(BasePermissionMixin):
                     "project": self.project,
                 },
             )
-        return response
+        return None
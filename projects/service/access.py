@@ -0,0 +1,146 @@
+from asgiref.sync import sync_to_async
+from django.db.models import Exists, OuterRef
+from django.http import Http404
+
+from projects.service.membership_cache import (
+    MEMBERSHIP_FIELDS,
+    PROJECT_PERMISSIONS,
+    get_cached_membership,
+)
+
+
+class ProjectAccess:
+    """
+    Everything a request needs to know about one user's access to one
+    project: the project (with its owner), the user's membership if any,
+    whether they own it and whether they already rated it.
+    """
+
+    def __init__(self, project, user, membership=None, is_rated=False):
+        self.project = project
+        self.user = user
+        self.membership = membership
+        self.is_rated = is_rated
+
+    @property
+    def is_owner(self):
+        return (
+            self.user.is_authenticated
+            and self.project.owner_id == self.user.pk
+        )
+
+    @property
+    def is_member(self):
+        return self.membership is not None
+
+    @property
+    def permissions(self):
+        if self.membership is None:
+            return {}
+        return {
+            perm: getattr(self.membership, perm)
+            for perm in PROJECT_PERMISSIONS
+        }
+
+    def has_permission(self, perm_name):
+        if self.is_owner:
+            return True
+        if self.membership is None:
+            return False
+        return getattr(self.membership, perm_name, False)
+
+    def as_context(self, permissions=PROJECT_PERMISSIONS):
+        user_permissions = {
+            perm: value
+            for perm, value in self.permissions.items()
+            if perm in permissions
+        }
+        return {
+            **user_permissions,
+            "is_owner": self.is_owner,
+            "is_member": self.is_member,
+        }
+
+
+def _project_queryset(project_pk, user):
+    from projects.models import Project, ProjectRating
+
+    qs = Project.objects.select_related("owner").filter(pk=project_pk)
+
+    if user.is_authenticated:
+        qs = qs.annotate(
+            is_rated=Exists(
+                ProjectRating.objects.filter(
+                    project=OuterRef("pk"), rated_by=user.pk
+                )
+            )
+        )
+
+    return qs
+
+
+def _access(project, user):
+    from projects.models import ProjectMembership
+
+    if project is None:
+        raise Http404("No Project matches the given query.")
+
+    if not user.is_authenticated:
+        return ProjectAccess(project, user)
+
+    membership = None
+    entry = get_cached_membership(user.pk, project.pk)
+    if entry is not None:
+        membership = ProjectMembership(
+            project=project,
+            user=user,
+            **{field: entry[field] for field in MEMBERSHIP_FIELDS},
+        )
+
+    return ProjectAccess(project, user, membership, project.is_rated)
+
+
+def _load(project_pk, user):
+    return _access(_project_queryset(project_pk, user).first(), user)
+
+
+def get_project_access(request, project_pk):
+    """
+    Resolve the current user's access to a project with a single query,
+    memoized on the request so mixins, decorators and views share the same
+    answer. The membership itself comes from the per-user membership cache.
+    """
+    cache = request.__dict__.setdefault("_project_access", {})
+    project_pk = int(project_pk)
+
+    if project_pk not in cache:
+        cache[project_pk] = _load(project_pk, request.user)
+
+    return cache[project_pk]
+
+
+async def aget_project_access(request, project_pk):
+    """
+    Async version of ``get_project_access`` for async views. A cold
+    membership cache is filled in a worker thread.
+    """
+    cache = request.__dict__.setdefault("_project_access", {})
+    project_pk = int(project_pk)
+
+    if project_pk not in cache:
+        user = await aget_request_user(request)
+        project = await _project_queryset(project_pk, user).afirst()
+        cache[project_pk] = await sync_to_async(_access)(project, user)
+
+    return cache[project_pk]
+
+
+async def aget_request_user(request):
+    """
+    Load the current user from async code and store it on ``request.user``
+    too, so the template context processors rendering afterwards reuse it
+    instead of querying the user a second time.
+    """
+    user = await request.auser()
+    request.user = user
+    return user
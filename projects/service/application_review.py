@@ -0,0 +1,111 @@
+from django.db import transaction
+
+from projects.service.deferred import defer_once
+from projects.service.membership_cache import invalidate_membership_map
+from users.service.leaderboard import refresh_developers
+
+# Bulk review decision -> the status it gives an application.
+REVIEW_DECISIONS = {"approve": "accepted", "reject": "rejected"}
+
+
+class ReviewResult:
+    def __init__(self):
+        self.outcomes = []
+
+    def add(self, application_id, username, outcome):
+        self.outcomes.append((application_id, username, outcome))
+
+    def usernames(self, outcome):
+        return [
+            username
+            for _, username, item_outcome in self.outcomes
+            if item_outcome == outcome
+        ]
+
+
+def review_applications(project, application_ids, decision):
+    """
+    Approve or reject (``decision``, a key of ``REVIEW_DECISIONS``) the
+    applications ``application_ids`` of ``project`` in one transaction.
+
+    Returns a ``ReviewResult`` with one outcome per id, in order:
+    ``accepted`` or ``rejected``; ``already_member`` when approving someone
+    who already is one, which leaves the application pending like the
+    single approve view does; ``processed`` when it is no longer pending;
+    ``missing`` when it is not an application to ``project``.
+
+    The applications are locked with ``select_for_update`` so concurrent
+    reviews cannot process one twice. Statuses are written with one
+    ``bulk_update`` and memberships added with one ``bulk_create``.
+    """
+    from projects.models import Project, ProjectApplication, ProjectMembership
+
+    status = REVIEW_DECISIONS[decision]
+    result = ReviewResult()
+    application_ids = list(dict.fromkeys(application_ids))
+
+    with transaction.atomic():
+        applications = (
+            ProjectApplication.objects.select_for_update(of=("self",))
+            .select_related("user", "role")
+            .filter(project=project)
+            .in_bulk(application_ids)
+        )
+        members = {project.owner_id}
+        if status == "accepted":
+            members.update(
+                ProjectMembership.objects.filter(
+                    project=project,
+                    user_id__in=[
+                        application.user_id
+                        for application in applications.values()
+                    ],
+                ).values_list("user_id", flat=True)
+            )
+
+        reviewed, memberships = [], []
+        for application_id in application_ids:
+            application = applications.get(application_id)
+            if application is None:
+                result.add(application_id, None, "missing")
+                continue
+
+            username = application.user.username
+            if application.status != "pending":
+                result.add(application_id, username, "processed")
+            elif status == "accepted" and application.user_id in members:
+                result.add(application_id, username, "already_member")
+            else:
+                application.status = status
+                reviewed.append(application)
+                result.add(application_id, username, status)
+
+                if status == "accepted":
+                    members.add(application.user_id)
+                    memberships.append(
+                        ProjectMembership(
+                            project=project,
+                            user_id=application.user_id,
+                            role=application.role.role_name,
+                        )
+                    )
+
+        if not reviewed:
+            return result
+
+        ProjectApplication.objects.bulk_update(reviewed, ["status"])
+        ProjectMembership.objects.bulk_create(memberships)
+
+        # bulk_create and bulk_update skip the signals that keep these
+        # current.
+        Project.objects.touch(
+            project.pk,
+            member_count=len(memberships),
+            pending_applications_count=-len(reviewed),
+        )
+        if memberships:
+            user_ids = [membership.user_id for membership in memberships]
+            invalidate_membership_map(*user_ids)
+            defer_once(refresh_developers, *user_ids)
+
+    return result
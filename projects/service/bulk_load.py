@@ -0,0 +1,60 @@
+from django.core.management.color import no_style
+from django.db import connection
+
+
+def _copy(model, objs):
+    fields = model._meta.concrete_fields
+    table = connection.ops.quote_name(model._meta.db_table)
+    columns = ", ".join(
+        connection.ops.quote_name(field.column) for field in fields
+    )
+
+    with connection.cursor() as cursor:
+        with cursor.cursor.copy(
+            f"COPY {table} ({columns}) FROM STDIN"
+        ) as copy:
+            for obj in objs:
+                copy.write_row(
+                    [
+                        field.get_db_prep_save(
+                            field.pre_save(obj, True), connection
+                        )
+                        for field in fields
+                    ]
+                )
+
+
+def load_rows(model, objs, batch_size=5000):
+    """
+    Insert unsaved ``objs`` as fast as the backend allows: ``COPY FROM
+    STDIN`` on Postgres, chunked ``bulk_create`` elsewhere. ``save()`` and
+    model signals are bypassed, so primary keys must already be set when
+    other rows refer to them and derived data has to be rebuilt afterwards.
+    """
+    if not objs:
+        return 0
+
+    if connection.vendor == "postgresql":
+        _copy(model, objs)
+    else:
+        model.objects.bulk_create(objs, batch_size=batch_size)
+
+    return len(objs)
+
+
+def next_pk(model):
+    """Return the first primary key above every existing row of ``model``."""
+    last = model.objects.order_by("-pk").values_list("pk", flat=True).first()
+    return (last or 0) + 1
+
+
+def reset_sequences(*models):
+    """
+    Move the primary key sequences of ``models`` past rows inserted with
+    explicit ids. SQLite tracks this itself, so only Postgres needs it.
+    """
+    statements = connection.ops.sequence_reset_sql(no_style(), models)
+
+    with connection.cursor() as cursor:
+        for sql in statements:
+            cursor.execute(sql)
@@ -0,0 +1,55 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+
+def detail_validators(user, *stamps):
+    """
+    ``(etag, last_modified)`` for a page built from objects last changed at
+    ``stamps``. The ETag also covers the user, since the links and forms
+    the page offers depend on their permissions. It is weak because the
+    CSRF token in the page differs between renders.
+    """
+    raw = ":".join(
+        [str(user.pk or 0), *(stamp.isoformat() for stamp in stamps)]
+    )
+    digest = hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
+    return f'W/"{digest}"', int(max(stamps).timestamp())
+
+
+class ConditionalDetailMixin:
+    """
+    Answer ``If-None-Match`` / ``If-Modified-Since`` with a 304 before the
+    page is built. Once the objects ``get_validator_stamps()`` reads are
+    loaded, the view returns ``not_modified()`` if it is set and otherwise
+    passes the page through ``add_validators()``.
+    """
+
+    def get_validator_stamps(self):
+        raise NotImplementedError
+
+    def get_validators(self):
+        if not hasattr(self, "_validators"):
+            self._validators = detail_validators(
+                self.request.user, *self.get_validator_stamps()
+            )
+        return self._validators
+
+    def not_modified(self):
+        etag, last_modified = self.get_validators()
+        response = get_conditional_response(
+            self.request, etag=etag, last_modified=last_modified
+        )
+        if response is not None:
+            self.add_validators(response)
+        return response
+
+    def add_validators(self, response):
+        etag, last_modified = self.get_validators()
+        response.headers.setdefault("ETag", etag)
+        response.headers.setdefault("Last-Modified", http_date(last_modified))
+        # Per-user pages: keep them out of shared caches and have browsers
+        # revalidate instead of guessing a freshness lifetime.
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
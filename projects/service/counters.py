@@ -0,0 +1,104 @@
+import threading
+
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+TASK_STATUS_COUNTERS = {
+    "todo": "todo_count",
+    "in_progress": "in_progress_count",
+    "done": "done_count",
+}
+
+COUNTER_FIELDS = [
+    "member_count",
+    *TASK_STATUS_COUNTERS.values(),
+    "pending_applications_count",
+    "open_roles_count",
+]
+
+_deleting = threading.local()
+
+
+def deleting_projects():
+    """
+    Ids of the projects this thread is deleting right now. Their rows are
+    deleted with them, so they are not counted out one by one.
+    """
+    if not hasattr(_deleting, "project_ids"):
+        _deleting.project_ids = set()
+    return _deleting.project_ids
+
+
+def counter_field(instance):
+    """
+    The ``Project`` counter a task, membership, open role or application
+    is counted in, or ``None`` when its current state is not counted.
+    """
+    model_name = instance._meta.model_name
+
+    if model_name == "task":
+        return TASK_STATUS_COUNTERS.get(instance.status)
+    if model_name == "projectapplication":
+        if instance.status == "pending":
+            return "pending_applications_count"
+        return None
+    if model_name == "projectmembership":
+        return "member_count"
+    return "open_roles_count"
+
+
+def counter_changes(previous, current):
+    """
+    Turn a row moving from ``previous`` to ``current`` (each a ``(project_id,
+    counter field)`` pair, or ``None`` when the row did not exist) into
+    ``{project_id: {field: delta}}``. Every project the row belonged to is
+    listed, even with no delta, so its ``updated_at`` still gets bumped.
+    """
+    changes = {}
+    for counted, step in ((previous, -1), (current, 1)):
+        if counted is None:
+            continue
+        project_id, field = counted
+        deltas = changes.setdefault(project_id, {})
+        if field:
+            deltas[field] = deltas.get(field, 0) + step
+    return changes
+
+
+def _count(model, **filters):
+    return Coalesce(
+        Subquery(
+            model.objects.filter(project=OuterRef("pk"), **filters)
+            .order_by()
+            .values("project")
+            .annotate(total=Count("pk"))
+            .values("total"),
+            output_field=IntegerField(),
+        ),
+        0,
+    )
+
+
+def actual_counters():
+    """
+    Annotations recounting each counter of a ``Project`` queryset from the
+    rows themselves, as ``actual_<field>``. Each is a correlated subquery,
+    so the relations are not joined into one another.
+    """
+    from projects.models import (
+        ProjectApplication,
+        ProjectMembership,
+        ProjectOpenRole,
+        Task,
+    )
+
+    actual = {
+        "actual_member_count": _count(ProjectMembership),
+        "actual_pending_applications_count": _count(
+            ProjectApplication, status="pending"
+        ),
+        "actual_open_roles_count": _count(ProjectOpenRole),
+    }
+    for status, field in TASK_STATUS_COUNTERS.items():
+        actual[f"actual_{field}"] = _count(Task, status=status)
+    return actual
@@ -0,0 +1,100 @@
+from django.db import connections
+
+# psycopg_pool stat -> (metric name, type, help text, scale)
+POOL_METRICS = {
+    "pool_max": ("db_pool_max_size", "gauge", "Configured maximum size.", 1),
+    "pool_size": (
+        "db_pool_size",
+        "gauge",
+        "Connections currently managed by the pool.",
+        1,
+    ),
+    "checked_out": (
+        "db_pool_checked_out",
+        "gauge",
+        "Connections currently lent to requests.",
+        1,
+    ),
+    "requests_waiting": (
+        "db_pool_requests_waiting",
+        "gauge",
+        "Requests currently queued for a connection.",
+        1,
+    ),
+    "requests_num": (
+        "db_pool_requests_total",
+        "counter",
+        "Connections requested from the pool.",
+        1,
+    ),
+    "requests_queued": (
+        "db_pool_requests_queued_total",
+        "counter",
+        "Requests that had to wait for a connection.",
+        1,
+    ),
+    "requests_wait_ms": (
+        "db_pool_wait_seconds_total",
+        "counter",
+        "Time spent waiting for a connection.",
+        0.001,
+    ),
+    "requests_errors": (
+        "db_pool_timeouts_total",
+        "counter",
+        "Requests that timed out or failed waiting for a connection.",
+        1,
+    ),
+    "connections_lost": (
+        "db_pool_connections_lost_total",
+        "counter",
+        "Connections found broken by the health check.",
+        1,
+    ),
+}
+
+
+def _open_pools():
+    # Only pools a connection already created; reading ``wrapper.pool``
+    # would build one for an alias that never connected.
+    for alias in connections:
+        wrapper = connections[alias]
+        if alias in getattr(wrapper, "_connection_pools", {}):
+            yield alias, wrapper
+
+
+def pool_stats():
+    """
+    ``{alias: stats}`` for every database served through a psycopg pool,
+    with ``checked_out`` derived from the pool size and idle connections.
+    """
+    stats = {}
+    for alias, wrapper in _open_pools():
+        values = wrapper.pool.get_stats()
+        values["checked_out"] = values.get("pool_size", 0) - values.get(
+            "pool_available", 0
+        )
+        stats[alias] = values
+    return stats
+
+
+def render_pool_stats(stats, prefix):
+    """Render ``pool_stats()`` in the Prometheus text format."""
+    lines = []
+    for stat, (name, kind, help_text, scale) in POOL_METRICS.items():
+        metric = f"{prefix}_{name}"
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for alias, values in sorted(stats.items()):
+            value = values.get(stat, 0) * scale
+            lines.append(f'{metric}{{alias="{alias}"}} {value}')
+    return "\n".join(lines) + "\n"
+
+
+def close_pools():
+    """
+    Close every open pool so connections are returned to Postgres instead
+    of being dropped when a worker process exits.
+    """
+    for _, wrapper in list(_open_pools()):
+        wrapper.close_pool()
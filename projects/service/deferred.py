@@ -0,0 +1,39 @@
+from django.db import transaction
+
+
+class _Batch:
+    def __init__(self, action):
+        self.action = action
+        self.keys = set()
+        self.ran = False
+
+    def __call__(self):
+        self.ran = True
+        self.action(self.keys)
+
+
+def defer_once(action, *keys, using=None):
+    """
+    Run ``action(keys)`` once when the current transaction commits, with
+    the keys of every ``defer_once(action, ...)`` call made until then, so
+    ``action`` can recompute all of them in one batch. Outside a
+    transaction it runs right away.
+
+    The pending batch lives among the connection's ``on_commit``
+    callbacks, so a rollback discards it together with the rows that
+    marked it.
+    """
+    connection = transaction.get_connection(using)
+
+    for _, callback, _ in connection.run_on_commit:
+        if (
+            isinstance(callback, _Batch)
+            and callback.action == action
+            and not callback.ran
+        ):
+            callback.keys.update(keys)
+            return
+
+    batch = _Batch(action)
+    batch.keys.update(keys)
+    transaction.on_commit(batch, using=using)
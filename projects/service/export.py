@@ -0,0 +1,183 @@
+import csv
+import json
+
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson",
+}
+
+# Rows fetched per query; also the most model instances held at once.
+EXPORT_CHUNK_SIZE = 2000
+
+
+def _tasks(project_id):
+    from projects.models import Task
+
+    queryset = (
+        Task.objects.filter(project_id=project_id)
+        .select_related("assignee", "created_by")
+        .prefetch_related("tags")
+        .order_by("id")
+    )
+
+    def row(task):
+        return {
+            "id": task.pk,
+            "title": task.title,
+            "description": task.description,
+            "status": task.status,
+            "assignee": task.assignee.username if task.assignee else None,
+            "deadline": task.deadline,
+            "created_by": (
+                task.created_by.username if task.created_by else None
+            ),
+            "tags": [tag.name for tag in task.tags.all()],
+            "created_at": task.created_at,
+            "updated_at": task.updated_at,
+        }
+
+    fields = [
+        "id",
+        "title",
+        "description",
+        "status",
+        "assignee",
+        "deadline",
+        "created_by",
+        "tags",
+        "created_at",
+        "updated_at",
+    ]
+    return fields, queryset, row
+
+
+def _applications(project_id):
+    from projects.models import ProjectApplication
+
+    queryset = (
+        ProjectApplication.objects.filter(project_id=project_id)
+        .select_related("user", "role")
+        .order_by("id")
+    )
+
+    def row(application):
+        return {
+            "id": application.pk,
+            "user": application.user.username,
+            "role": application.role.role_name,
+            "status": application.status,
+            "message": application.message,
+            "created_at": application.created_at,
+        }
+
+    fields = ["id", "user", "role", "status", "message", "created_at"]
+    return fields, queryset, row
+
+
+def _memberships(project_id):
+    from projects.models import ProjectMembership
+    from projects.service.membership_cache import PROJECT_PERMISSIONS
+
+    queryset = (
+        ProjectMembership.objects.filter(project_id=project_id)
+        .select_related("user")
+        .order_by("id")
+    )
+
+    def row(membership):
+        return {
+            "id": membership.pk,
+            "user": membership.user.username,
+            "role": membership.role,
+            **{
+                perm: getattr(membership, perm) for perm in PROJECT_PERMISSIONS
+            },
+            "joined_at": membership.joined_at,
+        }
+
+    fields = ["id", "user", "role", *PROJECT_PERMISSIONS, "joined_at"]
+    return fields, queryset, row
+
+
+EXPORTS = {
+    "tasks": _tasks,
+    "applications": _applications,
+    "memberships": _memberships,
+}
+
+
+class _Echo:
+    # ``csv.writer`` target that hands each formatted line straight back.
+    def write(self, value):
+        return value
+
+
+def _encoder(fields, export_format):
+    if export_format == "jsonl":
+        return lambda row: json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+
+    writer = csv.writer(_Echo())
+
+    def encode(row):
+        return writer.writerow(
+            (
+                ";".join(row[field])
+                if isinstance(row[field], list)
+                else row[field]
+            )
+            for field in fields
+        )
+
+    return encode
+
+
+def export_lines(
+    fields, queryset, row, export_format, chunk_size=EXPORT_CHUNK_SIZE
+):
+    """
+    Yield the export one line at a time, reading ``queryset`` in chunks of
+    ``chunk_size`` so memory stays flat however many rows there are.
+    """
+    encode = _encoder(fields, export_format)
+    if export_format == "csv":
+        yield encode(dict(zip(fields, fields)))
+
+    for obj in queryset.iterator(chunk_size=chunk_size):
+        yield encode(row(obj))
+
+
+async def aexport_lines(
+    fields, queryset, row, export_format, chunk_size=EXPORT_CHUNK_SIZE
+):
+    """Async version of ``export_lines`` for responses served by ASGI."""
+    encode = _encoder(fields, export_format)
+    if export_format == "csv":
+        yield encode(dict(zip(fields, fields)))
+
+    async for obj in queryset.aiterator(chunk_size=chunk_size):
+        yield encode(row(obj))
+
+
+def export_response(request, export, project, export_format):
+    """
+    Stream one of ``EXPORTS`` for ``project`` as CSV or JSON Lines.
+
+    ASGI serves a sync iterator by reading all of it into a list first, so
+    under ASGI the rows come from an async iterator instead.
+    """
+    fields, queryset, row = EXPORTS[export](project.pk)
+    lines = aexport_lines if isinstance(request, ASGIRequest) else export_lines
+
+    response = StreamingHttpResponse(
+        lines(fields, queryset, row, export_format),
+        content_type=EXPORT_FORMATS[export_format],
+    )
+    response["Content-Disposition"] = (
+        f'attachment; filename="project-{project.pk}-{export}.'
+        f'{export_format}"'
+    )
+    return response
@@ -0,0 +1,265 @@
+import asyncio
+import io
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.asgi import get_asgi_application
+from django.core.wsgi import get_wsgi_application
+from django.db.backends.signals import connection_created
+from django.test import Client
+from django.urls import reverse
+
+from projects.service.load_test import SEARCH_TERMS, Dataset, percentile
+
+INTERFACES = ("wsgi", "asgi")
+
+CLIENT_ADDR = "198.51.100.1"
+
+
+def read_requests(dataset, count, rng):
+    """
+    ``count`` GET requests spread over the async read views: the project
+    list (plain and searched), project detail, leaderboard and profiles.
+    """
+    requests = []
+    for _ in range(count):
+        route = rng.choice(("list", "search", "detail", "board", "profile"))
+        if route == "list":
+            requests.append((reverse("projects:project_list"), ""))
+        elif route == "search":
+            requests.append(
+                (
+                    reverse("projects:project_list"),
+                    urlencode({"project_name": rng.choice(SEARCH_TERMS)}),
+                )
+            )
+        elif route == "detail":
+            project_id = rng.choice(dataset.project_ids)
+            requests.append(
+                (reverse("projects:project_detail", args=[project_id]), "")
+            )
+        elif route == "board":
+            requests.append((reverse("users:leaderboard"), ""))
+        else:
+            developer_id = rng.choice(dataset.developer_ids)
+            requests.append(
+                (reverse("users:profile", args=[developer_id]), "")
+            )
+    return requests
+
+
+def session_cookie(developer_id):
+    client = Client()
+    client.force_login(get_user_model().objects.get(pk=developer_id))
+    name = settings.SESSION_COOKIE_NAME
+    return f"{name}={client.cookies[name].value}"
+
+
+class SimulatedLatency:
+    """
+    Sleep ``seconds`` around every query to stand in for the network round
+    trip to a remote database, which a local SQLite file does not have.
+    Each worker thread opens its own connection, so the wrapper is added
+    as connections are created.
+    """
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def wrapper(self, execute, sql, params, many, context):
+        time.sleep(self.seconds)
+        return execute(sql, params, many, context)
+
+    def connected(self, sender, connection, **kwargs):
+        connection.execute_wrappers.append(self.wrapper)
+
+    def __enter__(self):
+        if self.seconds:
+            connection_created.connect(self.connected)
+        return self
+
+    def __exit__(self, *exc_info):
+        connection_created.disconnect(self.connected)
+
+
+def _summary(samples, elapsed):
+    latencies = sorted(seconds for seconds, _ in samples)
+    return {
+        "requests": len(samples),
+        "errors": sum(1 for _, status in samples if status >= 400),
+        "duration_s": round(elapsed, 2),
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed else 0,
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 2),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+    }
+
+
+def run_wsgi(requests, concurrency, threads, cookie, host):
+    """
+    Serve ``requests`` through the WSGI handler the way a threaded WSGI
+    worker does: ``threads`` requests at a time, the rest of the
+    ``concurrency`` in-flight clients wait in the accept queue. Latency is
+    measured from the moment a client sends the request.
+    """
+    application = get_wsgi_application()
+    samples = []
+    lock = threading.Lock()
+
+    def handle(path, query, queued):
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "PATH_INFO": path,
+            "QUERY_STRING": query,
+            "SERVER_NAME": host,
+            "SERVER_PORT": "80",
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "HTTP_HOST": host,
+            "HTTP_COOKIE": cookie,
+            "REMOTE_ADDR": CLIENT_ADDR,
+            "wsgi.input": io.BytesIO(),
+            "wsgi.errors": sys.stderr,
+            "wsgi.url_scheme": "http",
+        }
+        status = []
+        response = application(
+            environ, lambda line, headers: status.append(int(line[:3]))
+        )
+        try:
+            b"".join(response)
+        finally:
+            response.close()
+
+        with lock:
+            samples.append((time.perf_counter() - queued, status[0]))
+
+    def client(share):
+        for path, query in share:
+            pool.submit(handle, path, query, time.perf_counter()).result()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        with ThreadPoolExecutor(concurrency) as clients:
+            for index in range(concurrency):
+                clients.submit(client, requests[index::concurrency])
+    return _summary(samples, time.perf_counter() - started)
+
+
+async def _asgi_request(application, path, query, cookie, host):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [
+            (b"host", host.encode()),
+            (b"cookie", cookie.encode()),
+        ],
+        "client": (CLIENT_ADDR, 0),
+        "server": (host, 80),
+    }
+    received = False
+    status = []
+
+    async def receive():
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Stay connected until the handler cancels its disconnect listener.
+        await asyncio.Future()
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    await application(scope, receive, send)
+    return status[0]
+
+
+def run_asgi(requests, concurrency, cookie, host):
+    """
+    Serve ``requests`` through the ASGI handler from one event loop with
+    ``concurrency`` requests in flight, as an ASGI server would.
+    """
+    application = get_asgi_application()
+    samples = []
+
+    async def client(share):
+        for path, query in share:
+            sent = time.perf_counter()
+            status = await _asgi_request(
+                application, path, query, cookie, host
+            )
+            samples.append((time.perf_counter() - sent, status))
+
+    async def main():
+        await asyncio.gather(
+            *(
+                client(requests[index::concurrency])
+                for index in range(concurrency)
+            )
+        )
+
+    started = time.perf_counter()
+    asyncio.run(main())
+    return _summary(samples, time.perf_counter() - started)
+
+
+def run_interface_benchmark(
+    requests=500,
+    concurrency=20,
+    wsgi_threads=None,
+    db_latency=0.0,
+    sample_size=1000,
+    seed=None,
+    host="localhost",
+):
+    """
+    Replay the same logged-in read requests against the WSGI and the ASGI
+    handler and return both summaries plus the ASGI/WSGI ratios.
+
+    The WSGI worker gets ``concurrency`` threads unless ``wsgi_threads``
+    says otherwise, so both handlers serve the same number of requests at
+    once and the comparison measures the interface, not a thread cap.
+    """
+    if wsgi_threads is None:
+        wsgi_threads = concurrency
+    rng = random.Random(seed)
+    dataset = Dataset(sample_size)
+    planned = read_requests(dataset, requests, rng)
+    cookie = session_cookie(rng.choice(dataset.developer_ids))
+
+    with SimulatedLatency(db_latency):
+        results = {
+            "wsgi": run_wsgi(planned, concurrency, wsgi_threads, cookie, host),
+            "asgi": run_asgi(planned, concurrency, cookie, host),
+        }
+
+    wsgi, asgi = results["wsgi"], results["asgi"]
+    results["speedup"] = {
+        "throughput": round(
+            asgi["throughput_rps"] / (wsgi["throughput_rps"] or 1), 2
+        ),
+        "p95": round(wsgi["p95_ms"] / (asgi["p95_ms"] or 1), 2),
+    }
+    results.update(
+        {
+            "concurrency": concurrency,
+            "wsgi_threads": wsgi_threads,
+            "db_latency_ms": db_latency * 1000,
+        }
+    )
+    return results
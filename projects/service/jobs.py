@@ -0,0 +1,371 @@
+import logging
+import os
+import random
+import socket
+import threading
+import time
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import (
+    IntegrityError,
+    close_old_connections,
+    connection,
+    transaction,
+)
+from django.db.models import Count, F, Min, Q
+from django.utils import timezone
+
+from projects.service.metrics import percentile
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 5
+
+# Seconds before the first retry, doubled after every further failure.
+RETRY_BASE_DELAY = 10
+RETRY_MAX_DELAY = 3600
+
+# A job still running after this many seconds is assumed to have lost its
+# worker and is handed to another one.
+LOCK_TIMEOUT = 600
+
+# Finished jobs are kept this long (for inspection and the queue metrics)
+# and deleted by idle workers every PURGE_INTERVAL seconds.
+RETENTION = 86400
+PURGE_INTERVAL = 600
+
+# Jobs finished in this many seconds feed the wait and run time metrics.
+METRICS_WINDOW = 300
+WINDOW_QUANTILES = (0.5, 0.95)
+JOB_STATUSES = ("queued", "running", "done", "failed")
+
+_handlers = {}
+
+
+def background_job(func):
+    """
+    Register ``func`` so ``enqueue(func, ...)`` can queue it. Workers find
+    the handler by its module and name, so the module must be imported at
+    startup (e.g. from an ``AppConfig.ready``).
+    """
+    func.job_name = f"{func.__module__}.{func.__qualname__}"
+    _handlers[func.job_name] = func
+    return func
+
+
+def enqueue(
+    handler,
+    *,
+    priority=0,
+    dedup_key=None,
+    delay=0,
+    max_attempts=MAX_ATTEMPTS,
+    **kwargs,
+):
+    """
+    Queue ``handler(**kwargs)`` for ``run_workers`` and return its ``Job``.
+    ``kwargs`` must be JSON serializable. Higher ``priority`` runs first;
+    ``delay`` holds the job back for that many seconds.
+
+    The job is a row written in the current transaction, so workers only
+    see it once that commits, and it is dropped if it rolls back. With a
+    ``dedup_key``, a job with that key still waiting to run is returned
+    instead of queueing another.
+
+    With ``settings.JOBS_RUN_INLINE`` the handler runs right away instead
+    and ``None`` is returned.
+    """
+    from projects.models import Job
+
+    name = getattr(handler, "job_name", handler)
+    if name not in _handlers:
+        raise LookupError(f"No background job named {name!r}.")
+
+    if settings.JOBS_RUN_INLINE:
+        _handlers[name](**kwargs)
+        return None
+
+    run_at = timezone.now() + timedelta(seconds=delay)
+    if dedup_key is not None:
+        waiting = Job.objects.filter(status="queued", dedup_key=dedup_key)
+        job = waiting.first()
+        if job is not None:
+            # Asking again pulls a job backing off after a failure forward.
+            waiting.filter(run_at__gt=run_at).update(run_at=run_at)
+            return job
+
+    job = Job(
+        name=name,
+        kwargs=kwargs,
+        priority=priority,
+        dedup_key=dedup_key,
+        max_attempts=max_attempts,
+        run_at=run_at,
+    )
+    try:
+        with transaction.atomic():
+            job.save()
+    except IntegrityError:
+        # Another process queued the same key in the meantime.
+        if dedup_key is None:
+            raise
+        return waiting.get()
+    return job
+
+
+def _ready(now):
+    return Q(status="queued", run_at__lte=now) | Q(
+        status="running", started_at__lt=now - timedelta(seconds=LOCK_TIMEOUT)
+    )
+
+
+READY_ORDER = ("-priority", "run_at", "pk")
+
+
+def _claim_skip_locked(worker, now):
+    from projects.models import Job
+
+    with transaction.atomic():
+        job = (
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(_ready(now))
+            .order_by(*READY_ORDER)
+            .first()
+        )
+        if job is None:
+            return None
+
+        job.status = "running"
+        job.attempts += 1
+        job.started_at = now
+        job.locked_by = worker
+        job.save(
+            update_fields=["status", "attempts", "started_at", "locked_by"]
+        )
+    return job
+
+
+def _claim_compare_and_set(worker, now, candidates=10):
+    from projects.models import Job
+
+    # Without row locks, several workers may pick the same candidate; the
+    # UPDATE only matches while the job is unchanged, so one of them wins.
+    for job in Job.objects.filter(_ready(now)).order_by(*READY_ORDER)[
+        :candidates
+    ]:
+        claimed = Job.objects.filter(
+            pk=job.pk, status=job.status, attempts=job.attempts
+        ).update(
+            status="running",
+            attempts=F("attempts") + 1,
+            started_at=now,
+            locked_by=worker,
+        )
+        if claimed:
+            job.status = "running"
+            job.attempts += 1
+            job.started_at = now
+            job.locked_by = worker
+            return job
+    return None
+
+
+def claim_job(worker):
+    """
+    Mark the next ready job as running for ``worker`` and return it, or
+    ``None`` when nothing is ready. Postgres hands out jobs with
+    ``SELECT ... FOR UPDATE SKIP LOCKED``, so concurrent workers never wait
+    on each other; other databases fall back to a compare-and-set UPDATE.
+    """
+    now = timezone.now()
+    if connection.features.has_select_for_update_skip_locked:
+        return _claim_skip_locked(worker, now)
+    return _claim_compare_and_set(worker, now)
+
+
+def retry_delay(attempts):
+    """Seconds to wait after the ``attempts``-th failed attempt."""
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempts - 1))
+    # Jitter keeps jobs that failed together from retrying together.
+    return delay * random.uniform(1, 1.25)
+
+
+def _finish(job, **fields):
+    from projects.models import Job
+
+    # A job reclaimed after LOCK_TIMEOUT belongs to its new worker now.
+    return Job.objects.filter(
+        pk=job.pk, status="running", attempts=job.attempts
+    ).update(**fields)
+
+
+def _failed(job, error):
+    now = timezone.now()
+    if job.attempts >= job.max_attempts:
+        _finish(job, status="failed", finished_at=now, last_error=error)
+        return
+
+    try:
+        with transaction.atomic():
+            _finish(
+                job,
+                status="queued",
+                run_at=now + timedelta(seconds=retry_delay(job.attempts)),
+                locked_by="",
+                last_error=error,
+            )
+    except IntegrityError:
+        # A newer job with the same dedup key is waiting and will redo it.
+        _finish(
+            job,
+            status="failed",
+            finished_at=now,
+            last_error=f"{error}\nSuperseded by a queued job with the same "
+            "dedup key.",
+        )
+
+
+def run_job(job):
+    """Run a claimed ``job`` and record whether it succeeded."""
+    handler = _handlers.get(job.name)
+    try:
+        if handler is None:
+            raise LookupError(f"No background job named {job.name!r}.")
+        handler(**job.kwargs)
+    except Exception:
+        logger.exception("Job %s (%s) failed", job.pk, job.name)
+        _failed(job, traceback.format_exc())
+        return False
+
+    _finish(job, status="done", finished_at=timezone.now(), locked_by="")
+    return True
+
+
+def purge_finished(older_than=RETENTION):
+    """Delete jobs that finished more than ``older_than`` seconds ago."""
+    from projects.models import Job
+
+    cutoff = timezone.now() - timedelta(seconds=older_than)
+    deleted, _ = Job.objects.filter(
+        status__in=["done", "failed"], finished_at__lt=cutoff
+    ).delete()
+    return deleted
+
+
+def worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+class Worker:
+    """Claim and run jobs one at a time until ``stop`` is set."""
+
+    def __init__(self, stop, poll_interval=1.0):
+        self.stop = stop
+        self.poll_interval = poll_interval
+        self.name = worker_name()
+        self.purged_at = time.monotonic()
+
+    def run_once(self):
+        close_old_connections()
+        job = claim_job(self.name)
+        if job is None:
+            return False
+        run_job(job)
+        return True
+
+    def run(self, burst=False):
+        """
+        Work until stopped; with ``burst``, return as soon as no job is
+        ready instead of polling for more.
+        """
+        while not self.stop.is_set():
+            if self.run_once():
+                continue
+            if burst:
+                break
+            if time.monotonic() - self.purged_at > PURGE_INTERVAL:
+                purge_finished()
+                self.purged_at = time.monotonic()
+            self.stop.wait(self.poll_interval)
+        close_old_connections()
+
+
+def queue_stats():
+    """
+    Jobs per status, the age of the oldest job waiting to run, and the
+    number and p50/p95 wait and run times of jobs finished in the last
+    ``METRICS_WINDOW`` seconds.
+    """
+    from projects.models import Job
+
+    now = timezone.now()
+    depth = dict.fromkeys(JOB_STATUSES, 0)
+    depth.update(
+        Job.objects.order_by()
+        .values_list("status")
+        .annotate(total=Count("pk"))
+    )
+
+    oldest = Job.objects.filter(status="queued", run_at__lte=now).aggregate(
+        oldest=Min("run_at")
+    )["oldest"]
+
+    wait, run = [], []
+    for run_at, started_at, finished_at in Job.objects.filter(
+        status="done",
+        finished_at__gte=now - timedelta(seconds=METRICS_WINDOW),
+    ).values_list("run_at", "started_at", "finished_at"):
+        wait.append(max(0.0, (started_at - run_at).total_seconds()))
+        run.append((finished_at - started_at).total_seconds())
+    wait.sort()
+    run.sort()
+
+    return {
+        "depth": depth,
+        "oldest_age": (now - oldest).total_seconds() if oldest else 0,
+        "finished": len(run),
+        "wait": {q: percentile(wait, q) for q in WINDOW_QUANTILES},
+        "run": {q: percentile(run, q) for q in WINDOW_QUANTILES},
+    }
+
+
+def render_queue_stats(stats, prefix):
+    """Render ``queue_stats()`` in the Prometheus text format."""
+    lines = [
+        f"# HELP {prefix}_job_queue_depth Background jobs per status.",
+        f"# TYPE {prefix}_job_queue_depth gauge",
+    ]
+    for status, total in stats["depth"].items():
+        lines.append(f'{prefix}_job_queue_depth{{status="{status}"}} {total}')
+
+    metric = f"{prefix}_job_queue_oldest_age_seconds"
+    lines += [
+        f"# HELP {metric} Seconds the oldest ready job has been waiting.",
+        f"# TYPE {metric} gauge",
+        f"{metric} {stats['oldest_age']}",
+    ]
+
+    # Recomputed from the window on every scrape, so these are gauges: they
+    # go down as jobs leave the window, which a histogram may not.
+    metric = f"{prefix}_job_window_finished"
+    lines += [
+        f"# HELP {metric} Jobs finished in the last {METRICS_WINDOW}s.",
+        f"# TYPE {metric} gauge",
+        f"{metric} {stats['finished']}",
+    ]
+    for name, help_text in (
+        ("wait", "Seconds from a job being due to a worker starting it"),
+        ("run", "Seconds a worker spent running a job"),
+    ):
+        for quantile, value in stats[name].items():
+            metric = f"{prefix}_job_{name}_seconds_p{round(quantile * 100)}"
+            lines += [
+                f"# HELP {metric} {help_text}, p{round(quantile * 100)} of "
+                f"the jobs finished in the last {METRICS_WINDOW}s.",
+                f"# TYPE {metric} gauge",
+                f"{metric} {value}",
+            ]
+
+    return "\n".join(lines) + "\n"
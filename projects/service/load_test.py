@@ -0,0 +1,324 @@
+import random
+import re
+import threading
+import time
+from collections import defaultdict
+
+from django.contrib.auth import get_user_model
+from django.db import connection, connections
+from django.test import Client
+from django.urls import resolve, reverse
+
+from projects.models import (
+    Project,
+    ProjectMembership,
+    ProjectOpenRole,
+    Task,
+)
+from projects.service.metrics import percentile
+
+DEFAULT_MIX = {
+    "browse": 30,
+    "search": 20,
+    "detail": 25,
+    "task_edit": 10,
+    "apply": 10,
+    "rate": 5,
+}
+
+NEXT_CURSOR = re.compile(r"[?&]cursor=([\w=-]+)")
+
+SEARCH_TERMS = ["agile", "platform", "smart", "hub", "market", "engine"]
+
+
+class Dataset:
+    """
+    A sample of existing rows the flows pick their targets from, loaded once
+    before the run so choosing a target costs no query during it.
+    """
+
+    def __init__(self, sample_size):
+        developer_model = get_user_model()
+
+        self.developer_ids = list(
+            developer_model.objects.order_by("?").values_list("id", flat=True)[
+                :sample_size
+            ]
+        )
+        self.project_ids = list(
+            Project.objects.order_by("?").values_list("id", flat=True)[
+                :sample_size
+            ]
+        )
+        self.deployed_ids = list(
+            Project.objects.filter(development_stage="deployed")
+            .order_by("?")
+            .values_list("id", flat=True)[:sample_size]
+        )
+        self.open_roles = list(
+            ProjectOpenRole.objects.order_by("?").values_list(
+                "project_id", "id"
+            )[:sample_size]
+        )
+
+        self.members = defaultdict(set)
+        for project_id, user_id in ProjectMembership.objects.filter(
+            project_id__in=self.project_ids
+            + self.deployed_ids
+            + [project_id for project_id, _ in self.open_roles]
+        ).values_list("project_id", "user_id"):
+            self.members[project_id].add(user_id)
+
+        self.owned = defaultdict(list)
+        for project_id, owner_id in Project.objects.filter(
+            owner_id__in=self.developer_ids
+        ).values_list("id", "owner_id")[: sample_size * 10]:
+            self.owned[owner_id].append(project_id)
+
+        self.tasks = defaultdict(list)
+        for task in Task.objects.filter(
+            project_id__in=[
+                project_id
+                for project_ids in self.owned.values()
+                for project_id in project_ids
+            ]
+        ).values("project_id", "id", "title", "assignee_id")[
+            : sample_size * 10
+        ]:
+            self.tasks[task["project_id"]].append(task)
+
+        if not self.developer_ids or not self.project_ids:
+            raise ValueError(
+                "The database has no developers or projects; "
+                "run seed_scale first."
+            )
+
+
+class Recorder:
+    """Thread-safe per-view latency and query-count samples."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def add(self, view, seconds, queries, failed):
+        with self.lock:
+            self.samples[view].append((seconds, queries))
+            if failed:
+                self.errors[view] += 1
+
+    def summary(self, elapsed):
+        routes = {}
+        for view, samples in sorted(self.samples.items()):
+            latencies = sorted(seconds for seconds, _ in samples)
+            routes[view] = {
+                "requests": len(samples),
+                "errors": self.errors[view],
+                "throughput_rps": round(len(samples) / elapsed, 2),
+                "mean_ms": round(sum(latencies) / len(latencies) * 1000, 2),
+                "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+                "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+                "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+                "queries_per_request": round(
+                    sum(queries for _, queries in samples) / len(samples), 2
+                ),
+            }
+
+        total = sum(route["requests"] for route in routes.values())
+        return {
+            "duration_s": round(elapsed, 2),
+            "requests": total,
+            "errors": sum(route["errors"] for route in routes.values()),
+            "throughput_rps": round(total / elapsed, 2) if elapsed else 0,
+            "routes": routes,
+        }
+
+
+class SimulatedUser:
+    """
+    One logged-in developer replaying a weighted mix of flows through the
+    WSGI handler with its own ``Client`` (and so its own session).
+    """
+
+    def __init__(self, developer_id, dataset, recorder, mix, rng, host):
+        self.developer_id = developer_id
+        self.dataset = dataset
+        self.recorder = recorder
+        self.flows = list(mix)
+        self.weights = list(mix.values())
+        self.rng = rng
+        # A non-internal address keeps the debug toolbar out of the numbers.
+        self.client = Client(
+            raise_request_exception=False,
+            HTTP_HOST=host,
+            REMOTE_ADDR="198.51.100.1",
+        )
+
+    def request(self, method, url, data=None):
+        queries = 0
+
+        def count(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        started = time.perf_counter()
+        with connection.execute_wrapper(count):
+            response = getattr(self.client, method)(url, data or {})
+        elapsed = time.perf_counter() - started
+
+        func = resolve(url).func
+        name = getattr(func, "view_class", func).__name__
+        failed = response.status_code >= 400
+
+        self.recorder.add(name, elapsed, queries, failed)
+        return response
+
+    def run(self, deadline=None, iterations=None):
+        self.client.force_login(
+            get_user_model().objects.get(pk=self.developer_id)
+        )
+        done = 0
+        try:
+            while (deadline is None or time.monotonic() < deadline) and (
+                iterations is None or done < iterations
+            ):
+                flow = self.rng.choices(self.flows, self.weights)[0]
+                getattr(self, f"flow_{flow}")()
+                done += 1
+        finally:
+            connections.close_all()
+
+    def flow_browse(self):
+        response = self.request("get", reverse("projects:project_list"))
+        cursor = NEXT_CURSOR.search(response.content.decode())
+        if cursor:
+            self.request(
+                "get",
+                reverse("projects:project_list"),
+                {"cursor": cursor.group(1)},
+            )
+        self.request("get", reverse("users:leaderboard"))
+
+    def flow_search(self):
+        self.request(
+            "get",
+            reverse("projects:project_list"),
+            {"project_name": self.rng.choice(SEARCH_TERMS)},
+        )
+
+    def flow_detail(self):
+        project_id = self.rng.choice(self.dataset.project_ids)
+        self.request(
+            "get", reverse("projects:project_detail", args=[project_id])
+        )
+        self.request("get", reverse("projects:task_list", args=[project_id]))
+
+    def flow_task_edit(self):
+        project_ids = [
+            project_id
+            for project_id in self.dataset.owned.get(self.developer_id, [])
+            if self.dataset.tasks.get(project_id)
+        ]
+        if not project_ids:
+            return self.flow_detail()
+
+        project_id = self.rng.choice(project_ids)
+        task = self.rng.choice(self.dataset.tasks[project_id])
+        url = reverse("projects:task_edit", args=[project_id, task["id"]])
+
+        self.request("get", url)
+        self.request(
+            "post",
+            url,
+            {
+                "title": task["title"],
+                "status": self.rng.choice(["todo", "in_progress", "done"]),
+                "assignee": task["assignee_id"] or "",
+            },
+        )
+
+    def flow_apply(self):
+        candidates = [
+            (project_id, role_id)
+            for project_id, role_id in self.dataset.open_roles
+            if self.developer_id not in self.dataset.members[project_id]
+        ]
+        if not candidates:
+            return self.flow_detail()
+
+        project_id, role_id = self.rng.choice(candidates)
+        url = reverse("projects:apply", args=[project_id, role_id])
+        self.request("get", url)
+        self.request("post", url, {"message": "Load test application"})
+
+    def flow_rate(self):
+        candidates = [
+            project_id
+            for project_id in self.dataset.deployed_ids
+            if self.developer_id not in self.dataset.members[project_id]
+        ]
+        if not candidates:
+            return self.flow_detail()
+
+        url = reverse(
+            "projects:project_rate", args=[self.rng.choice(candidates)]
+        )
+        self.request("get", url)
+        self.request(
+            "post",
+            url,
+            {"score": self.rng.randint(1, 5), "comment": "Load test"},
+        )
+
+
+def run_load_test(
+    users,
+    mix=None,
+    duration=None,
+    iterations=None,
+    sample_size=1000,
+    seed=None,
+    host="localhost",
+):
+    """
+    Replay ``users`` concurrent simulated developers for ``duration``
+    seconds (or ``iterations`` flows each) and return the summary dict.
+    """
+    rng = random.Random(seed)
+    dataset = Dataset(sample_size)
+    recorder = Recorder()
+    mix = mix or DEFAULT_MIX
+
+    # Half of the users own projects so the task-edit flow has targets.
+    owners = [owner_id for owner_id in dataset.owned] or dataset.developer_ids
+    simulated = [
+        SimulatedUser(
+            rng.choice(owners if index % 2 else dataset.developer_ids),
+            dataset,
+            recorder,
+            mix,
+            random.Random(rng.random()),
+            host,
+        )
+        for index in range(users)
+    ]
+
+    started = time.monotonic()
+    deadline = started + duration if duration else None
+    threads = [
+        threading.Thread(
+            target=user.run,
+            kwargs={"deadline": deadline, "iterations": iterations},
+        )
+        for user in simulated
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    summary = recorder.summary(time.monotonic() - started)
+    summary.update({"users": users, "mix": mix})
+    return summary
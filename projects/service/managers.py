@@ -1,5 +1,8 @@
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Greatest
+from django.utils import timezone
 
 
 class ProjectManager(models.Manager):
@@ -13,3 +16,31 @@ class ProjectManager(models.Manager):
                 }
             )
         return True
+
+    def touch(self, project_id, **counters):
+        """
+        Bump ``updated_at`` without loading the project, adding the given
+        deltas to its counter fields in the same UPDATE.
+        """
+        changes = {
+            # A drifted counter is clamped at zero rather than failing the
+            # write; rebuild_project_counters puts the real value back.
+            field: Greatest(F(field) + delta, 0)
+            for field, delta in counters.items()
+            if delta
+        }
+        return self.filter(pk=project_id).update(
+            updated_at=timezone.now(), **changes
+        )
+
+    def sync_open_to_candidates(self, project_ids):
+        """
+        Set ``open_to_candidates`` from ``open_roles_count`` for all of
+        ``project_ids`` in one UPDATE.
+        """
+        return self.filter(pk__in=project_ids).update(
+            open_to_candidates=Case(
+                When(open_roles_count__gt=0, then=Value(True)),
+                default=Value(False),
+            )
+        )
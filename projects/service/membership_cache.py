@@ -0,0 +1,129 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from projects.service.metrics import registry
+
+PROJECT_PERMISSIONS = [
+    "edit_project_info_perm",
+    "add_task_perm",
+    "update_project_stage_perm",
+    "manage_open_roles_perm",
+]
+
+MEMBERSHIP_FIELDS = ["id", "role", "joined_at"] + PROJECT_PERMISSIONS
+
+# Served by /metrics as teammate_membership_cache_{hits,misses}_total.
+_COUNTERS = {
+    "hits": "membership_cache_hits_total",
+    "misses": "membership_cache_misses_total",
+}
+
+
+def _timeout():
+    return getattr(settings, "MEMBERSHIP_CACHE_TIMEOUT", 300)
+
+
+def _map_key(user_id):
+    return f"projects:membership_map:{user_id}"
+
+
+def _version_key(user_id):
+    return f"projects:membership_map_version:{user_id}"
+
+
+def _count(name):
+    registry.inc(_COUNTERS[name])
+
+
+def _current_version(user_id):
+    version = cache.get(_version_key(user_id))
+    if version is None:
+        version = 1
+        cache.add(_version_key(user_id), version, timeout=None)
+    return version
+
+
+def _build_map(user_id):
+    from projects.models import Project, ProjectMembership
+
+    memberships = {
+        row.pop("project_id"): {**row, "is_owner": False}
+        for row in ProjectMembership.objects.filter(user_id=user_id).values(
+            "project_id", *MEMBERSHIP_FIELDS
+        )
+    }
+    for project_id in Project.objects.filter(owner_id=user_id).values_list(
+        "id", flat=True
+    ):
+        memberships.setdefault(project_id, {"id": None})["is_owner"] = True
+
+    return memberships
+
+
+def get_membership_map(user_id):
+    """
+    Return ``{project_id: {...}}`` for every project the user belongs to or
+    owns. Each entry holds the membership id, role, ``joined_at``, the four
+    ``*_perm`` flags and ``is_owner``. Served from the cache when possible.
+    """
+    version = _current_version(user_id)
+    memberships = cache.get(_map_key(user_id), version=version)
+
+    if memberships is not None:
+        _count("hits")
+        return memberships
+
+    _count("misses")
+    memberships = _build_map(user_id)
+    cache.set(
+        _map_key(user_id), memberships, timeout=_timeout(), version=version
+    )
+    return memberships
+
+
+def get_cached_membership(user_id, project_id):
+    """
+    Return the cached membership entry of ``user_id`` in ``project_id`` or
+    ``None`` when the user has no membership row there.
+    """
+    entry = get_membership_map(user_id).get(project_id)
+    if entry is None or entry["id"] is None:
+        return None
+    return entry
+
+
+def _bump(user_id):
+    try:
+        cache.incr(_version_key(user_id))
+    except ValueError:
+        cache.set(_version_key(user_id), 2, timeout=None)
+
+
+def invalidate_membership_map(*user_ids):
+    """
+    Drop the cached maps of ``user_ids``. The version is bumped right away
+    and again once the surrounding transaction commits, so a map rebuilt
+    from not yet committed data in between cannot outlive the write.
+    """
+    user_ids = {user_id for user_id in user_ids if user_id is not None}
+
+    for user_id in user_ids:
+        _bump(user_id)
+
+    if user_ids and transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: [_bump(user_id) for user_id in user_ids])
+
+
+def membership_cache_stats():
+    stats = {
+        name: registry.counter(metric) for name, metric in _COUNTERS.items()
+    }
+
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+    return stats
+
+
+def reset_membership_cache_stats():
+    registry.reset(*_COUNTERS.values())
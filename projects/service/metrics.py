@@ -0,0 +1,151 @@
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+
+PREFIX = "teammate"
+
+TIME_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+SIZE_BUCKETS = (1_000, 5_000, 10_000, 50_000, 100_000, 500_000, 1_000_000)
+
+# name -> (help text, buckets)
+REQUEST_METRICS = {
+    "request_duration_seconds": (
+        "Total time spent handling the request.",
+        TIME_BUCKETS,
+    ),
+    "db_duration_seconds": (
+        "Time spent executing SQL during the request.",
+        TIME_BUCKETS,
+    ),
+    "db_queries": ("SQL queries executed per request.", QUERY_BUCKETS),
+    "template_duration_seconds": (
+        "Time spent rendering the template response.",
+        TIME_BUCKETS,
+    ),
+    "response_size_bytes": ("Size of the response body.", SIZE_BUCKETS),
+}
+
+# name -> help text
+COUNTER_METRICS = {
+    "membership_cache_hits_total": (
+        "Membership map lookups served from the cache."
+    ),
+    "membership_cache_misses_total": (
+        "Membership map lookups rebuilt from the database."
+    ),
+}
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not values:
+        return 0.0
+    index = max(0, min(len(values) - 1, round(fraction * len(values)) - 1))
+    return values[index]
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense."""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        total = 0
+        for bound, count in zip(self.buckets + ("+Inf",), self.counts):
+            total += count
+            yield bound, total
+
+
+class Registry:
+    """
+    Per-process histograms keyed by metric and view, plus plain counters.
+    Each worker process keeps and serves its own numbers.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.histograms = defaultdict(dict)
+        self.counters = defaultdict(int)
+
+    def observe(self, view, **values):
+        with self.lock:
+            for name, value in values.items():
+                if value is None:
+                    continue
+                per_view = self.histograms[name]
+                if view not in per_view:
+                    per_view[view] = Histogram(REQUEST_METRICS[name][1])
+                per_view[view].observe(value)
+
+    def inc(self, name, amount=1):
+        with self.lock:
+            self.counters[name] += amount
+
+    def counter(self, name):
+        with self.lock:
+            return self.counters[name]
+
+    def reset(self, *counters):
+        """Clear everything, or only the given counters."""
+        with self.lock:
+            if counters:
+                for name in counters:
+                    self.counters.pop(name, None)
+                return
+            self.histograms.clear()
+            self.counters.clear()
+
+    def render(self):
+        """Render every histogram in the Prometheus text format."""
+        lines = []
+        with self.lock:
+            for name, (help_text, _) in REQUEST_METRICS.items():
+                metric = f"{PREFIX}_{name}"
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} histogram")
+
+                for view, histogram in sorted(self.histograms[name].items()):
+                    for bound, total in histogram.cumulative():
+                        lines.append(
+                            f'{metric}_bucket{{view="{view}",le="{bound}"}} '
+                            f"{total}"
+                        )
+                    lines.append(
+                        f'{metric}_sum{{view="{view}"}} {histogram.sum}'
+                    )
+                    lines.append(
+                        f'{metric}_count{{view="{view}"}} {histogram.count}'
+                    )
+
+            for name, help_text in COUNTER_METRICS.items():
+                metric = f"{PREFIX}_{name}"
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric} {self.counters[name]}")
+
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
@@ -0,0 +1,228 @@
+import logging
+import os
+import re
+import sys
+from collections import defaultdict
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from django.template.base import TokenType
+
+logger = logging.getLogger("projects.nplusone")
+
+DEFAULTS = {
+    # "off", "log", "header" or "raise"
+    "MODE": "off",
+    # Identical-shape queries from one call site before it counts as N+1.
+    "THRESHOLD": 3,
+    # Fraction of requests inspected by the middleware.
+    "SAMPLE_RATE": 1.0,
+}
+
+_THIS_FILE = os.path.abspath(__file__)
+
+
+class NPlusOneError(Exception):
+    pass
+
+
+def get_config():
+    return {**DEFAULTS, **getattr(settings, "NPLUSONE", {})}
+
+
+def normalize_sql(sql):
+    """
+    Reduce a query to its shape: literals, numbers, ``IN`` lists and
+    savepoint names are replaced so repeated lookups compare equal.
+    """
+    sql = re.sub(r'"s\d+_x\d+"', '"savepoint"', sql)
+    sql = re.sub(r"'(?:[^']|'')*'", "?", sql)
+    sql = re.sub(r"\b\d+(?:\.\d+)?\b", "?", sql)
+    sql = re.sub(r"\(\?(?:, \?)+\)", "(...)", sql)
+    sql = re.sub(r"%s(?:, %s)+", "%s", sql)
+    return sql
+
+
+def _template_site(frame):
+    node = frame.f_locals.get("self")
+    origin = getattr(node, "origin", None)
+    token = getattr(node, "token", None)
+    if origin is None or token is None:
+        return None
+    if token.token_type == TokenType.VAR:
+        source = f"{{{{ {token.contents} }}}}"
+    else:
+        source = f"{{% {token.contents} %}}"
+    name = origin.template_name or origin.name
+    return f"{name}:{token.lineno} {source}"
+
+
+def _lazy_load(frame):
+    """Name the relation whose descriptor or manager ran the query."""
+    owner = frame.f_locals.get("self")
+    instance = frame.f_locals.get("instance") or getattr(
+        owner, "instance", None
+    )
+    if instance is None:
+        return None
+
+    accessor = getattr(owner, "prefetch_cache_name", None)
+    if accessor is None and hasattr(owner, "related"):
+        accessor = owner.related.get_accessor_name()
+    if accessor is None and hasattr(owner, "field"):
+        field = owner.field
+        accessor = (
+            field.name
+            if isinstance(instance, field.model)
+            else field.remote_field.get_accessor_name()
+        )
+
+    return f"{type(instance).__name__}.{accessor}" if accessor else None
+
+
+def _related_queryset(frame):
+    """
+    Name the relation behind a related manager's queryset being evaluated,
+    e.g. ``task.tags.all()`` iterated after the manager has returned.
+    """
+    queryset = frame.f_locals.get("self")
+    instance = getattr(queryset, "_hints", {}).get("instance")
+    if instance is None:
+        return None
+
+    accessors = [
+        (
+            field.get_accessor_name()
+            if field.auto_created and not field.concrete
+            else field.name
+        )
+        for field in instance._meta.get_fields()
+        if field.is_relation and field.related_model is queryset.model
+    ]
+    if not accessors:
+        return None
+    return f"{type(instance).__name__}.{'|'.join(accessors)}"
+
+
+def _query_frame(frame):
+    """Step past the execute wrappers to the frame that ran the cursor."""
+    start = frame
+    while frame is not None and not _is_cursor_frame(frame):
+        frame = frame.f_back
+    while frame is not None and _is_cursor_frame(frame):
+        frame = frame.f_back
+    return frame or start
+
+
+def _is_cursor_frame(frame):
+    return frame.f_code.co_filename.endswith(
+        os.path.join("db", "backends", "utils.py")
+    )
+
+
+def call_site(frame):
+    """
+    Describe where a query came from: the innermost project source line,
+    the template node being rendered and the relation lazily loaded.
+    """
+    code_site = template_site = lazy_load = None
+    base_dir = str(settings.BASE_DIR)
+
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+
+        if filename.endswith("related_descriptors.py") and not lazy_load:
+            try:
+                lazy_load = _lazy_load(frame)
+            except Exception:
+                lazy_load = None
+        elif filename.endswith(os.path.join("models", "query.py")):
+            if not lazy_load:
+                try:
+                    lazy_load = _related_queryset(frame)
+                except Exception:
+                    lazy_load = None
+        elif (
+            frame.f_code.co_name == "render_annotated"
+            and template_site is None
+        ):
+            template_site = _template_site(frame)
+        elif (
+            code_site is None
+            and filename != _THIS_FILE
+            and filename.startswith(base_dir)
+            and "site-packages" not in filename
+        ):
+            code_site = (
+                f"{filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+            )
+
+        frame = frame.f_back
+
+    return code_site, template_site, lazy_load
+
+
+class NPlusOneDetector:
+    """
+    Record every query run inside the ``with`` block, grouped by shape and
+    call site, and report groups repeated at least ``threshold`` times.
+    """
+
+    def __init__(self, threshold=None):
+        self.threshold = threshold or get_config()["THRESHOLD"]
+        self.groups = defaultdict(int)
+        self._stack = None
+
+    def _record(self, execute, sql, params, many, context):
+        key = (normalize_sql(sql),) + call_site(_query_frame(sys._getframe(1)))
+        self.groups[key] += 1
+        return execute(sql, params, many, context)
+
+    def start(self):
+        self._stack = ExitStack()
+        for alias in connections:
+            self._stack.enter_context(
+                connections[alias].execute_wrapper(self._record)
+            )
+
+    def stop(self):
+        self._stack.close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def problems(self):
+        return [
+            {
+                "sql": sql,
+                "count": count,
+                "code": code_site,
+                "template": template_site,
+                "relation": lazy_load,
+            }
+            for (sql, code_site, template_site, lazy_load), count in sorted(
+                self.groups.items(), key=lambda item: -item[1]
+            )
+            if count >= self.threshold
+        ]
+
+    def report(self):
+        lines = []
+        for problem in self.problems:
+            where = problem["template"] or problem["code"] or "unknown"
+            relation = (
+                f" loading {problem['relation']}"
+                if problem["relation"]
+                else ""
+            )
+            lines.append(
+                f"{problem['count']}x{relation} at {where}: "
+                f"{problem['sql'][:200]}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,264 @@
+import base64
+import binascii
+import datetime
+import json
+
+from django.core.paginator import InvalidPage
+from django.db.models import Q
+from django.http import Http404
+
+
+class InvalidCursor(InvalidPage):
+    pass
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    raise TypeError(f"Cannot encode {type(value).__name__} in a cursor.")
+
+
+def encode_cursor(values, direction, position):
+    payload = json.dumps(
+        {"v": values, "d": direction, "i": position},
+        default=_encode_value,
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values, direction, position = payload["v"], payload["d"], payload["i"]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise InvalidCursor("Invalid cursor.")
+
+    if direction not in ("next", "prev") or not isinstance(values, list):
+        raise InvalidCursor("Invalid cursor.")
+    if not isinstance(position, int) or position < 0:
+        raise InvalidCursor("Invalid cursor.")
+
+    return values, direction, position
+
+
+class CursorPage:
+    """
+    A page of a keyset paginated queryset.
+
+    Mirrors the parts of ``django.core.paginator.Page`` used by templates,
+    except that neighbouring pages are addressed by opaque cursors instead
+    of page numbers, so no ``COUNT(*)`` is ever issued.
+    """
+
+    is_cursor = True
+
+    def __init__(self, object_list, paginator, start, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.start = start
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    @property
+    def number(self):
+        return self.start // self.paginator.per_page + 1
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    def start_index(self):
+        if not self.object_list:
+            return 0
+        return self.start + 1
+
+    def end_index(self):
+        return self.start + len(self.object_list)
+
+    @property
+    def next_cursor(self):
+        if not self.has_next():
+            return None
+        return encode_cursor(
+            self.paginator.cursor_values(self.object_list[-1]),
+            "next",
+            self.end_index(),
+        )
+
+    @property
+    def previous_cursor(self):
+        if not self.has_previous():
+            return None
+        return encode_cursor(
+            self.paginator.cursor_values(self.object_list[0]),
+            "prev",
+            self.start,
+        )
+
+
+class CursorPaginator:
+    """
+    Keyset paginator over a queryset with a stable, unique ordering.
+
+    ``ordering`` must end with a unique column (usually ``id``) so that
+    every row has a distinct position; page N then costs the same index
+    range scan as page 1.
+    """
+
+    def __init__(self, object_list, per_page, ordering):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering)
+
+    def cursor_values(self, obj):
+        return [getattr(obj, field.lstrip("-")) for field in self.ordering]
+
+    @staticmethod
+    def _reverse(ordering):
+        return tuple(
+            field[1:] if field.startswith("-") else f"-{field}"
+            for field in ordering
+        )
+
+    @staticmethod
+    def _after(ordering, values):
+        condition = Q()
+
+        for index, field in enumerate(ordering):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            clause = Q(**{f"{name}__{lookup}": values[index]})
+
+            for prev_field, prev_value in zip(
+                ordering[:index], values[:index]
+            ):
+                clause &= Q(**{prev_field.lstrip("-"): prev_value})
+
+            condition |= clause
+
+        return condition
+
+    def _page_query(self, cursor):
+        if not cursor:
+            qs = self.object_list.order_by(*self.ordering)
+            return qs[: self.per_page + 1], None, 0
+
+        values, direction, position = decode_cursor(cursor)
+
+        if len(values) != len(self.ordering):
+            raise InvalidCursor("Invalid cursor.")
+
+        if direction == "next":
+            ordering = self.ordering
+        else:
+            ordering = self._reverse(self.ordering)
+
+        qs = self.object_list.order_by(*ordering).filter(
+            self._after(ordering, values)
+        )
+        return qs[: self.per_page + 1], direction, position
+
+    def _build_page(self, rows, direction, position):
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+
+        if direction is None:
+            return CursorPage(
+                rows, self, start=0, has_next=has_more, has_previous=False
+            )
+
+        if direction == "next":
+            return CursorPage(
+                rows, self, position, has_next=has_more, has_previous=True
+            )
+
+        rows.reverse()
+        start = max(position - len(rows), 0) if has_more else 0
+        return CursorPage(
+            rows, self, start, has_next=True, has_previous=has_more
+        )
+
+    def page(self, cursor=None):
+        qs, direction, position = self._page_query(cursor)
+        return self._build_page(list(qs), direction, position)
+
+    async def apage(self, cursor=None):
+        qs, direction, position = self._page_query(cursor)
+        return self._build_page([row async for row in qs], direction, position)
+
+
+class CursorPaginationMixin:
+    """
+    ListView mixin switching pagination to keyset mode.
+
+    Pages are addressed with ``?cursor=`` and ordered by ``cursor_ordering``.
+    """
+
+    cursor_ordering = ("id",)
+    cursor_kwarg = "cursor"
+
+    def get_cursor_ordering(self):
+        return self.cursor_ordering
+
+    def paginate_queryset(self, queryset, page_size):
+        if getattr(self, "_async_page", None) is not None:
+            paginator, page = self._async_page
+        else:
+            paginator = self.get_cursor_paginator(queryset, page_size)
+            try:
+                page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+            except InvalidCursor as e:
+                raise Http404(str(e))
+
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_cursor_paginator(self, queryset, page_size):
+        return CursorPaginator(queryset, page_size, self.get_cursor_ordering())
+
+    async def apaginate_queryset(self, queryset, page_size):
+        """
+        Fetch the page with the async ORM ahead of ``get_context_data``,
+        which then picks it up through ``paginate_queryset``.
+        """
+        paginator = self.get_cursor_paginator(queryset, page_size)
+        try:
+            page = await paginator.apage(
+                self.request.GET.get(self.cursor_kwarg)
+            )
+        except InvalidCursor as e:
+            raise Http404(str(e))
+
+        self._async_page = paginator, page
+
+
+class AsyncCursorListMixin(CursorPaginationMixin):
+    """
+    ListView mixin serving the list from an async ``get``: the page is
+    fetched with the async ORM, so under ASGI the event loop keeps serving
+    other requests while the query runs. Anything left lazy in the context
+    is evaluated when the template renders, in a worker thread.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        self.object_list = self.get_queryset()
+        await self.apaginate_queryset(
+            self.object_list, self.get_paginate_by(self.object_list)
+        )
+        context = self.get_context_data()
+        return self.render_to_response(context)
@@ -0,0 +1,15 @@
+from django.db.models import Prefetch
+
+
+def prefetch_top(lookup, queryset, limit, to_attr=None):
+    """
+    Prefetch at most ``limit`` rows of ``lookup`` per parent, in the order
+    of ``queryset``. Django turns the slice into a ``ROW_NUMBER()`` window
+    partitioned by the parent key, so only the rendered rows are fetched.
+    The rows land in ``to_attr`` (``top_<lookup>`` by default) as a list.
+    """
+    return Prefetch(
+        lookup,
+        queryset=queryset[:limit],
+        to_attr=to_attr or f"top_{lookup}",
+    )
@@ -0,0 +1,121 @@
+import re
+
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = "projects_project_fts"
+
+# Field weights: name matches rank above description matches.
+POSTGRES_CONFIG = "english"
+SQLITE_WEIGHTS = (10.0, 4.0)
+
+
+def _terms(query):
+    return re.findall(r"\w+", query or "")
+
+
+def _postgres_search(queryset, terms):
+    table = queryset.model._meta.db_table
+    tsquery = " & ".join(f"{term}:*" for term in terms)
+
+    return (
+        queryset.alias(
+            search_match=RawSQL(
+                f"{table}.search_vector @@ to_tsquery(%s, %s)",
+                (POSTGRES_CONFIG, tsquery),
+                output_field=BooleanField(),
+            )
+        )
+        .filter(search_match=True)
+        .annotate(
+            search_rank=RawSQL(
+                f"ts_rank({table}.search_vector, to_tsquery(%s, %s))",
+                (POSTGRES_CONFIG, tsquery),
+                output_field=FloatField(),
+            )
+        )
+    )
+
+
+def _sqlite_search(queryset, terms):
+    table = queryset.model._meta.db_table
+    match = " ".join(f'"{term}"*' for term in terms)
+    weights = ", ".join(str(weight) for weight in SQLITE_WEIGHTS)
+
+    return queryset.filter(
+        id__in=RawSQL(
+            f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s",
+            (match,),
+        )
+    ).annotate(
+        search_rank=RawSQL(
+            f"SELECT -bm25({FTS_TABLE}, {weights}) FROM {FTS_TABLE} "
+            f"WHERE {FTS_TABLE} MATCH %s AND rowid = {table}.id",
+            (match,),
+            output_field=FloatField(),
+        )
+    )
+
+
+def _fallback_search(queryset, terms):
+    condition = Q()
+    for term in terms:
+        condition &= Q(name__icontains=term) | Q(description__icontains=term)
+
+    return queryset.filter(condition).annotate(
+        search_rank=RawSQL("0", (), output_field=FloatField())
+    )
+
+
+def search_projects(queryset, query):
+    """
+    Filter ``queryset`` down to projects whose name or description match
+    ``query`` and annotate each row with a ``search_rank`` relevance score
+    (higher is better). Every word is prefix matched.
+    """
+    terms = _terms(query)
+
+    if not terms:
+        return queryset
+
+    if connection.vendor == "postgresql":
+        return _postgres_search(queryset, terms)
+    if connection.vendor == "sqlite":
+        return _sqlite_search(queryset, terms)
+    return _fallback_search(queryset, terms)
+
+
+def index_project(project):
+    """
+    Refresh the SQLite FTS5 row for ``project``. Postgres maintains its
+    search vector as a generated column, so there is nothing to do there.
+    """
+    if connection.vendor != "sqlite":
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [project.pk]
+        )
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, name, description) "
+            f"VALUES (%s, %s, %s)",
+            [project.pk, project.name, project.description],
+        )
+
+
+def rebuild_index():
+    """
+    Re-populate the SQLite FTS5 table from ``projects_project``, e.g. after
+    rows were written with ``bulk_create`` or raw SQL.
+    """
+    if connection.vendor != "sqlite":
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, name, description) "
+            f"SELECT id, name, description FROM projects_project"
+        )
@@ -0,0 +1,259 @@
+import csv
+import io
+import json
+from collections import Counter
+from datetime import datetime, time
+from itertools import islice
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from projects.service.counters import TASK_STATUS_COUNTERS
+
+IMPORT_FORMATS = ("csv", "jsonl")
+
+# Rows validated and inserted per transaction.
+IMPORT_CHUNK_SIZE = 1000
+
+
+class RowError(ValueError):
+    pass
+
+
+def _text(row, key):
+    value = row.get(key)
+    return "" if value is None else str(value).strip()
+
+
+class ImportResult:
+    def __init__(self):
+        self.created = 0
+        self.errors = []
+        self.warnings = []
+
+    def add_error(self, line, message):
+        self.errors.append((line, message))
+
+    def add_warning(self, line, message):
+        self.warnings.append((line, message))
+
+
+def read_rows(stream, import_format):
+    """
+    Yield ``(line, row)`` from a binary or text ``stream`` of CSV (with a
+    header row) or JSON Lines, without reading the whole file. A JSON line
+    that does not parse is yielded as a ``RowError`` for its line.
+    """
+    if isinstance(stream, io.TextIOBase):
+        text = stream
+    else:
+        text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+
+    if import_format == "csv":
+        reader = csv.DictReader(text)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line, raw in enumerate(text, start=1):
+        if not raw.strip():
+            continue
+        try:
+            row = json.loads(raw)
+        except json.JSONDecodeError as error:
+            yield line, RowError(f"Invalid JSON: {error.msg}.")
+            continue
+        if not isinstance(row, dict):
+            row = RowError("Expected a JSON object.")
+        yield line, row
+
+
+class TaskImporter:
+    """
+    Create tasks in ``project`` from rows shaped like the task export:
+    ``title`` (required), ``description``, ``status``, ``assignee`` (a
+    member's username), ``deadline`` and ``tags`` (a list, or names joined
+    with ``;`` in CSV). Any other column is ignored.
+
+    Rows are validated and inserted ``chunk_size`` at a time, each chunk in
+    its own transaction with one ``bulk_create`` for the tasks and one for
+    their tag links. Tags are looked up by name, and the missing ones
+    created, once per chunk. Invalid rows are reported by line and
+    skipped; the rest of the file is still imported. A task whose assignee
+    is not a member of ``project`` is imported unassigned, with a warning.
+    """
+
+    def __init__(self, project, created_by, chunk_size=IMPORT_CHUNK_SIZE):
+        from projects.models import ProjectMembership, Task
+
+        self.project = project
+        self.created_by = created_by
+        self.chunk_size = chunk_size
+
+        self.members = dict(
+            ProjectMembership.objects.filter(project=project).values_list(
+                "user__username", "user_id"
+            )
+        )
+        self.statuses = {}
+        for value, label in Task.STATUS_CHOICES:
+            self.statuses[value] = value
+            self.statuses[label.lower()] = value
+        self.tags = {}
+
+    def clean(self, row):
+        from projects.models import Task
+
+        title = _text(row, "title")
+        if not title:
+            raise RowError("Title is required.")
+        max_length = Task._meta.get_field("title").max_length
+        if len(title) > max_length:
+            raise RowError(f"Title is longer than {max_length} characters.")
+
+        status = _text(row, "status") or "todo"
+        if status.lower() not in self.statuses:
+            raise RowError(f"Unknown status {status!r}.")
+
+        warnings = []
+        assignee = _text(row, "assignee")
+        if assignee and assignee not in self.members:
+            warnings.append(
+                f"Assignee {assignee!r} is not a member of this project; "
+                f"imported unassigned."
+            )
+
+        return {
+            "task": Task(
+                title=title,
+                description=_text(row, "description"),
+                status=self.statuses[status.lower()],
+                assignee_id=self.members.get(assignee),
+                deadline=self.clean_deadline(_text(row, "deadline")),
+                created_by=self.created_by,
+                project=self.project,
+            ),
+            "tags": self.clean_tags(row.get("tags")),
+            "warnings": warnings,
+        }
+
+    def clean_deadline(self, value):
+        if not value:
+            return None
+
+        try:
+            deadline = parse_datetime(value)
+            if deadline is None:
+                day = parse_date(value)
+                if day is None:
+                    raise ValueError
+                deadline = datetime.combine(day, time.min)
+        except ValueError:
+            raise RowError(f"Invalid deadline {value!r}.")
+
+        if timezone.is_naive(deadline):
+            deadline = timezone.make_aware(deadline)
+        return deadline
+
+    def clean_tags(self, value):
+        from projects.models import Tag
+
+        if not value:
+            return []
+        if isinstance(value, str):
+            value = value.split(";")
+        if not isinstance(value, list):
+            raise RowError("Tags must be a list of names.")
+
+        max_length = Tag._meta.get_field("name").max_length
+        names = []
+        for name in value:
+            name = str(name).strip()
+            if len(name) > max_length:
+                raise RowError(f"Tag {name[:20]!r}... is too long.")
+            if name and name not in names:
+                names.append(name)
+        return names
+
+    def resolve_tags(self, names):
+        """Fill ``self.tags`` with ids for ``names``, creating missing tags."""
+        from projects.models import Tag
+
+        missing = set(names) - self.tags.keys()
+        if not missing:
+            return
+
+        # Tag names are not unique; reuse the oldest tag of each name.
+        for pk, name in (
+            Tag.objects.filter(name__in=missing)
+            .order_by("-pk")
+            .values_list("pk", "name")
+        ):
+            self.tags[name] = pk
+
+        created = Tag.objects.bulk_create(
+            Tag(name=name) for name in sorted(missing - self.tags.keys())
+        )
+        for tag in created:
+            self.tags[tag.name] = tag.pk
+
+    def insert(self, cleaned):
+        from projects.models import Project, Task
+
+        with transaction.atomic():
+            self.resolve_tags(
+                {name for item in cleaned for name in item["tags"]}
+            )
+            tasks = Task.objects.bulk_create(item["task"] for item in cleaned)
+            Task.tags.through.objects.bulk_create(
+                Task.tags.through(task_id=task.pk, tag_id=self.tags[name])
+                for task, item in zip(tasks, cleaned)
+                for name in item["tags"]
+            )
+            # bulk_create skips the signals that keep these current.
+            Project.objects.touch(
+                self.project.pk,
+                **Counter(TASK_STATUS_COUNTERS[task.status] for task in tasks),
+            )
+
+        return len(tasks)
+
+    def run(self, rows):
+        """Import ``(line, row)`` pairs and return an ``ImportResult``."""
+        result = ImportResult()
+        rows = iter(rows)
+
+        try:
+            while chunk := list(islice(rows, self.chunk_size)):
+                self.import_chunk(chunk, result)
+        except (UnicodeDecodeError, csv.Error) as error:
+            result.add_error(None, f"Import stopped, unreadable file: {error}")
+
+        return result
+
+    def import_chunk(self, chunk, result):
+        cleaned = []
+        for line, row in chunk:
+            try:
+                if isinstance(row, RowError):
+                    raise row
+                item = self.clean(row)
+            except RowError as error:
+                result.add_error(line, str(error))
+                continue
+
+            cleaned.append(item)
+            for message in item["warnings"]:
+                result.add_warning(line, message)
+
+        if cleaned:
+            result.created += self.insert(cleaned)
+
+
+def import_tasks(
+    project, created_by, stream, import_format, chunk_size=IMPORT_CHUNK_SIZE
+):
+    """Import a CSV or JSON Lines ``stream`` of tasks into ``project``."""
+    importer = TaskImporter(project, created_by, chunk_size)
+    return importer.run(read_rows(stream, import_format))
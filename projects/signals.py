@@ -1,16 +1,196 @@
-from django.db.models.signals import post_save
+from django.contrib.auth import get_user_model
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
 from django.dispatch import receiver
+from django.utils import timezone
 
-from projects.models import ProjectRating
+from projects.models import (
+    Project,
+    ProjectApplication,
+    ProjectMembership,
+    ProjectOpenRole,
+    ProjectRating,
+    Task,
+)
+from projects.service.counters import (
+    counter_changes,
+    counter_field,
+    deleting_projects,
+)
+from projects.service.deferred import defer_once
+from projects.service.jobs import background_job, enqueue
+from projects.service.membership_cache import invalidate_membership_map
+from users.service.leaderboard import refresh_developers
+
+
+@background_job
+def refresh_member_scores(project_ids):
+    member_ids = set(
+        ProjectMembership.objects.filter(
+            project_id__in=project_ids
+        ).values_list("user_id", flat=True)
+    )
+
+    get_user_model().objects.update_avg_project_scores(member_ids)
+    refresh_developers(member_ids)
+
+
+def queue_member_scores(project_ids):
+    # The projects' scores are updated inline; their members' averages and
+    # leaderboard rows follow in the background, in one job per committed
+    # transaction however many ratings it touched.
+    project_ids = sorted(project_ids)
+    enqueue(
+        refresh_member_scores,
+        dedup_key=(
+            f"refresh_member_scores:{project_ids[0]}"
+            if len(project_ids) == 1
+            else None
+        ),
+        project_ids=project_ids,
+    )
 
 
 @receiver(post_save, sender=ProjectRating)
 def update_avg_score_signal(sender, instance, created, **kwargs):
     if created:
         project = instance.project
-        project.update_avg_score()
-        project.save()
+        project.add_rating(instance.score)
+
+        defer_once(queue_member_scores, project.pk)
+
+
+@receiver(post_delete, sender=ProjectRating)
+def remove_rating_signal(sender, instance, **kwargs):
+    if instance.project_id in deleting_projects():
+        return
+
+    project = Project.objects.filter(pk=instance.project_id).first()
+
+    if project:
+        project.remove_rating(instance.score)
+
+        defer_once(queue_member_scores, project.pk)
+
+
+@receiver(post_save, sender=ProjectMembership)
+@receiver(post_delete, sender=ProjectMembership)
+def membership_cache_membership_changed(sender, instance, **kwargs):
+    invalidate_membership_map(instance.user_id)
+
+
+@receiver(pre_save, sender=Project)
+def membership_cache_remember_owner(sender, instance, **kwargs):
+    update_fields = kwargs.get("update_fields")
+    if instance.pk is None or (
+        update_fields is not None and "owner" not in update_fields
+    ):
+        instance._previous_owner_id = instance.owner_id
+        return
+
+    instance._previous_owner_id = (
+        Project.objects.filter(pk=instance.pk)
+        .values_list("owner_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Project)
+def membership_cache_owner_changed(sender, instance, created, **kwargs):
+    previous_owner_id = getattr(instance, "_previous_owner_id", None)
+    if created or previous_owner_id != instance.owner_id:
+        invalidate_membership_map(previous_owner_id, instance.owner_id)
+
+
+@receiver(pre_delete, sender=Project)
+def membership_cache_project_deleted(sender, instance, **kwargs):
+    invalidate_membership_map(instance.owner_id)
+
+
+@receiver(post_save, sender=get_user_model())
+def membership_cache_developer_created(sender, instance, created, **kwargs):
+    if created:
+        invalidate_membership_map(instance.pk)
+
+
+# Tasks and applications can change the counter they are in (status or
+# project), so their previous state is read, and locked until the save
+# commits, before it is overwritten.
+@receiver(pre_save, sender=Task)
+@receiver(pre_save, sender=ProjectApplication)
+def counters_remember_previous(sender, instance, using, **kwargs):
+    update_fields = kwargs.get("update_fields")
+    if instance._state.adding:
+        instance._counted_as = None
+    elif update_fields is not None and not {
+        "status",
+        "project",
+        "project_id",
+    } & set(update_fields):
+        instance._counted_as = (instance.project_id, counter_field(instance))
+    else:
+        previous = (
+            sender._base_manager.using(using)
+            .select_for_update()
+            .filter(pk=instance.pk)
+            .first()
+        )
+        instance._counted_as = previous and (
+            previous.project_id,
+            counter_field(previous),
+        )
+
+
+# Every counted change also bumps ``Project.updated_at``, in the same UPDATE;
+# ratings do the same when they are applied.
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=ProjectApplication)
+@receiver(post_save, sender=ProjectMembership)
+@receiver(post_save, sender=ProjectOpenRole)
+def counters_row_saved(sender, instance, created, **kwargs):
+    current = (instance.project_id, counter_field(instance))
+    previous = None if created else getattr(instance, "_counted_as", current)
+
+    for project_id, deltas in counter_changes(previous, current).items():
+        Project.objects.touch(project_id, **deltas)
+
+
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=ProjectApplication)
+@receiver(post_delete, sender=ProjectMembership)
+@receiver(post_delete, sender=ProjectOpenRole)
+def counters_row_deleted(sender, instance, **kwargs):
+    if instance.project_id in deleting_projects():
+        return
+
+    field = counter_field(instance)
+    Project.objects.touch(
+        instance.project_id, **({field: -1} if field else {})
+    )
+
+
+# A cascade sends pre_delete for every collected row before deleting any,
+# and deletes the project last; in between, its rows need no bookkeeping
+# against a project that is about to go.
+@receiver(pre_delete, sender=Project)
+def counters_project_deleting(sender, instance, **kwargs):
+    deleting_projects().add(instance.pk)
+
+
+@receiver(post_delete, sender=Project)
+def counters_project_deleted(sender, instance, **kwargs):
+    deleting_projects().discard(instance.pk)
+
+
+@receiver(m2m_changed, sender=Task.tags.through)
+def touch_task_on_tags_changed(sender, instance, action, reverse, **kwargs):
+    if reverse or action not in ("post_add", "post_remove", "post_clear"):
+        return
 
-        for member in project.members.all():
-            member.set_avg_project_score()
-            member.save()
+    Task.objects.filter(pk=instance.pk).update(updated_at=timezone.now())
+    Project.objects.touch(instance.project_id)
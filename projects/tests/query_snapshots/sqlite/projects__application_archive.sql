@@ -0,0 +1,5 @@
+SELECT "django_session"."session_key", "django_session"."session_data", "django_session"."expire_date" FROM "django_session" WHERE ("django_session"."expire_date" > ? AND "django_session"."session_key" = ?) LIMIT ?
+SELECT "users_developer"."id", "users_developer"."password", "users_developer"."last_login", "users_developer"."is_superuser", "users_developer"."username", "users_developer"."first_name", "users_developer"."last_name", "users_developer"."email", "users_developer"."is_staff", "users_developer"."is_active", "users_developer"."date_joined", "users_developer"."position", "users_developer"."score", "users_developer"."tech_stack", "users_developer"."avg_projects_score", "users_developer"."linkedin_url", "users_developer"."portfolio_url", "users_developer"."github_url", "users_developer"."behance_url", "users_developer"."telegram_contact", "users_developer"."discord_contact" FROM "users_developer" WHERE "users_developer"."id" = ? LIMIT ?
+SELECT "projects_project"."id", "projects_project"."name", "projects_project"."description", "projects_project"."domain", "projects_project"."development_stage", "projects_project"."deploy_url", "projects_project"."owner_id", "projects_project"."open_to_candidates", "projects_project"."uid", "projects_project"."score", "projects_project"."ratings_count", "projects_project"."ratings_sum", "projects_project"."ratings_1", "projects_project"."ratings_2", "projects_project"."ratings_3", "projects_project"."ratings_4", "projects_project"."ratings_5", "projects_project"."member_count", "projects_project"."todo_count", "projects_project"."in_progress_count", "projects_project"."done_count", "projects_project"."pending_applications_count", "projects_project"."open_roles_count", "projects_project"."project_url", "projects_project"."created_at", "projects_project"."updated_at", EXISTS(SELECT ? AS "a" FROM "projects_projectrating" U0 WHERE (U0."project_id" = ("projects_project"."id") AND U0."rated_by_id" = ?) LIMIT ?) AS "is_rated", "users_developer"."id", "users_developer"."password", "users_developer"."last_login", "users_developer"."is_superuser", "users_developer"."username", "users_developer"."first_name", "users_developer"."last_name", "users_developer"."email", "users_developer"."is_staff", "users_developer"."is_active", "users_developer"."date_joined", "users_developer"."position", "users_developer"."score", "users_developer"."tech_stack", "users_developer"."avg_projects_score", "users_developer"."linkedin_url", "users_developer"."portfolio_url", "users_developer"."github_url", "users_developer"."behance_url", "users_developer"."telegram_contact", "users_developer"."discord_contact" FROM "projects_project" INNER JOIN "users_developer" ON ("projects_project"."owner_id" = "users_developer"."id") WHERE "projects_project"."id" = ? ORDER BY "projects_project"."id" ASC LIMIT ?
+SELECT COUNT(*) AS "__count" FROM "projects_projectapplication" WHERE ("projects_projectapplication"."project_id" = ? AND "projects_projectapplication"."status" IN (...))
+SELECT "projects_projectapplication"."id", "projects_projectapplication"."project_id", "projects_projectapplication"."user_id", "projects_projectapplication"."status", "projects_projectapplication"."message", "projects_projectapplication"."role_id", "projects_projectapplication"."created_at", "users_developer"."id", "users_developer"."password", "users_developer"."last_login", "users_developer"."is_superuser", "users_developer"."username", "users_developer"."first_name", "users_developer"."last_name", "users_developer"."email", "users_developer"."is_staff", "users_developer"."is_active", "users_developer"."date_joined", "users_developer"."position", "users_developer"."score", "users_developer"."tech_stack", "users_developer"."avg_projects_score", "users_developer"."linkedin_url", "users_developer"."portfolio_url", "users_developer"."github_url", "users_developer"."behance_url", "users_developer"."telegram_contact", "users_developer"."discord_contact", "projects_projectopenrole"."id", "projects_projectopenrole"."project_id", "projects_projectopenrole"."role_name", "projects_projectopenrole"."message", "projects_projectopenrole"."created_at" FROM "projects_projectapplication" INNER JOIN "users_developer" ON ("projects_projectapplication"."user_id" = "users_developer"."id") INNER JOIN "projects_projectopenrole" ON ("projects_projectapplication"."role_id" = "projects_projectopenrole"."id") WHERE ("projects_projectapplication"."project_id" = ? AND "projects_projectapplication"."status" IN (...)) ORDER BY "projects_projectapplication"."created_at" DESC, "projects_projectapplication"."id" DESC LIMIT ?
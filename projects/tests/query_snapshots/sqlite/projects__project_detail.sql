@@ -0,0 +1,8 @@
+SELECT "django_session"."session_key", "django_session"."session_data", "django_session"."expire_date" FROM "django_session" WHERE ("django_session"."expire_date" > ? AND "django_session"."session_key" = ?) LIMIT ?
+SELECT "users_developer"."id", "users_developer"."password", "users_developer"."last_login", "users_developer"."is_superuser", "users_developer"."username", "users_developer"."first_name", "users_developer"."last_name", "users_developer"."email", "users_developer"."is_staff", "users_developer"."is_active", "users_developer"."date_joined", "users_developer"."position", "users_developer"."score", "users_developer"."tech_stack", "users_developer"."avg_projects_score", "users_developer"."linkedin_url", "users_developer"."portfolio_url", "users_developer"."github_url", "users_developer"."behance_url", "users_developer"."telegram_contact", "users_developer"."discord_contact" FROM "users_developer" WHERE "users_developer"."id" = ? LIMIT ?
+SELECT "projects_project"."id", "projects_project"."name", "projects_project"."description", "projects_project"."domain", "projects_project"."development_stage", "projects_project"."deploy_url", "projects_project"."owner_id", "projects_project"."open_to_candidates", "projects_project"."uid", "projects_project"."score", "projects_project"."ratings_count", "projects_project"."ratings_sum", "projects_project"."ratings_1", "projects_project"."ratings_2", "projects_project"."ratings_3", "projects_project"."ratings_4", "projects_project"."ratings_5", "projects_project"."member_count", "projects_project"."todo_count", "projects_project"."in_progress_count", "projects_project"."done_count", "projects_project"."pending_applications_count", "projects_project"."open_roles_count", "projects_project"."project_url", "projects_project"."created_at", "projects_project"."updated_at", EXISTS(SELECT ? AS "a" FROM "projects_projectrating" U0 WHERE (U0."project_id" = ("projects_project"."id") AND U0."rated_by_id" = ?) LIMIT ?) AS "is_rated", "users_developer"."id", "users_developer"."password", "users_developer"."last_login", "users_developer"."is_superuser", "users_developer"."username", "users_developer"."first_name", "users_developer"."last_name", "users_developer"."email", "users_developer"."is_staff", "users_developer"."is_active", "users_developer"."date_joined", "users_developer"."position", "users_developer"."score", "users_developer"."tech_stack", "users_developer"."avg_projects_score", "users_developer"."linkedin_url", "users_developer"."portfolio_url", "users_developer"."github_url", "users_developer"."behance_url", "users_developer"."telegram_contact", "users_developer"."discord_contact" FROM "projects_project" INNER JOIN "users_developer" ON ("projects_project"."owner_id" = "users_developer"."id") WHERE "projects_project"."id" = ? ORDER BY "projects_project"."id" ASC LIMIT ?
+SELECT "col1", "col2", "col3", "col4", "col5", "col6", "col7", "col8", "col9", "col10" FROM ( SELECT * FROM ( SELECT "projects_task"."id" AS "col1", "projects_task"."title" AS "col2", "projects_task"."description" AS "col3", "projects_task"."status" AS "col4", "projects_task"."assignee_id" AS "col5", "projects_task"."created_by_id" AS "col6", "projects_task"."deadline" AS "col7", "projects_task"."created_at" AS "col8", "projects_task"."updated_at" AS "col9", "projects_task"."project_id" AS "col10", ROW_NUMBER() OVER (PARTITION BY "projects_task"."project_id" ORDER BY "projects_task"."created_at" DESC, "projects_task"."id" DESC) AS "qual0" FROM "projects_task" WHERE "projects_task"."project_id" IN (?) ORDER BY "projects_task"."created_at" DESC, "projects_task"."id" DESC ) "qualify" WHERE ("qual0" > ? AND "qual0" <= ?) ) "qualify_mask" ORDER BY "col8" DESC, "col1" DESC
+SELECT ("projects_task_tags"."task_id") AS "_prefetch_related_val_task_id", "projects_tag"."id", "projects_tag"."name" FROM "projects_tag" INNER JOIN "projects_task_tags" ON ("projects_tag"."id" = "projects_task_tags"."tag_id") WHERE "projects_task_tags"."task_id" IN (...)
+SELECT "col1", "col2", "col3", "col4", "col5", "col6", "col7", "col8", "col9", "col10", "col11", "col12", "col13", "col14", "col15", "col16", "col17", "col18", "col19", "col20", "col21", "col22", "col23", "col24", "col25", "col26", "col27" FROM ( SELECT * FROM ( SELECT "projects_projectrating"."id" AS "col1", "projects_projectrating"."project_id" AS "col2", "projects_projectrating"."rated_by_id" AS "col3", "projects_projectrating"."score" AS "col4", "projects_projectrating"."comment" AS "col5", "projects_projectrating"."created_at" AS "col6", ROW_NUMBER() OVER (PARTITION BY "projects_projectrating"."project_id" ORDER BY "projects_projectrating"."created_at" DESC, "projects_projectrating"."id" DESC) AS "qual0", "users_developer"."id" AS "col7", "users_developer"."password" AS "col8", "users_developer"."last_login" AS "col9", "users_developer"."is_superuser" AS "col10", "users_developer"."username" AS "col11", "users_developer"."first_name" AS "col12", "users_developer"."last_name" AS "col13", "users_developer"."email" AS "col14", "users_developer"."is_staff" AS "col15", "users_developer"."is_active" AS "col16", "users_developer"."date_joined" AS "col17", "users_developer"."position" AS "col18", "users_developer"."score" AS "col19", "users_developer"."tech_stack" AS "col20", "users_developer"."avg_projects_score" AS "col21", "users_developer"."linkedin_url" AS "col22", "users_developer"."portfolio_url" AS "col23", "users_developer"."github_url" AS "col24", "users_developer"."behance_url" AS "col25", "users_developer"."telegram_contact" AS "col26", "users_developer"."discord_contact" AS "col27" FROM "projects_projectrating" INNER JOIN "users_developer" ON ("projects_projectrating"."rated_by_id" = "users_developer"."id") WHERE "projects_projectrating"."project_id" IN (?) ORDER BY "projects_projectrating"."created_at" DESC, "projects_projectrating"."id" DESC ) "qualify" WHERE ("qual0" > ? AND "qual0" <= ?) ) "qualify_mask" ORDER BY "col6" DESC, "col1" DESC
+SELECT "col1", "col2", "col3", "col4", "col5" FROM ( SELECT * FROM ( SELECT "projects_projectopenrole"."id" AS "col1", "projects_projectopenrole"."project_id" AS "col2", "projects_projectopenrole"."role_name" AS "col3", "projects_projectopenrole"."message" AS "col4", "projects_projectopenrole"."created_at" AS "col5", ROW_NUMBER() OVER (PARTITION BY "projects_projectopenrole"."project_id" ORDER BY "projects_projectopenrole"."created_at" DESC, "projects_projectopenrole"."id" DESC) AS "qual0" FROM "projects_projectopenrole" WHERE "projects_projectopenrole"."project_id" IN (?) ORDER BY "projects_projectopenrole"."created_at" DESC, "projects_projectopenrole"."id" DESC ) "qualify" WHERE ("qual0" > ? AND "qual0" <= ?) ) "qualify_mask" ORDER BY "col5" DESC, "col1" DESC
+SELECT "projects_projectmembership"."id", "projects_projectmembership"."project_id", "projects_projectmembership"."user_id", "projects_projectmembership"."role", "projects_projectmembership"."edit_project_info_perm", "projects_projectmembership"."add_task_perm", "projects_projectmembership"."update_project_stage_perm", "projects_projectmembership"."manage_open_roles_perm", "projects_projectmembership"."joined_at", "users_developer"."id", "users_developer"."password", "users_developer"."last_login", "users_developer"."is_superuser", "users_developer"."username", "users_developer"."first_name", "users_developer"."last_name", "users_developer"."email", "users_developer"."is_staff", "users_developer"."is_active", "users_developer"."date_joined", "users_developer"."position", "users_developer"."score", "users_developer"."tech_stack", "users_developer"."avg_projects_score", "users_developer"."linkedin_url", "users_developer"."portfolio_url", "users_developer"."github_url", "users_developer"."behance_url", "users_developer"."telegram_contact", "users_developer"."discord_contact" FROM "projects_projectmembership" INNER JOIN "users_developer" ON ("projects_projectmembership"."user_id" = "users_developer"."id") WHERE "projects_projectmembership"."project_id" IN (?)
@@ -0,0 +1,5 @@
+SELECT "django_session"."session_key", "django_session"."session_data", "django_session"."expire_date" FROM "django_session" WHERE ("django_session"."expire_date" > ? AND "django_session"."session_key" = ?) LIMIT ?
+SELECT "users_developer"."id", "users_developer"."password", "users_developer"."last_login", "users_developer"."is_superuser", "users_developer"."username", "users_developer"."first_name", "users_developer"."last_name", "users_developer"."email", "users_developer"."is_staff", "users_developer"."is_active", "users_developer"."date_joined", "users_developer"."position", "users_developer"."score", "users_developer"."tech_stack", "users_developer"."avg_projects_score", "users_developer"."linkedin_url", "users_developer"."portfolio_url", "users_developer"."github_url", "users_developer"."behance_url", "users_developer"."telegram_contact", "users_developer"."discord_contact" FROM "users_developer" WHERE "users_developer"."id" = ? LIMIT ?
+SELECT COUNT(*) AS "__count" FROM "projects_task" WHERE "projects_task"."assignee_id" = ?
+SELECT "projects_task"."id", "projects_task"."title", "projects_task"."description", "projects_task"."status", "projects_task"."assignee_id", "projects_task"."created_by_id", "projects_task"."deadline", "projects_task"."created_at", "projects_task"."updated_at", "projects_task"."project_id", "users_developer"."id", "users_developer"."password", "users_developer"."last_login", "users_developer"."is_superuser", "users_developer"."username", "users_developer"."first_name", "users_developer"."last_name", "users_developer"."email", "users_developer"."is_staff", "users_developer"."is_active", "users_developer"."date_joined", "users_developer"."position", "users_developer"."score", "users_developer"."tech_stack", "users_developer"."avg_projects_score", "users_developer"."linkedin_url", "users_developer"."portfolio_url", "users_developer"."github_url", "users_developer"."behance_url", "users_developer"."telegram_contact", "users_developer"."discord_contact", T3."id", T3."password", T3."last_login", T3."is_superuser", T3."username", T3."first_name", T3."last_name", T3."email", T3."is_staff", T3."is_active", T3."date_joined", T3."position", T3."score", T3."tech_stack", T3."avg_projects_score", T3."linkedin_url", T3."portfolio_url", T3."github_url", T3."behance_url", T3."telegram_contact", T3."discord_contact", "projects_project"."id", "projects_project"."name", "projects_project"."description", "projects_project"."domain", "projects_project"."development_stage", "projects_project"."deploy_url", "projects_project"."owner_id", "projects_project"."open_to_candidates", "projects_project"."uid", "projects_project"."score", "projects_project"."ratings_count", "projects_project"."ratings_sum", "projects_project"."ratings_1", "projects_project"."ratings_2", "projects_project"."ratings_3", "projects_project"."ratings_4", "projects_project"."ratings_5", "projects_project"."member_count", "projects_project"."todo_count", "projects_project"."in_progress_count", "projects_project"."done_count", "projects_project"."pending_applications_count", "projects_project"."open_roles_count", "projects_project"."project_url", "projects_project"."created_at", "projects_project"."updated_at", T5."id", T5."password", T5."last_login", T5."is_superuser", T5."username", T5."first_name", T5."last_name", T5."email", T5."is_staff", T5."is_active", T5."date_joined", T5."position", T5."score", T5."tech_stack", T5."avg_projects_score", T5."linkedin_url", T5."portfolio_url", T5."github_url", T5."behance_url", T5."telegram_contact", T5."discord_contact" FROM "projects_task" INNER JOIN "users_developer" ON ("projects_task"."assignee_id" = "users_developer"."id") LEFT OUTER JOIN "users_developer" T3 ON ("projects_task"."created_by_id" = T3."id") INNER JOIN "projects_project" ON ("projects_task"."project_id" = "projects_project"."id") INNER JOIN "users_developer" T5 ON ("projects_project"."owner_id" = T5."id") WHERE "projects_task"."assignee_id" = ? LIMIT ?
+SELECT ("projects_task_tags"."task_id") AS "_prefetch_related_val_task_id", "projects_tag"."id", "projects_tag"."name" FROM "projects_tag" INNER JOIN "projects_task_tags" ON ("projects_tag"."id" = "projects_task_tags"."tag_id") WHERE "projects_task_tags"."task_id" IN (...)
@@ -0,0 +1,208 @@
+from django.contrib.auth import get_user_model
+from django.contrib.messages import get_messages
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from projects.models import (
+    Project,
+    ProjectApplication,
+    ProjectMembership,
+    ProjectOpenRole,
+)
+from projects.service.application_review import review_applications
+from projects.service.membership_cache import get_cached_membership
+from users.models import LeaderboardEntry
+
+user_model = get_user_model()
+
+
+class ReviewApplicationsTest(TestCase):
+    def setUp(self):
+        self.owner = user_model.objects.create_user(username="owner")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project = Project.objects.create(
+                name="Hack", owner=self.owner
+            )
+        self.role = ProjectOpenRole.objects.create(
+            project=self.project, role_name="LEAD"
+        )
+
+    def apply(self, username, project=None):
+        project = project or self.project
+        user = user_model.objects.create_user(username=username)
+        return ProjectApplication.objects.create(
+            project=project,
+            user=user,
+            role=ProjectOpenRole.objects.filter(project=project).first(),
+        )
+
+    def outcomes(self, result):
+        return [outcome for _, _, outcome in result.outcomes]
+
+    def test_approve_adds_members_and_updates_counters(self):
+        first, second = self.apply("alice"), self.apply("bob")
+        get_cached_membership(first.user_id, self.project.pk)
+        Project.objects.filter(pk=self.project.pk).update(score=4)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            result = review_applications(
+                self.project, [first.pk, second.pk], "approve"
+            )
+
+        self.assertEqual(self.outcomes(result), ["accepted", "accepted"])
+        self.assertEqual(
+            set(ProjectApplication.objects.values_list("status", flat=True)),
+            {"accepted"},
+        )
+        membership = ProjectMembership.objects.get(user=first.user)
+        self.assertEqual(membership.role, "LEAD")
+        self.assertIsNotNone(
+            get_cached_membership(first.user_id, self.project.pk)
+        )
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.member_count, 3)
+        self.assertEqual(self.project.pending_applications_count, 0)
+        self.assertEqual(
+            LeaderboardEntry.objects.get(developer=first.user).avg_score, 4
+        )
+
+    def test_reject_only_changes_statuses(self):
+        application = self.apply("alice")
+
+        result = review_applications(self.project, [application.pk], "reject")
+
+        self.assertEqual(result.usernames("rejected"), ["alice"])
+        application.refresh_from_db()
+        self.assertEqual(application.status, "rejected")
+        self.assertFalse(
+            ProjectMembership.objects.filter(user=application.user).exists()
+        )
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.member_count, 1)
+        self.assertEqual(self.project.pending_applications_count, 0)
+
+    def test_reports_items_it_cannot_review(self):
+        processed = self.apply("alice")
+        processed.status = "rejected"
+        processed.save()
+        member = self.apply("bob")
+        ProjectMembership.objects.create(
+            project=self.project, user=member.user
+        )
+        other = Project.objects.create(name="Other", owner=self.owner)
+        ProjectOpenRole.objects.create(project=other, role_name="DEV")
+        elsewhere = self.apply("carol", project=other)
+        twice = self.apply("dave")
+        again = ProjectApplication.objects.create(
+            project=self.project, user=twice.user, role=self.role
+        )
+
+        result = review_applications(
+            self.project,
+            [processed.pk, member.pk, elsewhere.pk, twice.pk, again.pk],
+            "approve",
+        )
+
+        self.assertEqual(
+            result.outcomes,
+            [
+                (processed.pk, "alice", "processed"),
+                (member.pk, "bob", "already_member"),
+                (elsewhere.pk, None, "missing"),
+                (twice.pk, "dave", "accepted"),
+                (again.pk, "dave", "already_member"),
+            ],
+        )
+        member.refresh_from_db()
+        self.assertEqual(member.status, "pending")
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.member_count, 3)
+        self.assertEqual(self.project.pending_applications_count, 2)
+
+    def test_query_count_does_not_grow_with_the_selection(self):
+        def count_queries(usernames):
+            ids = [self.apply(username).pk for username in usernames]
+            with CaptureQueriesContext(connection) as ctx:
+                review_applications(self.project, ids, "approve")
+            return len(ctx.captured_queries)
+
+        self.assertEqual(
+            count_queries(["a1", "a2"]),
+            count_queries([f"b{i}" for i in range(20)]),
+        )
+
+
+class BulkReviewViewTest(TestCase):
+    def setUp(self):
+        self.owner = user_model.objects.create_user(
+            username="owner", password="pass"
+        )
+        self.project = Project.objects.create(name="Hack", owner=self.owner)
+        role = ProjectOpenRole.objects.create(
+            project=self.project, role_name="DEV"
+        )
+        self.applications = [
+            ProjectApplication.objects.create(
+                project=self.project,
+                user=user_model.objects.create_user(username=username),
+                role=role,
+            )
+            for username in ("alice", "bob")
+        ]
+        self.url = reverse(
+            "projects:applications_list", args=[self.project.pk]
+        )
+
+    def post(self, **data):
+        return self.client.post(self.url, data)
+
+    def test_owner_approves_selected_applications(self):
+        self.client.login(username="owner", password="pass")
+
+        response = self.post(
+            decision="approve",
+            applications=[str(a.pk) for a in self.applications] + ["x"],
+        )
+
+        self.assertRedirects(response, self.url)
+        self.assertEqual(
+            [str(m) for m in get_messages(response.wsgi_request)],
+            ["Approved 2 application(s): alice, bob."],
+        )
+        self.assertEqual(
+            ProjectMembership.objects.filter(project=self.project).count(), 3
+        )
+
+    def test_requires_the_review_permission(self):
+        ProjectMembership.objects.create(
+            project=self.project,
+            user=user_model.objects.create_user(
+                username="member", password="pass"
+            ),
+        )
+        self.client.login(username="member", password="pass")
+
+        self.post(decision="reject", applications=[self.applications[0].pk])
+
+        self.applications[0].refresh_from_db()
+        self.assertEqual(self.applications[0].status, "pending")
+
+    def test_needs_a_decision_and_a_selection(self):
+        self.client.login(username="owner", password="pass")
+
+        response = self.post(decision="approve")
+
+        self.assertEqual(
+            [str(m) for m in get_messages(response.wsgi_request)],
+            ["Select the applications to approve or reject."],
+        )
+
+    def test_list_shows_checkboxes_to_reviewers(self):
+        self.client.login(username="owner", password="pass")
+
+        response = self.client.get(self.url)
+
+        self.assertContains(response, 'name="applications"', count=2)
+        self.assertContains(response, "Approve selected")
@@ -0,0 +1,103 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+
+from projects.models import Project, ProjectMembership, ProjectOpenRole, Task
+from projects.service.interface_bench import run_interface_benchmark
+from projects.views import ProjectDetailView, ProjectListView
+from users.views import DeveloperDetailView, LeaderboardView
+
+
+class AsyncReadViewsTest(TestCase):
+    def setUp(self):
+        self.owner = get_user_model().objects.create_user(
+            username="owner", password="pass"
+        )
+        self.project = Project.objects.create(
+            name="Async Hub", description="Served by ASGI", owner=self.owner
+        )
+        ProjectOpenRole.objects.create(project=self.project, role_name="DEV")
+        for index in range(3):
+            Task.objects.create(
+                title=f"Task {index}",
+                project=self.project,
+                created_by=self.owner,
+            )
+
+    def test_read_views_are_async(self):
+        for view in (
+            ProjectListView,
+            ProjectDetailView,
+            LeaderboardView,
+            DeveloperDetailView,
+        ):
+            self.assertTrue(view.view_is_async, view.__name__)
+
+    async def test_project_detail_under_asgi(self):
+        await self.async_client.aforce_login(self.owner)
+
+        response = await self.async_client.get(
+            reverse("projects:project_detail", args=[self.project.pk])
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["is_owner"])
+        self.assertEqual(response.context["tasks_total"], 3)
+        self.assertEqual(len(response.context["tasks"]), 3)
+        self.assertEqual(response.context["open_roles_total"], 1)
+        self.assertEqual(
+            [m.user for m in response.context["memberships"]], [self.owner]
+        )
+        self.assertIn('desc="', response["Server-Timing"])
+        self.assertNotIn('desc="0 queries"', response["Server-Timing"])
+
+    async def test_project_detail_missing_project(self):
+        response = await self.async_client.get(
+            reverse("projects:project_detail", args=[self.project.pk + 1])
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    async def test_project_list_under_asgi(self):
+        response = await self.async_client.get(
+            reverse("projects:project_list"), {"project_name": "async"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context["projects"]), [self.project])
+
+    async def test_leaderboard_and_profile_under_asgi(self):
+        await self.async_client.aforce_login(self.owner)
+
+        leaderboard = await self.async_client.get(reverse("users:leaderboard"))
+        profile = await self.async_client.get(
+            reverse("users:profile", args=[self.owner.pk])
+        )
+
+        self.assertEqual(leaderboard.status_code, 200)
+        self.assertEqual(profile.status_code, 200)
+        self.assertTrue(profile.context["is_developer"])
+        self.assertEqual(profile.context["projects"], [self.project])
+
+
+class InterfaceBenchmarkTest(TransactionTestCase):
+    def setUp(self):
+        owner = get_user_model().objects.create_user(
+            username="owner", password="pass"
+        )
+        project = Project.objects.create(name="Agile Hub", owner=owner)
+        ProjectMembership.objects.get_or_create(project=project, user=owner)
+
+    def test_replays_the_same_requests_on_both_interfaces(self):
+        results = run_interface_benchmark(
+            requests=10,
+            concurrency=2,
+            seed=3,
+            host="testserver",
+        )
+
+        for interface in ("wsgi", "asgi"):
+            self.assertEqual(results[interface]["requests"], 10)
+            self.assertEqual(results[interface]["errors"], 0)
+        self.assertGreater(results["speedup"]["throughput"], 0)
+        self.assertEqual(results["wsgi_threads"], 2)
@@ -0,0 +1,184 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+
+from projects.models import (
+    Project,
+    ProjectMembership,
+    ProjectOpenRole,
+    ProjectRating,
+    Tag,
+    Task,
+)
+
+user_model = get_user_model()
+
+
+class ProjectUpdatedAtTest(TestCase):
+    def setUp(self):
+        self.owner = user_model.objects.create_user(
+            username="owner", password="pass"
+        )
+        self.rater = user_model.objects.create_user(
+            username="rater", password="pass"
+        )
+        self.project = Project.objects.create(name="Stamp", owner=self.owner)
+        self.task = Task.objects.create(
+            title="Task", project=self.project, created_by=self.owner
+        )
+
+    def rewind(self):
+        past = timezone.now() - timedelta(days=1)
+        Project.objects.filter(pk=self.project.pk).update(updated_at=past)
+        Task.objects.filter(pk=self.task.pk).update(updated_at=past)
+        return past
+
+    def assertBumped(self, past):
+        self.project.refresh_from_db(fields=["updated_at"])
+        self.assertGreater(self.project.updated_at, past)
+
+    def test_project_save_bumps(self):
+        past = self.rewind()
+        self.project.open_to_candidates = True
+        self.project.save(update_fields=["open_to_candidates"])
+
+        self.assertBumped(past)
+
+    def test_task_changes_bump(self):
+        past = self.rewind()
+        self.task.status = "done"
+        self.task.save()
+        self.assertBumped(past)
+
+        past = self.rewind()
+        self.task.delete()
+        self.assertBumped(past)
+
+    def test_task_tags_bump_task_and_project(self):
+        past = self.rewind()
+        self.task.tags.add(Tag.objects.create(name="api"))
+
+        self.assertBumped(past)
+        self.task.refresh_from_db(fields=["updated_at"])
+        self.assertGreater(self.task.updated_at, past)
+
+    def test_membership_and_role_changes_bump(self):
+        past = self.rewind()
+        membership = ProjectMembership.objects.create(
+            project=self.project, user=self.rater
+        )
+        self.assertBumped(past)
+
+        past = self.rewind()
+        membership.delete()
+        self.assertBumped(past)
+
+        past = self.rewind()
+        ProjectOpenRole.objects.create(project=self.project, role_name="DEV")
+        self.assertBumped(past)
+
+    def test_ratings_bump(self):
+        past = self.rewind()
+        rating = ProjectRating.objects.create(
+            project=self.project, rated_by=self.rater, score=4
+        )
+        self.assertBumped(past)
+
+        past = self.rewind()
+        rating.delete()
+        self.assertBumped(past)
+
+
+class ConditionalDetailViewsTest(TestCase):
+    def setUp(self):
+        self.owner = user_model.objects.create_user(
+            username="owner", password="pass"
+        )
+        self.other = user_model.objects.create_user(
+            username="other", password="pass"
+        )
+        self.project = Project.objects.create(name="Cache", owner=self.owner)
+        self.task = Task.objects.create(
+            title="Task", project=self.project, created_by=self.owner
+        )
+        self.project_url = reverse(
+            "projects:project_detail", args=[self.project.pk]
+        )
+        self.task_url = reverse(
+            "projects:task_detail", args=[self.project.pk, self.task.pk]
+        )
+        self.client.force_login(self.owner)
+
+    def test_project_detail_not_modified(self):
+        first = self.client.get(self.project_url)
+        self.assertEqual(first.status_code, 200)
+        self.assertTrue(first["ETag"].startswith('W/"'))
+        self.assertIn("private", first["Cache-Control"])
+
+        with self.assertNumQueries(3):
+            # Session, user and the project access lookup.
+            second = self.client.get(
+                self.project_url, HTTP_IF_NONE_MATCH=first["ETag"]
+            )
+
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second["ETag"], first["ETag"])
+        self.assertEqual(second.content, b"")
+
+    def test_project_detail_if_modified_since(self):
+        first = self.client.get(self.project_url)
+
+        second = self.client.get(
+            self.project_url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]
+        )
+        stale = self.client.get(
+            self.project_url,
+            HTTP_IF_MODIFIED_SINCE=http_date(
+                (timezone.now() - timedelta(days=1)).timestamp()
+            ),
+        )
+
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(stale.status_code, 200)
+
+    def test_project_detail_changes_invalidate(self):
+        etag = self.client.get(self.project_url)["ETag"]
+        ProjectOpenRole.objects.create(project=self.project, role_name="DEV")
+
+        response = self.client.get(self.project_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_etag_is_per_user(self):
+        etag = self.client.get(self.project_url)["ETag"]
+        self.client.force_login(self.other)
+
+        response = self.client.get(self.project_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.context["is_owner"])
+
+    def test_task_detail_not_modified(self):
+        etag = self.client.get(self.task_url)["ETag"]
+
+        cached = self.client.get(self.task_url, HTTP_IF_NONE_MATCH=etag)
+        self.task.status = "done"
+        self.task.save()
+        changed = self.client.get(self.task_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(changed.context["task"].status, "done")
+
+    def test_task_detail_checks_permission_first(self):
+        etag = self.client.get(self.task_url)["ETag"]
+        self.client.logout()
+
+        response = self.client.get(self.task_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertNotEqual(response.status_code, 304)
@@ -0,0 +1,215 @@
+import io
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from projects.models import (
+    Project,
+    ProjectApplication,
+    ProjectMembership,
+    ProjectOpenRole,
+    Task,
+)
+from projects.service.counters import COUNTER_FIELDS
+from projects.service.task_import import import_tasks
+
+user_model = get_user_model()
+
+
+class ProjectCountersTest(TestCase):
+    def setUp(self):
+        self.owner = user_model.objects.create_user(
+            username="owner", password="pass"
+        )
+        self.project = Project.objects.create(name="Board", owner=self.owner)
+
+    def counters(self, project=None):
+        project = project or self.project
+        project.refresh_from_db()
+        return {field: getattr(project, field) for field in COUNTER_FIELDS}
+
+    def assertCounters(self, project=None, **expected):
+        counters = {field: 0 for field in COUNTER_FIELDS}
+        counters.update(expected)
+        self.assertEqual(self.counters(project), counters)
+
+    def test_owner_is_counted_as_member(self):
+        self.assertCounters(member_count=1)
+
+    def test_members(self):
+        developer = user_model.objects.create_user(username="dev")
+        ProjectMembership.objects.create(project=self.project, user=developer)
+        self.assertCounters(member_count=2)
+
+        developer.delete()
+        self.assertCounters(member_count=1)
+
+    def test_tasks_follow_status_changes(self):
+        task = Task.objects.create(title="One", project=self.project)
+        Task.objects.create(title="Two", project=self.project, status="done")
+        self.assertCounters(member_count=1, todo_count=1, done_count=1)
+
+        task.status = "in_progress"
+        task.save()
+        self.assertCounters(member_count=1, in_progress_count=1, done_count=1)
+
+        task.title = "Renamed"
+        task.save(update_fields=["title"])
+        self.assertCounters(member_count=1, in_progress_count=1, done_count=1)
+
+        task.delete()
+        self.assertCounters(member_count=1, done_count=1)
+
+    def test_task_moved_to_another_project(self):
+        other = Project.objects.create(name="Other", owner=self.owner)
+        task = Task.objects.create(title="One", project=self.project)
+
+        task.project = other
+        task.save()
+
+        self.assertCounters(member_count=1)
+        self.assertCounters(other, member_count=1, todo_count=1)
+
+    def test_open_roles_and_pending_applications(self):
+        applicant = user_model.objects.create_user(username="applicant")
+        with self.captureOnCommitCallbacks(execute=True):
+            role = ProjectOpenRole.objects.create(
+                project=self.project, role_name="DEV"
+            )
+        application = ProjectApplication.objects.create(
+            project=self.project, role=role, user=applicant
+        )
+        self.assertCounters(
+            member_count=1, open_roles_count=1, pending_applications_count=1
+        )
+        self.assertTrue(self.project.open_to_candidates)
+
+        application.status = "rejected"
+        application.save()
+        self.assertCounters(member_count=1, open_roles_count=1)
+
+        application.status = "pending"
+        application.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            role.delete()
+        self.assertCounters(member_count=1)
+        self.assertFalse(self.project.open_to_candidates)
+
+    def test_saving_a_stale_project_keeps_the_counters(self):
+        stale = Project.objects.get(pk=self.project.pk)
+        Task.objects.create(title="One", project=self.project)
+
+        stale.description = "Edited"
+        stale.save()
+
+        self.assertCounters(member_count=1, todo_count=1)
+        self.assertEqual(self.project.description, "Edited")
+
+    def test_changes_bump_updated_at(self):
+        before = self.project.updated_at
+
+        Task.objects.create(title="One", project=self.project)
+
+        self.project.refresh_from_db()
+        self.assertGreater(self.project.updated_at, before)
+
+    def test_task_import_counts_bulk_created_tasks(self):
+        import_tasks(
+            self.project,
+            self.owner,
+            io.BytesIO(b"title,status\nOne,todo\nTwo,done\nThree,done\n"),
+            "csv",
+        )
+
+        self.assertCounters(member_count=1, todo_count=1, done_count=2)
+
+    def test_deleting_the_project_cascades_cleanly(self):
+        Task.objects.create(title="One", project=self.project)
+        ProjectOpenRole.objects.create(project=self.project, role_name="DEV")
+
+        self.project.delete()
+
+        self.assertFalse(Project.objects.exists())
+
+    def test_project_deletion_does_not_touch_it_per_row(self):
+        def deletion_queries(tasks):
+            project = Project.objects.create(name="Doomed", owner=self.owner)
+            for index in range(tasks):
+                Task.objects.create(title=f"Task {index}", project=project)
+            with CaptureQueriesContext(connection) as ctx:
+                project.delete()
+            return [query["sql"] for query in ctx.captured_queries]
+
+        few, many = deletion_queries(2), deletion_queries(50)
+
+        self.assertEqual(len(few), len(many))
+        self.assertFalse(
+            [
+                sql
+                for sql in many
+                if sql.startswith('UPDATE "projects_project"')
+            ]
+        )
+        self.assertEqual(self.counters()["member_count"], 1)
+
+
+class RebuildProjectCountersCommandTest(TestCase):
+    def setUp(self):
+        owner = user_model.objects.create_user(username="owner")
+        self.project = Project.objects.create(name="Board", owner=owner)
+        Task.objects.create(title="One", project=self.project, status="done")
+        ProjectOpenRole.objects.create(project=self.project, role_name="DEV")
+        Project.objects.filter(pk=self.project.pk).update(
+            member_count=5, done_count=0, open_to_candidates=False
+        )
+
+    def test_reports_and_fixes_drift(self):
+        out = StringIO()
+        call_command("rebuild_project_counters", stdout=out)
+
+        self.project.refresh_from_db()
+        self.assertIn("member_count 5 -> 1", out.getvalue())
+        self.assertIn("1 project(s) drifted, fixed.", out.getvalue())
+        self.assertEqual(self.project.member_count, 1)
+        self.assertEqual(self.project.done_count, 1)
+        self.assertTrue(self.project.open_to_candidates)
+
+    def test_dry_run_writes_nothing(self):
+        out = StringIO()
+        call_command("rebuild_project_counters", dry_run=True, stdout=out)
+
+        self.project.refresh_from_db()
+        self.assertIn("(dry run)", out.getvalue())
+        self.assertEqual(self.project.member_count, 5)
+
+
+class CounterViewsTest(TestCase):
+    def setUp(self):
+        self.owner = user_model.objects.create_user(
+            username="owner", password="pass"
+        )
+        self.project = Project.objects.create(name="Board", owner=self.owner)
+        for status in ("todo", "done", "done", "done"):
+            Task.objects.create(
+                title=status, project=self.project, status=status
+            )
+
+    def test_detail_shows_progress_and_team_size(self):
+        response = self.client.get(
+            reverse("projects:project_detail", args=[self.project.pk])
+        )
+
+        self.assertEqual(response.context["tasks_total"], 4)
+        self.assertContains(response, "3/4 done")
+        self.assertContains(response, "width: 75%")
+        self.assertContains(response, "<strong>Team size:</strong>")
+
+    def test_list_shows_progress(self):
+        response = self.client.get(reverse("projects:project_list"))
+
+        self.assertContains(response, "3/4 tasks done")
@@ -0,0 +1,122 @@
+from asgiref.sync import sync_to_async
+from django.contrib.sessions.models import Session
+from django.http import HttpResponse
+from django.test import (
+    RequestFactory,
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+
+from projects.db_router import (
+    STICKY_COOKIE,
+    PrimaryReplicaRouter,
+    ReplicaRoutingMiddleware,
+)
+from projects.models import Project, Tag, Task
+
+router = PrimaryReplicaRouter()
+
+
+def serve(request, write=False):
+    """Run a view through the middleware, noting where its reads go."""
+    reads = []
+
+    def view(request):
+        reads.append(router.db_for_read(Task))
+        if write:
+            Tag.objects.create(name="written")
+            reads.append(router.db_for_read(Task))
+        return HttpResponse()
+
+    response = ReplicaRoutingMiddleware(view)(request)
+    return reads, response
+
+
+@override_settings(DATABASE_REPLICAS=["replica"], REPLICA_STICKY_SECONDS=10)
+class PrimaryReplicaRouterTest(SimpleTestCase):
+    def test_reads_outside_a_request_use_the_primary(self):
+        self.assertEqual(router.db_for_read(Task), "default")
+
+    def test_get_reads_from_a_replica(self):
+        reads, response = serve(RequestFactory().get("/"))
+
+        self.assertEqual(reads, ["replica"])
+        self.assertNotIn(STICKY_COOKIE, response.cookies)
+
+    def test_sessions_are_read_from_the_primary(self):
+        reads = []
+
+        def view(request):
+            reads.append(router.db_for_read(Session))
+            return HttpResponse()
+
+        ReplicaRoutingMiddleware(view)(RequestFactory().get("/"))
+
+        self.assertEqual(reads, ["default"])
+
+    def test_unsafe_methods_use_the_primary(self):
+        reads, _ = serve(RequestFactory().post("/"))
+
+        self.assertEqual(reads, ["default"])
+
+    def test_writes_always_go_to_the_primary(self):
+        self.assertEqual(router.db_for_write(Task), "default")
+        self.assertFalse(router.allow_migrate("replica", "projects"))
+        self.assertTrue(router.allow_migrate("default", "projects"))
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_without_replicas_everything_uses_the_primary(self):
+        reads, response = serve(RequestFactory().get("/"))
+
+        self.assertEqual(reads, ["default"])
+        self.assertNotIn(STICKY_COOKIE, response.cookies)
+
+    async def test_routing_state_reaches_async_views(self):
+        reads = []
+
+        async def view(request):
+            reads.append(await sync_to_async(router.db_for_read)(Task))
+            return HttpResponse()
+
+        await ReplicaRoutingMiddleware(view)(RequestFactory().get("/"))
+
+        self.assertEqual(reads, ["replica"])
+
+
+@override_settings(DATABASE_REPLICAS=["replica"], REPLICA_STICKY_SECONDS=10)
+class PrimaryReplicaWriteTest(TransactionTestCase):
+    def test_write_pins_the_rest_of_the_request_and_the_next_ones(self):
+        reads, response = serve(RequestFactory().get("/"), write=True)
+
+        self.assertEqual(reads, ["replica", "default"])
+        self.assertEqual(response.cookies[STICKY_COOKIE]["max-age"], 10)
+
+        request = RequestFactory().get("/")
+        request.COOKIES[STICKY_COOKIE] = "1"
+        reads, _ = serve(request)
+        self.assertEqual(reads, ["default"])
+
+    def test_assigning_a_relation_is_not_a_write(self):
+        def view(request):
+            Task(project=Project(pk=1))
+            return HttpResponse()
+
+        response = ReplicaRoutingMiddleware(view)(RequestFactory().get("/"))
+
+        self.assertNotIn(STICKY_COOKIE, response.cookies)
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+class PrimaryReplicaTransactionTest(TestCase):
+    def test_reads_inside_a_transaction_use_the_primary(self):
+        reads = []
+
+        def view(request):
+            reads.append(router.db_for_read(Task))
+            return HttpResponse()
+
+        ReplicaRoutingMiddleware(view)(RequestFactory().get("/"))
+
+        self.assertEqual(reads, ["default"])
@@ -0,0 +1,82 @@
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from projects.models import Job, Project, ProjectOpenRole, ProjectRating
+from projects.service.deferred import defer_once
+
+user_model = get_user_model()
+
+
+class DeferOnceTest(TestCase):
+    def setUp(self):
+        self.calls = []
+
+    def action(self, keys):
+        self.calls.append(sorted(keys))
+
+    def test_runs_once_per_commit_with_every_key(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            defer_once(self.action, 1)
+            defer_once(self.action, 2, 3)
+            defer_once(self.action, 1)
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(self.calls, [[1, 2, 3]])
+
+    def test_rolled_back_batches_are_dropped(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    defer_once(self.action, 1)
+                    raise ValueError
+            except ValueError:
+                pass
+
+            defer_once(self.action, 2)
+
+        self.assertEqual(self.calls, [[2]])
+
+
+class CoalescedSideEffectsTest(TestCase):
+    def setUp(self):
+        self.owner = user_model.objects.create_user(username="owner")
+        self.project = Project.objects.create(name="Board", owner=self.owner)
+
+    def test_open_roles_update_open_to_candidates_once(self):
+        with CaptureQueriesContext(connection) as ctx:
+            with self.captureOnCommitCallbacks(execute=True):
+                with transaction.atomic():
+                    for i in range(100):
+                        ProjectOpenRole.objects.create(
+                            project=self.project, role_name=f"Role {i}"
+                        )
+
+        updates = [
+            query["sql"]
+            for query in ctx.captured_queries
+            if query["sql"].startswith("UPDATE")
+            and "open_to_candidates" in query["sql"]
+        ]
+        self.assertEqual(len(updates), 1)
+        self.project.refresh_from_db()
+        self.assertTrue(self.project.open_to_candidates)
+        self.assertEqual(self.project.open_roles_count, 100)
+
+    @override_settings(JOBS_RUN_INLINE=False)
+    def test_ratings_queue_one_member_score_job(self):
+        other = Project.objects.create(name="Other", owner=self.owner)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(5):
+                rater = user_model.objects.create_user(username=f"rater-{i}")
+                for project in (self.project, other):
+                    ProjectRating.objects.create(
+                        project=project, rated_by=rater, score=4
+                    )
+
+        job = Job.objects.get()
+        self.assertEqual(
+            job.kwargs, {"project_ids": sorted([self.project.pk, other.pk])}
+        )
@@ -0,0 +1,154 @@
+import csv
+import io
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from projects.models import (
+    Project,
+    ProjectApplication,
+    ProjectMembership,
+    ProjectOpenRole,
+    Tag,
+    Task,
+)
+from projects.service.export import EXPORTS, export_lines
+
+user_model = get_user_model()
+
+
+class ProjectExportTest(TestCase):
+    def setUp(self):
+        self.owner = user_model.objects.create_user(
+            username="owner", password="pass"
+        )
+        self.member = user_model.objects.create_user(
+            username="member", password="pass"
+        )
+        self.applicant = user_model.objects.create_user(
+            username="applicant", password="pass"
+        )
+        self.project = Project.objects.create(name="Export", owner=self.owner)
+        ProjectMembership.objects.create(
+            project=self.project, user=self.member
+        )
+        role = ProjectOpenRole.objects.create(
+            project=self.project, role_name="DEV"
+        )
+        ProjectApplication.objects.create(
+            project=self.project,
+            user=self.applicant,
+            role=role,
+            message="Hire me, please",
+        )
+
+        api, ui = Tag.objects.create(name="api"), Tag.objects.create(name="ui")
+        for index in range(3):
+            task = Task.objects.create(
+                title=f"Task {index}",
+                project=self.project,
+                created_by=self.owner,
+                assignee=self.member if index else None,
+            )
+            if index == 2:
+                # Tasks outlive the developer who created them.
+                task.created_by = None
+                task.save()
+            task.tags.add(api, ui)
+
+    def url(self, export):
+        return reverse(
+            f"projects:project_export_{export}", args=[self.project.pk]
+        )
+
+    def read(self, response):
+        return b"".join(response.streaming_content).decode()
+
+    def test_tasks_as_csv(self):
+        self.client.force_login(self.member)
+
+        response = self.client.get(self.url("tasks"))
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertIn(
+            f"project-{self.project.pk}-tasks.csv",
+            response["Content-Disposition"],
+        )
+        rows = list(csv.DictReader(io.StringIO(self.read(response))))
+        self.assertEqual(
+            [row["title"] for row in rows], ["Task 0", "Task 1", "Task 2"]
+        )
+        self.assertEqual(rows[0]["assignee"], "")
+        self.assertEqual(rows[1]["assignee"], "member")
+        self.assertEqual(rows[0]["tags"], "api;ui")
+        self.assertEqual(rows[2]["created_by"], "")
+
+    def test_applications_as_json_lines(self):
+        self.client.force_login(self.owner)
+
+        response = self.client.get(
+            self.url("applications"), {"format": "jsonl"}
+        )
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in self.read(response).splitlines()]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["user"], "applicant")
+        self.assertEqual(rows[0]["role"], "DEV")
+        self.assertEqual(rows[0]["message"], "Hire me, please")
+
+    def test_exports_respect_project_permissions(self):
+        for user, export in (
+            (self.member, "applications"),
+            (self.member, "memberships"),
+            (self.applicant, "tasks"),
+        ):
+            with self.subTest(user=user.username, export=export):
+                self.client.force_login(user)
+                response = self.client.get(self.url(export))
+
+                self.assertFalse(response.streaming)
+                self.assertTemplateUsed(
+                    response, "projects/no_permission.html"
+                )
+
+    def test_memberships_for_owner(self):
+        self.client.force_login(self.owner)
+
+        response = self.client.get(self.url("memberships"))
+
+        rows = list(csv.DictReader(io.StringIO(self.read(response))))
+        self.assertEqual({row["user"] for row in rows}, {"owner", "member"})
+        self.assertIn("manage_open_roles_perm", rows[0])
+
+    def test_unknown_format(self):
+        self.client.force_login(self.owner)
+
+        response = self.client.get(self.url("tasks"), {"format": "xlsx"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_reads_in_chunks(self):
+        fields, queryset, row = EXPORTS["tasks"](self.project.pk)
+
+        # One cursor fetched two rows at a time, one tags query per chunk.
+        with self.assertNumQueries(3):
+            lines = list(export_lines(fields, queryset, row, "csv", 2))
+
+        self.assertEqual(len(lines), 4)
+
+    async def test_streams_asynchronously_under_asgi(self):
+        await self.async_client.aforce_login(self.member)
+
+        response = await self.async_client.get(
+            self.url("tasks"), {"format": "jsonl"}
+        )
+
+        self.assertTrue(response.is_async)
+        content = b"".join([part async for part in response])
+        rows = [json.loads(line) for line in content.decode().splitlines()]
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0]["tags"], ["api", "ui"])
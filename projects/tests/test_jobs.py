@@ -0,0 +1,186 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from projects.models import Job, Project, ProjectMembership, ProjectRating
+from projects.service.jobs import (
+    LOCK_TIMEOUT,
+    background_job,
+    claim_job,
+    enqueue,
+    purge_finished,
+    queue_stats,
+    render_queue_stats,
+    run_job,
+)
+
+user_model = get_user_model()
+
+calls = []
+
+
+@background_job
+def record(label):
+    calls.append(label)
+
+
+@background_job
+def explode():
+    raise RuntimeError("boom")
+
+
+@override_settings(JOBS_RUN_INLINE=False)
+class JobQueueTest(TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def work(self):
+        call_command("run_workers", burst=True, stdout=StringIO())
+
+    def test_enqueue_stores_the_job(self):
+        job = enqueue(record, priority=3, label="a")
+
+        job.refresh_from_db()
+        self.assertEqual(job.name, record.job_name)
+        self.assertEqual(job.kwargs, {"label": "a"})
+        self.assertEqual((job.status, job.priority), ("queued", 3))
+        self.assertEqual(calls, [])
+
+    def test_rejects_unknown_handlers(self):
+        with self.assertRaises(LookupError):
+            enqueue("projects.nowhere", label="a")
+
+    def test_rolled_back_jobs_are_discarded(self):
+        with self.assertRaises(ValueError):
+            with transaction.atomic():
+                enqueue(record, label="a")
+                raise ValueError
+
+        self.assertFalse(Job.objects.exists())
+
+    def test_dedup_key_reuses_a_waiting_job(self):
+        first = enqueue(record, dedup_key="k", label="a")
+        self.assertEqual(enqueue(record, dedup_key="k", label="b"), first)
+
+        claim_job("worker")
+        second = enqueue(record, dedup_key="k", label="c")
+
+        self.assertNotEqual(second, first)
+        self.assertEqual(Job.objects.count(), 2)
+
+    def test_workers_run_jobs_by_priority(self):
+        enqueue(record, label="low")
+        enqueue(record, priority=5, label="high")
+        enqueue(record, delay=60, label="later")
+
+        self.work()
+
+        self.assertEqual(calls, ["high", "low"])
+        self.assertEqual(
+            sorted(Job.objects.values_list("status", flat=True)),
+            ["done", "done", "queued"],
+        )
+
+    def test_a_job_is_claimed_once(self):
+        enqueue(record, label="a")
+
+        self.assertIsNotNone(claim_job("one"))
+        self.assertIsNone(claim_job("two"))
+
+    def test_failures_back_off_then_give_up(self):
+        job = enqueue(explode, max_attempts=2)
+
+        with self.assertLogs("projects.service.jobs", "ERROR"):
+            run_job(claim_job("worker"))
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ("queued", 1))
+        self.assertIn("RuntimeError: boom", job.last_error)
+        self.assertGreaterEqual(
+            job.run_at, timezone.now() + timedelta(seconds=9)
+        )
+
+        Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+        with self.assertLogs("projects.service.jobs", "ERROR"):
+            run_job(claim_job("worker"))
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ("failed", 2))
+        self.assertIsNotNone(job.finished_at)
+
+    def test_jobs_of_a_dead_worker_are_reclaimed(self):
+        job = enqueue(record, label="a")
+        claim_job("dead")
+        Job.objects.filter(pk=job.pk).update(
+            started_at=timezone.now() - timedelta(seconds=LOCK_TIMEOUT + 1)
+        )
+
+        self.work()
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ("done", 2))
+        self.assertEqual(calls, ["a"])
+
+    def test_purge_finished(self):
+        enqueue(record, label="a")
+        self.work()
+        Job.objects.update(finished_at=timezone.now() - timedelta(days=2))
+
+        self.assertEqual(purge_finished(), 1)
+
+    def test_queue_metrics(self):
+        enqueue(record, label="a")
+        enqueue(record, label="b")
+        self.work()
+        enqueue(record, label="c")
+
+        metrics = render_queue_stats(queue_stats(), "teammate")
+
+        self.assertIn('teammate_job_queue_depth{status="queued"} 1', metrics)
+        self.assertIn('teammate_job_queue_depth{status="done"} 2', metrics)
+        self.assertIn("teammate_job_queue_oldest_age_seconds ", metrics)
+        self.assertIn("teammate_job_window_finished 2", metrics)
+        self.assertIn("# TYPE teammate_job_wait_seconds_p95 gauge", metrics)
+        self.assertIn("teammate_job_run_seconds_p50 ", metrics)
+        self.assertNotIn("histogram", metrics)
+
+    def test_rating_fan_out_runs_in_the_background(self):
+        owner = user_model.objects.create_user(username="owner")
+        rater = user_model.objects.create_user(username="rater")
+        project = Project.objects.create(name="Rated", owner=owner)
+        member = ProjectMembership.objects.get(project=project)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ProjectRating.objects.create(
+                project=project, rated_by=rater, score=4
+            )
+            ProjectRating.objects.create(
+                project=project,
+                rated_by=user_model.objects.create_user(username="rater-2"),
+                score=2,
+            )
+
+        self.assertEqual(Job.objects.filter(status="queued").count(), 1)
+        member.user.refresh_from_db()
+        self.assertEqual(member.user.avg_projects_score, 0)
+
+        self.work()
+
+        member.user.refresh_from_db()
+        self.assertEqual(member.user.avg_projects_score, 3)
+
+
+class InlineJobsTest(TestCase):
+    @override_settings(JOBS_RUN_INLINE=True)
+    def test_runs_handlers_right_away(self):
+        calls.clear()
+
+        self.assertIsNone(enqueue(record, label="now"))
+
+        self.assertEqual(calls, ["now"])
+        self.assertFalse(Job.objects.exists())
@@ -0,0 +1,52 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, TransactionTestCase
+
+from projects.management.commands.load_test import parse_mix
+from projects.models import Project, ProjectOpenRole, Task
+from projects.service.load_test import percentile, run_load_test
+
+
+class LoadTestHelpersTest(SimpleTestCase):
+    def test_percentile_uses_nearest_rank(self):
+        values = list(range(1, 101))
+
+        self.assertEqual(percentile(values, 0.50), 50)
+        self.assertEqual(percentile(values, 0.95), 95)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+    def test_parse_mix(self):
+        self.assertEqual(
+            parse_mix("browse=3,rate=1"), {"browse": 3, "rate": 1}
+        )
+        with self.assertRaises(CommandError):
+            parse_mix("unknown=1")
+
+
+class LoadTestRunTest(TransactionTestCase):
+    def setUp(self):
+        user_model = get_user_model()
+        owner = user_model.objects.create_user(
+            username="owner", password="pass"
+        )
+        user_model.objects.create_user(username="visitor", password="pass")
+        project = Project.objects.create(
+            name="Agile Hub",
+            owner=owner,
+            development_stage="deployed",
+            deploy_url="http://example.com",
+        )
+        ProjectOpenRole.objects.create(project=project, role_name="DEV")
+        Task.objects.create(title="Task", project=project, created_by=owner)
+
+    def test_reports_every_view_it_hit(self):
+        results = run_load_test(
+            users=1, iterations=8, seed=3, host="testserver"
+        )
+
+        self.assertEqual(results["errors"], 0)
+        self.assertGreater(results["requests"], 0)
+        for route in results["routes"].values():
+            self.assertLessEqual(route["p50_ms"], route["p99_ms"])
+            self.assertGreater(route["queries_per_request"], 0)
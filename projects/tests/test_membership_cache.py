@@ -0,0 +1,91 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from projects.models import Project, ProjectMembership
+from projects.service.membership_cache import (
+    get_cached_membership,
+    get_membership_map,
+    membership_cache_stats,
+    reset_membership_cache_stats,
+)
+
+
+class MembershipCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        reset_membership_cache_stats()
+
+        user_model = get_user_model()
+        self.owner = user_model.objects.create_user(
+            username="owner", password="ownerpass"
+        )
+        self.member = user_model.objects.create_user(
+            username="member", password="memberpass"
+        )
+        self.project = Project.objects.create(
+            name="Cached", description="Cached project", owner=self.owner
+        )
+        self.membership = ProjectMembership.objects.create(
+            project=self.project,
+            user=self.member,
+            role="LEAD",
+            add_task_perm=True,
+        )
+
+    def test_warm_cache_is_query_free(self):
+        get_membership_map(self.member.pk)
+
+        with self.assertNumQueries(0):
+            entry = get_cached_membership(self.member.pk, self.project.pk)
+
+        self.assertEqual(entry["role"], "LEAD")
+        self.assertTrue(entry["add_task_perm"])
+        self.assertFalse(entry["edit_project_info_perm"])
+        self.assertFalse(entry["is_owner"])
+
+    def test_hit_and_miss_counters(self):
+        get_membership_map(self.member.pk)
+        get_membership_map(self.member.pk)
+        get_membership_map(self.member.pk)
+
+        stats = membership_cache_stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 2)
+        self.assertAlmostEqual(stats["hit_ratio"], 2 / 3)
+
+    def test_membership_update_invalidates(self):
+        get_membership_map(self.member.pk)
+
+        self.membership.edit_project_info_perm = True
+        self.membership.save()
+
+        entry = get_cached_membership(self.member.pk, self.project.pk)
+        self.assertTrue(entry["edit_project_info_perm"])
+
+    def test_membership_delete_invalidates(self):
+        get_membership_map(self.member.pk)
+
+        self.membership.delete()
+
+        self.assertIsNone(
+            get_cached_membership(self.member.pk, self.project.pk)
+        )
+
+    def test_owner_change_invalidates_both_owners(self):
+        self.assertTrue(
+            get_membership_map(self.owner.pk)[self.project.pk]["is_owner"]
+        )
+        self.assertFalse(
+            get_membership_map(self.member.pk)[self.project.pk]["is_owner"]
+        )
+
+        self.project.owner = self.member
+        self.project.save()
+
+        self.assertFalse(
+            get_membership_map(self.owner.pk)[self.project.pk]["is_owner"]
+        )
+        self.assertTrue(
+            get_membership_map(self.member.pk)[self.project.pk]["is_owner"]
+        )
@@ -0,0 +1,111 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from projects.models import Project
+from projects.service.db_pool import pool_stats, render_pool_stats
+from projects.service.membership_cache import get_cached_membership
+from projects.service.metrics import registry
+
+METRICS_URL = reverse("projects:metrics")
+
+
+@override_settings(METRICS_TOKEN="secret")
+class RequestMetricsTest(TestCase):
+    def setUp(self):
+        registry.reset()
+        owner = get_user_model().objects.create_user(
+            username="owner", password="pass"
+        )
+        self.project = Project.objects.create(name="Measured", owner=owner)
+
+    def test_server_timing_header(self):
+        response = self.client.get(
+            reverse("projects:project_detail", args=[self.project.pk])
+        )
+
+        timing = response["Server-Timing"]
+        self.assertIn("total;dur=", timing)
+        self.assertIn("db;dur=", timing)
+        self.assertIn("tpl;dur=", timing)
+
+    def test_metrics_are_aggregated_per_view(self):
+        self.client.get(reverse("projects:project_list"))
+        self.client.get(reverse("projects:project_list"))
+
+        response = self.client.get(
+            METRICS_URL, HTTP_AUTHORIZATION="Bearer secret"
+        )
+
+        body = response.content.decode()
+        self.assertIn(
+            "# TYPE teammate_request_duration_seconds histogram", body
+        )
+        self.assertIn(
+            'teammate_request_duration_seconds_count{view="ProjectListView"} 2',
+            body,
+        )
+        self.assertIn(
+            'teammate_db_queries_bucket{view="ProjectListView",le="+Inf"} 2',
+            body,
+        )
+
+    def test_membership_cache_counters(self):
+        cache.clear()
+        owner_id = self.project.owner_id
+        get_cached_membership(owner_id, self.project.pk)
+        get_cached_membership(owner_id, self.project.pk)
+
+        response = self.client.get(
+            METRICS_URL, HTTP_AUTHORIZATION="Bearer secret"
+        )
+
+        body = response.content.decode()
+        self.assertIn(
+            "# TYPE teammate_membership_cache_hits_total counter", body
+        )
+        self.assertIn("teammate_membership_cache_hits_total 1\n", body)
+        self.assertIn("teammate_membership_cache_misses_total 1\n", body)
+
+    def test_metrics_require_token(self):
+        response = self.client.get(METRICS_URL)
+
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(METRICS_TOKEN="")
+    def test_metrics_hidden_without_token_outside_debug(self):
+        response = self.client.get(METRICS_URL)
+
+        self.assertEqual(response.status_code, 404)
+
+
+class PoolMetricsTest(SimpleTestCase):
+    def test_render_pool_stats(self):
+        body = render_pool_stats(
+            {
+                "default": {
+                    "pool_max": 10,
+                    "pool_size": 4,
+                    "checked_out": 3,
+                    "requests_wait_ms": 1500,
+                    "requests_errors": 2,
+                }
+            },
+            "teammate",
+        )
+
+        self.assertIn("# TYPE teammate_db_pool_checked_out gauge", body)
+        self.assertIn('teammate_db_pool_checked_out{alias="default"} 3', body)
+        self.assertIn(
+            'teammate_db_pool_wait_seconds_total{alias="default"} 1.5', body
+        )
+        self.assertIn(
+            'teammate_db_pool_timeouts_total{alias="default"} 2', body
+        )
+        self.assertIn(
+            'teammate_db_pool_requests_queued_total{alias="default"} 0', body
+        )
+
+    def test_no_pool_stats_without_a_pool(self):
+        self.assertEqual(pool_stats(), {})
@@ -1,5 +1,11 @@
+from decimal import Decimal
+from io import StringIO
+
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from projects.models import (
     Project,
@@ -72,12 +78,14 @@ class ModelsTestCase(TestCase):
 
         self.assertFalse(project.open_to_candidates)
 
-        ProjectOpenRole.objects.create(project=project)
+        with self.captureOnCommitCallbacks(execute=True):
+            ProjectOpenRole.objects.create(project=project)
 
         project = Project.objects.get(pk=project.pk)
         self.assertTrue(project.open_to_candidates)
 
-        ProjectOpenRole.objects.filter(project=project).first().delete()
+        with self.captureOnCommitCallbacks(execute=True):
+            ProjectOpenRole.objects.filter(project=project).first().delete()
 
         project = Project.objects.get(pk=project.pk)
         self.assertFalse(project.open_to_candidates)
@@ -190,3 +198,90 @@ class ModelsTestCase(TestCase):
         role = ProjectOpenRole.objects.create(project=project, role_name="DEV")
 
         self.assertEqual(str(role), f"{project.name} - {role.role_name}")
+
+    def rate_with_members(self, member_count, rater_name):
+        project = Project.objects.create(name="Rated", owner=self.user)
+        for i in range(member_count):
+            member = user_model.objects.create(username=f"{rater_name}-{i}")
+            ProjectMembership.objects.create(project=project, user=member)
+        rater = user_model.objects.create(username=rater_name)
+
+        with CaptureQueriesContext(connection) as ctx:
+            with self.captureOnCommitCallbacks(execute=True):
+                ProjectRating.objects.create(
+                    project=project, rated_by=rater, score=4
+                )
+
+        return project, len(ctx.captured_queries)
+
+    def test_rating_updates_member_scores_in_constant_queries(self):
+        project, small = self.rate_with_members(2, "small")
+        _, large = self.rate_with_members(40, "large")
+
+        self.assertEqual(small, large)
+
+        project.refresh_from_db()
+        self.assertEqual(project.score, 4.0)
+        for member in project.members.all():
+            self.assertEqual(member.avg_projects_score, Decimal("4.00"))
+
+    def test_rating_stats_are_incremental(self):
+        project = Project.objects.create(name="Rated", owner=self.user)
+        raters = [
+            user_model.objects.create(username=f"rater-{i}") for i in range(3)
+        ]
+
+        for rater, score in zip(raters, [5, 5, 2]):
+            ProjectRating.objects.create(
+                project=project, rated_by=rater, score=score
+            )
+
+        project.refresh_from_db()
+        self.assertEqual(project.ratings_count, 3)
+        self.assertEqual(project.ratings_sum, 12)
+        self.assertEqual(project.score, 4.0)
+        self.assertEqual(
+            [row["count"] for row in project.rating_histogram],
+            [2, 0, 0, 1, 0],
+        )
+
+        raters[2].delete()
+
+        project.refresh_from_db()
+        self.assertEqual(project.ratings_count, 2)
+        self.assertEqual(project.ratings_2, 0)
+        self.assertEqual(project.score, 5.0)
+
+    def test_saving_a_stale_project_keeps_concurrent_ratings(self):
+        project = Project.objects.create(name="Rated", owner=self.user)
+        stale = Project.objects.get(pk=project.pk)
+        rater = user_model.objects.create(username="concurrent-rater")
+        ProjectRating.objects.create(project=project, rated_by=rater, score=4)
+
+        stale.description = "Edited"
+        stale.save()
+
+        project.refresh_from_db()
+        self.assertEqual(project.description, "Edited")
+        self.assertEqual(
+            (project.ratings_count, project.ratings_sum, project.ratings_4),
+            (1, 4, 1),
+        )
+        self.assertEqual(project.score, 4.0)
+
+    def test_rebuild_rating_stats_fixes_drift(self):
+        project = Project.objects.create(name="Rated", owner=self.user)
+        rater = user_model.objects.create(username="drift-rater")
+        ProjectRating.objects.create(project=project, rated_by=rater, score=3)
+        Project.objects.filter(pk=project.pk).update(
+            ratings_count=7, ratings_3=0, score=1
+        )
+
+        out = StringIO()
+        call_command("rebuild_rating_stats", stdout=out)
+
+        project.refresh_from_db()
+        self.assertIn("1 project(s) drifted", out.getvalue())
+        self.assertEqual(project.ratings_count, 1)
+        self.assertEqual(project.ratings_3, 1)
+        self.assertEqual(project.score, 3.0)
@@ -0,0 +1,98 @@
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.template import engines
+from django.test import TestCase, override_settings
+from django.urls import path
+
+from projects.models import Project, Tag, Task
+from projects.service.nplusone import NPlusOneDetector, NPlusOneError
+
+
+def task_tags_view(request):
+    names = [
+        tag.name for task in Task.objects.all() for tag in task.tags.all()
+    ]
+    return HttpResponse(", ".join(names))
+
+
+urlpatterns = [path("task-tags/", task_tags_view)]
+
+
+class NPlusOneDetectorTest(TestCase):
+    def setUp(self):
+        owner = get_user_model().objects.create_user(
+            username="owner", password="pass"
+        )
+        self.project = Project.objects.create(name="Looped", owner=owner)
+        tag = Tag.objects.create(name="backend")
+        for index in range(5):
+            task = Task.objects.create(
+                title=f"Task {index}", project=self.project
+            )
+            task.tags.add(tag)
+
+    def test_lazy_many_to_many_is_flagged(self):
+        with NPlusOneDetector(threshold=3) as detector:
+            for task in Task.objects.all():
+                list(task.tags.all())
+
+        [problem] = detector.problems
+        self.assertEqual(problem["count"], 5)
+        self.assertEqual(problem["relation"], "Task.tags")
+        self.assertIn("test_nplusone.py", problem["code"])
+        self.assertIn("Task.tags", detector.report())
+
+    def test_lazy_foreign_key_is_flagged(self):
+        with NPlusOneDetector(threshold=3) as detector:
+            for task in Task.objects.all():
+                task.project.name
+
+        [problem] = detector.problems
+        self.assertEqual(problem["relation"], "Task.project")
+
+    def test_prefetched_loop_is_not_flagged(self):
+        with NPlusOneDetector(threshold=3) as detector:
+            for task in Task.objects.prefetch_related("tags"):
+                list(task.tags.all())
+
+        self.assertEqual(detector.problems, [])
+
+    def test_report_names_the_template_line(self):
+        template = engines["django"].from_string(
+            "{% for task in tasks %}\n{{ task.project.name }}\n{% endfor %}"
+        )
+
+        with NPlusOneDetector(threshold=3) as detector:
+            template.render({"tasks": Task.objects.all()})
+
+        [problem] = detector.problems
+        self.assertEqual(
+            problem["template"], "<unknown source>:2 {{ task.project.name }}"
+        )
+        self.assertEqual(problem["relation"], "Task.project")
+
+    @override_settings(
+        ROOT_URLCONF=__name__, NPLUSONE={"MODE": "header", "THRESHOLD": 3}
+    )
+    def test_middleware_header_mode(self):
+        response = self.client.get("/task-tags/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("5x loading Task.tags", response["X-NPlusOne"])
+
+    @override_settings(
+        ROOT_URLCONF=__name__, NPLUSONE={"MODE": "raise", "THRESHOLD": 3}
+    )
+    def test_middleware_raise_mode(self):
+        with self.assertRaises(NPlusOneError):
+            self.client.get("/task-tags/")
+
+    @override_settings(
+        ROOT_URLCONF=__name__, NPLUSONE={"MODE": "log", "THRESHOLD": 3}
+    )
+    def test_middleware_log_mode(self):
+        with self.assertLogs("projects.nplusone", "WARNING") as logs:
+            response = self.client.get("/task-tags/")
+
+        self.assertNotIn("X-NPlusOne", response)
+        self.assertIn("Task.tags", logs.output[0])
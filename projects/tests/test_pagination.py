@@ -0,0 +1,92 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from projects.models import Project, Task
+from projects.service.pagination import CursorPaginator
+
+PROJECT_URL = reverse("projects:project_list")
+user_model = get_user_model()
+
+
+class CursorPaginatorTest(TestCase):
+
+    def setUp(self):
+        self.user = user_model.objects.create_user(
+            username="owner", password="pass"
+        )
+        for i in range(25):
+            Project.objects.create(
+                name=f"Project {i}", owner=self.user, score=i % 3
+            )
+        self.expected = list(Project.objects.order_by("-score", "id"))
+
+    def test_walk_forward_and_back(self):
+        paginator = CursorPaginator(
+            Project.objects.all(), 10, ("-score", "id")
+        )
+
+        first = paginator.page()
+        self.assertEqual(list(first), self.expected[:10])
+        self.assertFalse(first.has_previous())
+        self.assertTrue(first.has_next())
+
+        second = paginator.page(first.next_cursor)
+        self.assertEqual(list(second), self.expected[10:20])
+        self.assertEqual(second.number, 2)
+
+        third = paginator.page(second.next_cursor)
+        self.assertEqual(list(third), self.expected[20:])
+        self.assertFalse(third.has_next())
+
+        back = paginator.page(third.previous_cursor)
+        self.assertEqual(list(back), self.expected[10:20])
+        self.assertEqual(back.start_index(), 11)
+
+        start = paginator.page(back.previous_cursor)
+        self.assertEqual(list(start), self.expected[:10])
+        self.assertFalse(start.has_previous())
+
+    def test_mixed_direction_ordering(self):
+        project = Project.objects.first()
+        for i in range(15):
+            Task.objects.create(title=f"Task {i}", project=project)
+        expected = list(Task.objects.order_by("-created_at", "-id"))
+
+        paginator = CursorPaginator(
+            Task.objects.all(), 10, ("-created_at", "-id")
+        )
+        first = paginator.page()
+        second = paginator.page(first.next_cursor)
+
+        self.assertEqual(list(first) + list(second), expected)
+
+
+class CursorPaginationViewTest(TestCase):
+
+    def setUp(self):
+        self.user = user_model.objects.create_user(
+            username="owner", password="pass"
+        )
+        for i in range(15):
+            Project.objects.create(name=f"Project {i}", owner=self.user)
+
+    def test_list_view_does_not_count(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(PROJECT_URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["is_paginated"])
+        self.assertFalse(
+            any("__count" in q["sql"] for q in ctx.captured_queries)
+        )
+
+        next_cursor = response.context["page_obj"].next_cursor
+        response = self.client.get(PROJECT_URL, {"cursor": next_cursor})
+        self.assertEqual(len(response.context["projects"]), 5)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(PROJECT_URL, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 404)
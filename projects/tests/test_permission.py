@@ -1,5 +1,6 @@
 from django.contrib.auth import get_user_model
 from django.test import TestCase, Client, RequestFactory
+from django.urls import reverse
 
 from projects.models import (
     ProjectMembership,
@@ -9,6 +10,8 @@ from projects.models import (
     ProjectApplication,
     Project,
 )
+from projects.service.access import get_project_access
+from projects.service.membership_cache import get_membership_map
 
 
 class PermissionTest(TestCase):
@@ -162,3 +165,90 @@ class PermissionTest(TestCase):
             project=self.project, user=self.non_member
         ).first()
         self.assertIsNone(membership)
+
+
+class ProjectAccessTest(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        user_model = get_user_model()
+
+        self.user_owner = user_model.objects.create_user(
+            username="owner", password="ownerpass"
+        )
+        self.only_task_perm_user = user_model.objects.create_user(
+            username="only_task_perm_user", password="memberpass"
+        )
+        self.non_member = user_model.objects.create_user(
+            username="non_member", password="nonmemberpass"
+        )
+        self.assigned_to_task = user_model.objects.create_user(
+            username="assigned_to_task", password="memberpass"
+        )
+
+        self.project = self.user_owner.projects.create(
+            name="Test Project",
+            description="A test project",
+            owner=self.user_owner,
+        )
+        ProjectMembership.objects.create(
+            project=self.project,
+            user=self.only_task_perm_user,
+            role="DEV",
+            add_task_perm=True,
+        )
+        self.task = Task.objects.create(
+            title="Test Task",
+            project=self.project,
+            assignee=self.assigned_to_task,
+        )
+
+    def test_access_is_resolved_in_one_query_on_warm_cache(self):
+        get_membership_map(self.only_task_perm_user.pk)
+        request = self.factory.get("/")
+        request.user = self.only_task_perm_user
+
+        with self.assertNumQueries(1):
+            access = get_project_access(request, self.project.pk)
+            self.assertTrue(access.is_member)
+            self.assertFalse(access.is_owner)
+            self.assertFalse(access.is_rated)
+            self.assertTrue(access.has_permission("add_task_perm"))
+            self.assertFalse(access.has_permission("edit_project_info_perm"))
+            self.assertEqual(access.project.owner, self.user_owner)
+
+        with self.assertNumQueries(0):
+            self.assertIs(get_project_access(request, self.project.pk), access)
+
+    def test_owner_has_every_permission(self):
+        request = self.factory.get("/")
+        request.user = self.user_owner
+
+        access = get_project_access(request, self.project.pk)
+
+        self.assertTrue(access.is_owner)
+        self.assertTrue(access.has_permission("manage_open_roles_perm"))
+
+    def test_non_member_post_is_rejected_before_the_view_runs(self):
+        self.client.force_login(self.non_member)
+
+        response = self.client.post(
+            reverse(
+                "projects:task_edit",
+                args=[self.project.pk, self.task.pk],
+            ),
+            {"title": "Hijacked", "status": "done"},
+        )
+
+        self.assertTemplateUsed(response, "projects/no_permission.html")
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.title, "Test Task")
+
+    def test_my_tasks_detail_resolves_project_from_task(self):
+        self.client.force_login(self.assigned_to_task)
+
+        response = self.client.get(
+            reverse("users:my_tasks_detail", args=[self.task.pk])
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["task"], self.task)
@@ -0,0 +1,288 @@
+"""
+Query-count and query-shape regression suite.
+
+Every named route in ``projects.urls`` and ``users.urls`` is requested
+against seeded datasets of growing size. The number of queries a route
+issues must not change as the data grows, which is what an N+1 looks like
+from the outside. The normalized SQL of each route is also compared with a
+snapshot under ``query_snapshots/<vendor>/`` so a reviewer sees exactly
+which queries a change adds or removes.
+
+The default sizes keep the suite fast. Run it against bigger datasets with
+``QUERY_REGRESSION_SIZES=10,1000,50000`` and regenerate the snapshots after
+an intended change with ``UPDATE_QUERY_SNAPSHOTS=1``, which is also how
+the snapshot of a new route is recorded: a missing one fails the suite.
+"""
+
+import difflib
+import os
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, reverse
+
+from projects import urls as project_urls
+from projects.models import (
+    Project,
+    ProjectApplication,
+    ProjectMembership,
+    ProjectOpenRole,
+    ProjectRating,
+    Tag,
+    Task,
+)
+from projects.service.nplusone import normalize_sql
+from users import urls as user_urls
+
+user_model = get_user_model()
+
+SNAPSHOT_DIR = Path(__file__).resolve().parent / "query_snapshots"
+
+_SIZES = os.environ.get("QUERY_REGRESSION_SIZES", "10,60,300")
+SIZES = [int(size) for size in _SIZES.split(",")]
+
+# Routes that change data are replayed with POST against a fresh object,
+# everything else is a plain GET.
+ROUTES = {
+    "projects:dashboard": "get",
+    "projects:project_list": "get",
+    "projects:project_detail": "get",
+    "projects:project_create": "get",
+    "projects:project_edit": "get",
+    "projects:project_rate": "get",
+    "projects:project_edit_roles": "get",
+    "projects:project_edit_stage": "get",
+    "projects:project_open_roles_list": "get",
+    "projects:project_open_roles_create": "get",
+    "projects:project_open_roles_delete": "post",
+    "projects:apply": "get",
+    "projects:applications_list": "get",
+    "projects:application_archive": "get",
+    "projects:application_approve": "post",
+    "projects:application_reject": "post",
+    "projects:task_list": "get",
+    "projects:task_create": "get",
+    "projects:task_import": "get",
+    "projects:task_edit": "get",
+    "projects:task_detail": "get",
+    "projects:project_export_tasks": "get",
+    "projects:project_export_applications": "get",
+    "projects:project_export_memberships": "get",
+    "projects:metrics": "get",
+    "users:login": "get",
+    "users:logout": "post",
+    "users:register": "get",
+    "users:profile": "get",
+    "users:profile_update": "get",
+    "users:leaderboard": "get",
+    "users:developer_suggest": "get",
+    "users:my_projects": "get",
+    "users:my_tasks": "get",
+    "users:my_tasks_detail": "get",
+}
+
+# Routes that log the client out are requested last.
+LOGOUT_ROUTES = {"users:logout"}
+
+
+def named_routes():
+    routes = []
+    for module in (project_urls, user_urls):
+        for pattern in module.urlpatterns:
+            if isinstance(pattern, URLPattern) and pattern.name:
+                routes.append(f"{module.app_name}:{pattern.name}")
+    return routes
+
+
+class QueryRegressionTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+        self.owner = user_model.objects.create_user(
+            username="owner", password="pass"
+        )
+        self.rater = user_model.objects.create(username="rater")
+        self.tag = Tag.objects.create(name="backend")
+        self.project = Project.objects.create(
+            name="Scale",
+            description="Project under load",
+            owner=self.owner,
+            development_stage="deployed",
+            deploy_url="http://example.com",
+        )
+        self.open_role = ProjectOpenRole.objects.create(
+            project=self.project, role_name="Backend Developer"
+        )
+        ProjectApplication.objects.create(
+            project=self.project,
+            user=self.rater,
+            role=self.open_role,
+            status="rejected",
+        )
+        self.seeded = 0
+
+    def seed(self, size):
+        """
+        Grow the dataset to ``size`` tasks, with one extra project, member,
+        application and rating for every ten tasks.
+        """
+        Task.objects.bulk_create(
+            Task(
+                title=f"Task {i}",
+                project=self.project,
+                created_by=self.owner,
+                assignee=self.owner if i % 2 else None,
+            )
+            for i in range(self.seeded, size)
+        )
+        Task.tags.through.objects.bulk_create(
+            Task.tags.through(task_id=task_id, tag_id=self.tag.pk)
+            for task_id in Task.objects.filter(tags=None).values_list(
+                "id", flat=True
+            )
+        )
+
+        for i in range(self.seeded // 10, size // 10):
+            developer = user_model.objects.create(username=f"dev{i}")
+            ProjectMembership.objects.create(
+                project=self.project, user=developer
+            )
+            applicant = user_model.objects.create(username=f"applicant{i}")
+            ProjectApplication.objects.create(
+                project=self.project,
+                user=applicant,
+                role=self.open_role,
+                status="rejected" if i % 2 else "pending",
+            )
+            project = Project.objects.create(
+                name=f"Side {i}",
+                owner=self.owner,
+                development_stage="deployed",
+                deploy_url="http://example.com",
+            )
+            ProjectRating.objects.create(
+                project=project, rated_by=self.rater, score=i % 5 + 1
+            )
+
+        self.seeded = size
+
+    def route_kwargs(self, name):
+        task = Task.objects.filter(project=self.project).first()
+        values = {
+            "project_pk": self.project.pk,
+            "task_pk": task.pk,
+            "role_pk": self.open_role.pk,
+            "user_pk": self.owner.pk,
+        }
+
+        if name == "projects:project_open_roles_delete":
+            values["role_pk"] = ProjectOpenRole.objects.create(
+                project=self.project, role_name="Disposable"
+            ).pk
+
+        if name in (
+            "projects:application_approve",
+            "projects:application_reject",
+        ):
+            applicant = user_model.objects.create(
+                username=f"fresh{ProjectApplication.objects.count()}"
+            )
+            values["application_pk"] = ProjectApplication.objects.create(
+                project=self.project, user=applicant, role=self.open_role
+            ).pk
+
+        return values
+
+    def url_for(self, name):
+        pattern = next(
+            pattern
+            for module in (project_urls, user_urls)
+            for pattern in module.urlpatterns
+            if f"{module.app_name}:{pattern.name}" == name
+        )
+        kwargs = {
+            key: value
+            for key, value in self.route_kwargs(name).items()
+            if key in pattern.pattern.converters
+        }
+        return reverse(name, kwargs=kwargs)
+
+    def capture(self, name):
+        send = getattr(self.client, ROUTES[name])
+
+        self.client.force_login(self.owner)
+        send(self.url_for(name))
+
+        self.client.force_login(self.owner)
+        url = self.url_for(name)
+        with CaptureQueriesContext(connection) as queries:
+            send(url)
+
+        return [normalize_sql(query["sql"]) for query in queries]
+
+    def capture_all(self):
+        names = sorted(ROUTES, key=lambda name: name in LOGOUT_ROUTES)
+        return {name: self.capture(name) for name in names}
+
+    def assert_snapshot(self, name, queries):
+        path = (
+            SNAPSHOT_DIR / connection.vendor / f"{name.replace(':', '__')}.sql"
+        )
+        current = "\n".join(queries) + "\n"
+
+        if os.environ.get("UPDATE_QUERY_SNAPSHOTS"):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(current)
+            return
+
+        if not path.parent.exists():
+            self.skipTest(
+                f"No {connection.vendor} query snapshots; record them with "
+                f"UPDATE_QUERY_SNAPSHOTS=1."
+            )
+        if not path.exists():
+            self.fail(
+                f"No query snapshot for {name}; record it with "
+                f"UPDATE_QUERY_SNAPSHOTS=1."
+            )
+
+        expected = path.read_text()
+        if current != expected:
+            diff = "".join(
+                difflib.unified_diff(
+                    expected.splitlines(keepends=True),
+                    current.splitlines(keepends=True),
+                    fromfile=f"{path.name} (snapshot)",
+                    tofile=f"{path.name} (current)",
+                )
+            )
+            self.fail(
+                f"Queries of {name} changed; rerun with "
+                f"UPDATE_QUERY_SNAPSHOTS=1 if this is intended.\n{diff}"
+            )
+
+    def test_every_named_route_is_covered(self):
+        self.assertCountEqual(named_routes(), ROUTES)
+
+    def test_query_count_is_constant_as_data_grows(self):
+        runs = []
+        for size in SIZES:
+            self.seed(size)
+            runs.append(self.capture_all())
+
+        for name in ROUTES:
+            counts = [len(run[name]) for run in runs]
+            with self.subTest(route=name):
+                self.assertEqual(
+                    len(set(counts)),
+                    1,
+                    f"{name} issued {counts} queries for sizes {SIZES}",
+                )
+
+        for name, queries in runs[0].items():
+            with self.subTest(route=name):
+                self.assert_snapshot(name, queries)
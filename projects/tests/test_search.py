@@ -0,0 +1,72 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from projects.models import Project
+from projects.service.search import rebuild_index, search_projects
+
+PROJECT_URL = reverse("projects:project_list")
+user_model = get_user_model()
+
+
+class ProjectSearchTest(TestCase):
+
+    def setUp(self):
+        self.user = user_model.objects.create_user(
+            username="owner", password="pass"
+        )
+        self.by_name = Project.objects.create(
+            name="Payments gateway",
+            description="Billing for shops",
+            owner=self.user,
+        )
+        self.by_description = Project.objects.create(
+            name="Shop backend",
+            description="Integrates a payments provider",
+            owner=self.user,
+            domain="fintech",
+        )
+        self.unrelated = Project.objects.create(
+            name="Recipe book", description="Cooking", owner=self.user
+        )
+
+    def test_matches_name_and_description(self):
+        qs = search_projects(Project.objects.all(), "payment")
+
+        self.assertEqual(set(qs), {self.by_name, self.by_description})
+
+    def test_name_matches_rank_higher(self):
+        qs = search_projects(Project.objects.all(), "payments").order_by(
+            "-search_rank"
+        )
+
+        self.assertEqual(list(qs), [self.by_name, self.by_description])
+
+    def test_index_follows_updates(self):
+        self.unrelated.name = "Payments recipes"
+        self.unrelated.save()
+
+        qs = search_projects(Project.objects.all(), "recipes payments")
+        self.assertEqual(list(qs), [self.unrelated])
+
+    def test_rebuild_index(self):
+        Project.objects.filter(pk=self.unrelated.pk).update(name="Payroll")
+        rebuild_index()
+
+        qs = search_projects(Project.objects.all(), "payroll")
+        self.assertEqual(list(qs), [self.unrelated])
+
+    def test_composes_with_filters(self):
+        response = self.client.get(
+            PROJECT_URL, {"project_name": "payments", "domain": "fintech"}
+        )
+
+        self.assertEqual(
+            list(response.context["projects"]), [self.by_description]
+        )
+
+    def test_punctuation_only_query(self):
+        response = self.client.get(PROJECT_URL, {"project_name": "%%"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["projects"]), 3)
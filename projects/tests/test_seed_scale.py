@@ -0,0 +1,64 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db.models import Count
+from django.test import TestCase
+
+from projects.models import Project, ProjectRating, Task
+from users.models import LeaderboardEntry
+
+
+class SeedScaleCommandTest(TestCase):
+    def seed(self, **options):
+        call_command(
+            "seed_scale",
+            developers=40,
+            projects=15,
+            tasks=300,
+            seed=7,
+            stdout=StringIO(),
+            **options,
+        )
+
+    def test_generates_requested_volumes(self):
+        self.seed()
+
+        self.assertEqual(get_user_model().objects.count(), 40)
+        self.assertEqual(Project.objects.count(), 15)
+        self.assertEqual(Task.objects.count(), 300)
+        self.assertEqual(LeaderboardEntry.objects.count(), 40)
+
+    def test_every_owner_is_a_member(self):
+        self.seed()
+
+        for project in Project.objects.all():
+            self.assertTrue(
+                project.memberships.filter(user_id=project.owner_id).exists()
+            )
+
+    def test_rating_counters_match_rows(self):
+        self.seed()
+
+        counts = dict(
+            ProjectRating.objects.values("project")
+            .annotate(total=Count("id"))
+            .values_list("project", "total")
+        )
+        for project in Project.objects.all():
+            self.assertEqual(project.ratings_count, counts.get(project.pk, 0))
+
+    def test_project_counters_match_rows(self):
+        self.seed()
+
+        out = StringIO()
+        call_command("rebuild_project_counters", dry_run=True, stdout=out)
+
+        self.assertIn("0 project(s) drifted", out.getvalue())
+
+    def test_can_run_twice(self):
+        self.seed()
+        self.seed()
+
+        self.assertEqual(Project.objects.count(), 30)
+        self.assertEqual(Task.objects.count(), 600)
@@ -0,0 +1,241 @@
+import io
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from projects.models import Project, ProjectMembership, Tag, Task
+from projects.service.task_import import import_tasks
+
+user_model = get_user_model()
+
+CSV = (
+    "title,status,assignee,tags,deadline\n"
+    "Set up CI,In Progress,member,ci;devops,2026-11-01\n"
+    ",todo,,,\n"
+    "Write docs,done,stranger,docs,\n"
+    "Ship it,shipped,,,\n"
+    "Fix login,todo,,ci,not a date\n"
+    "Refactor,,,devops;ci;devops,\n"
+)
+
+
+class TaskImportTest(TestCase):
+    def setUp(self):
+        self.owner = user_model.objects.create_user(
+            username="owner", password="pass"
+        )
+        self.member = user_model.objects.create_user(
+            username="member", password="pass"
+        )
+        user_model.objects.create_user(username="stranger", password="pass")
+        self.project = Project.objects.create(name="Board", owner=self.owner)
+        ProjectMembership.objects.create(
+            project=self.project, user=self.member
+        )
+        self.ci = Tag.objects.create(name="ci")
+
+    def run_import(self, content, import_format="csv", chunk_size=1000):
+        return import_tasks(
+            self.project,
+            self.owner,
+            io.BytesIO(content.encode()),
+            import_format,
+            chunk_size=chunk_size,
+        )
+
+    def test_imports_valid_rows_and_reports_the_rest(self):
+        result = self.run_import(CSV)
+
+        self.assertEqual(result.created, 3)
+        self.assertEqual(
+            result.errors,
+            [
+                (3, "Title is required."),
+                (5, "Unknown status 'shipped'."),
+                (6, "Invalid deadline 'not a date'."),
+            ],
+        )
+        self.assertEqual(
+            result.warnings,
+            [
+                (
+                    4,
+                    "Assignee 'stranger' is not a member of this project; "
+                    "imported unassigned.",
+                )
+            ],
+        )
+        self.assertIsNone(Task.objects.get(title="Write docs").assignee)
+
+        task = Task.objects.get(title="Set up CI")
+        self.assertEqual(task.status, "in_progress")
+        self.assertEqual(task.assignee, self.member)
+        self.assertEqual(task.created_by, self.owner)
+        self.assertEqual(task.deadline.date().isoformat(), "2026-11-01")
+        self.assertEqual(
+            sorted(task.tags.values_list("name", flat=True)),
+            ["ci", "devops"],
+        )
+
+    def test_reuses_existing_tags_and_creates_missing_ones_once(self):
+        self.run_import(CSV)
+
+        self.assertEqual(Tag.objects.filter(name="ci").get(), self.ci)
+        self.assertEqual(Tag.objects.filter(name="devops").count(), 1)
+        self.assertEqual(Task.objects.get(title="Refactor").tags.count(), 2)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        rows = "".join(
+            json.dumps({"title": f"Task {i}", "tags": ["ci", f"t{i % 3}"]})
+            + "\n"
+            for i in range(50)
+        )
+
+        # Members, then per chunk: savepoint, tag lookup, tag insert, task
+        # insert, link insert, project touch, release.
+        with self.assertNumQueries(8):
+            result = self.run_import(rows, "jsonl")
+
+        self.assertEqual(result.created, 50)
+        self.assertEqual(Task.tags.through.objects.count(), 100)
+
+    def test_each_chunk_commits_on_its_own(self):
+        rows = (
+            '{"title": "One"}\n'
+            "{broken\n"
+            '{"title": "Two"}\n'
+            "[1, 2]\n"
+            '{"title": "Three"}\n'
+        )
+
+        result = self.run_import(rows, "jsonl", chunk_size=2)
+
+        self.assertEqual(result.created, 3)
+        self.assertEqual([line for line, _ in result.errors], [2, 4])
+
+    def test_round_trips_the_export(self):
+        Task.objects.create(
+            title="Exported",
+            project=self.project,
+            assignee=self.member,
+            deadline="2026-11-01T12:30:00Z",
+        ).tags.add(self.ci)
+        self.client.force_login(self.owner)
+        response = self.client.get(
+            reverse("projects:project_export_tasks", args=[self.project.pk])
+        )
+        exported = b"".join(response.streaming_content).decode()
+
+        result = self.run_import(exported)
+
+        self.assertEqual((result.created, result.errors), (1, []))
+        copy = Task.objects.filter(title="Exported").order_by("-pk").first()
+        self.assertEqual(copy.assignee, self.member)
+        self.assertEqual(
+            copy.deadline.isoformat(), "2026-11-01T12:30:00+00:00"
+        )
+        self.assertEqual(list(copy.tags.all()), [self.ci])
+
+    def test_imports_another_projects_export_unassigned(self):
+        other = Project.objects.create(name="Other", owner=self.owner)
+        Task.objects.create(
+            title="Exported", project=self.project, assignee=self.member
+        )
+        self.client.force_login(self.owner)
+        response = self.client.get(
+            reverse("projects:project_export_tasks", args=[self.project.pk]),
+            {"format": "jsonl"},
+        )
+        exported = b"".join(response.streaming_content)
+
+        result = import_tasks(other, self.owner, io.BytesIO(exported), "jsonl")
+
+        self.assertEqual((result.created, result.errors), (1, []))
+        self.assertEqual(len(result.warnings), 1)
+        self.assertIsNone(other.tasks.get().assignee)
+
+
+class TaskImportViewTest(TestCase):
+    def setUp(self):
+        self.owner = user_model.objects.create_user(
+            username="owner", password="pass"
+        )
+        self.project = Project.objects.create(name="Board", owner=self.owner)
+        self.url = reverse("projects:task_import", args=[self.project.pk])
+
+    def upload(self, name, content, **data):
+        return self.client.post(
+            self.url,
+            {"file": SimpleUploadedFile(name, content.encode()), **data},
+        )
+
+    def test_redirects_to_tasks_after_a_clean_import(self):
+        self.client.force_login(self.owner)
+
+        response = self.upload("board.csv", "title\nOne\nTwo\n")
+
+        self.assertRedirects(
+            response, reverse("projects:task_list", args=[self.project.pk])
+        )
+        self.assertEqual(self.project.tasks.count(), 2)
+
+    def test_lists_skipped_rows(self):
+        self.client.force_login(self.owner)
+
+        response = self.upload(
+            "board.txt",
+            '{"title": "One"}\n{"status": "done"}\n',
+            format="jsonl",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.context["result"].errors, [(2, "Title is required.")]
+        )
+        self.assertContains(response, "Title is required.")
+
+    def test_requires_format_for_unknown_extensions(self):
+        self.client.force_login(self.owner)
+
+        response = self.upload("board.txt", "title\nOne\n")
+
+        self.assertFalse(response.context["form"].is_valid())
+        self.assertEqual(self.project.tasks.count(), 0)
+
+    def test_requires_add_task_permission(self):
+        outsider = user_model.objects.create_user(
+            username="outsider", password="pass"
+        )
+        self.client.force_login(outsider)
+
+        response = self.upload("board.csv", "title\nOne\n")
+
+        self.assertTemplateUsed(response, "projects/no_permission.html")
+        self.assertEqual(self.project.tasks.count(), 0)
+
+
+class ImportTasksCommandTest(TestCase):
+    def test_imports_a_file(self):
+        owner = user_model.objects.create_user(username="owner")
+        project = Project.objects.create(name="Board", owner=owner)
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".csv", delete=False
+        ) as source:
+            source.write("title,status\nOne,todo\nTwo,later\n")
+        self.addCleanup(os.remove, source.name)
+
+        out, err = StringIO(), StringIO()
+        call_command(
+            "import_tasks", project.pk, source.name, stdout=out, stderr=err
+        )
+
+        self.assertIn("Imported 1 task(s) into Board", out.getvalue())
+        self.assertIn("Line 3: Unknown status 'later'.", err.getvalue())
+        self.assertEqual(project.tasks.get().created_by, owner)
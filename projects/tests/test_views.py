@@ -1,5 +1,7 @@
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase, Client, RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from projects.models import (
@@ -8,6 +10,7 @@ from projects.models import (
     Tag,
     ProjectOpenRole,
     ProjectApplication,
+    ProjectRating,
 )
 from projects.views import ProjectListView
 
@@ -327,9 +330,10 @@ class ProjectListViewQuerysetTest(TestCase):
             development_stage="design",
             domain="technology",
         )
-        ProjectOpenRole.objects.create(
-            project=self.project1, role_name="Backend Developer"
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            ProjectOpenRole.objects.create(
+                project=self.project1, role_name="Backend Developer"
+            )
 
     def test_queryset_no_filters(self):
         request = self.factory.get("/projects/")
@@ -407,3 +411,96 @@ class ProjectListViewQuerysetTest(TestCase):
 
         qs = view.get_queryset()
         self.assertEqual(list(qs), [])
+
+
+class ProjectCardQueryCountTest(TestCase):
+    def setUp(self):
+        self.user = user_model.objects.create_user(
+            username="owner", password="pass"
+        )
+        self.rater = user_model.objects.create_user(
+            username="rater", password="pass"
+        )
+        self.client.force_login(self.user)
+
+    def add_projects(self, count):
+        for i in range(count):
+            project = Project.objects.create(
+                name=f"Project {i}",
+                owner=self.user,
+                development_stage="deployed",
+                deploy_url="http://example.com",
+                score=4,
+            )
+            ProjectRating.objects.create(
+                project=project, rated_by=self.rater, score=4
+            )
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_card_lists_render_in_constant_queries(self):
+        urls = [
+            reverse("projects:project_list"),
+            reverse("users:my_projects"),
+            reverse("users:profile", kwargs={"user_pk": self.user.pk}),
+        ]
+
+        self.add_projects(1)
+        baseline = {url: self.count_queries(url) for url in urls}
+
+        self.add_projects(9)
+        for url in urls:
+            self.assertEqual(self.count_queries(url), baseline[url], url)
+
+        response = self.client.get(reverse("projects:project_list"))
+        self.assertContains(response, "1 reviews")
+
+
+class ProjectDetailPrefetchTest(TestCase):
+    def setUp(self):
+        self.user = user_model.objects.create_user(
+            username="owner", password="pass"
+        )
+        self.project = Project.objects.create(
+            name="Busy", description="Many tasks", owner=self.user
+        )
+        self.url = reverse(
+            "projects:project_detail", kwargs={"project_pk": self.project.pk}
+        )
+        self.client.force_login(self.user)
+
+    def add_tasks(self, count):
+        tag = Tag.objects.create(name="backend")
+        for i in range(count):
+            task = Task.objects.create(
+                title=f"Task {i}", project=self.project, created_by=self.user
+            )
+            task.tags.add(tag)
+
+    def test_renders_only_the_newest_tasks_with_true_total(self):
+        self.add_tasks(20)
+
+        response = self.client.get(self.url)
+
+        tasks = response.context["tasks"]
+        self.assertEqual(len(tasks), 8)
+        self.assertEqual(tasks[0].title, "Task 19")
+        self.assertEqual(response.context["tasks_total"], 20)
+        self.assertEqual(response.context["open_roles_total"], 0)
+        self.assertContains(response, "Check All Tasks (20)")
+
+    def test_query_count_does_not_grow_with_tasks(self):
+        self.add_tasks(2)
+        self.client.get(self.url)
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(self.url)
+
+        self.add_tasks(30)
+        with CaptureQueriesContext(connection) as large:
+            self.client.get(self.url)
+
+        self.assertEqual(len(small), len(large))
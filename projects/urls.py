@@ -87,6 +87,11 @@ urlpatterns = [
         views.TaskCreateView.as_view(),
         name="task_create",
     ),
+    path(
+        "projects/<int:project_pk>/tasks/import/",
+        views.TaskImportView.as_view(),
+        name="task_import",
+    ),
     path(
         "projects/<int:project_pk>/tasks/<int:task_pk>/edit/",
         views.TaskUpdateView.as_view(),
@@ -97,4 +102,26 @@ urlpatterns = [
         views.TaskDetailView.as_view(),
         name="task_detail",
     ),
+    path(
+        "projects/<int:project_pk>/export/tasks/",
+        views.ProjectExportView.as_view(export="tasks"),
+        name="project_export_tasks",
+    ),
+    path(
+        "projects/<int:project_pk>/export/applications/",
+        views.ProjectExportView.as_view(
+            export="applications",
+            required_permission="manage_open_roles_perm",
+        ),
+        name="project_export_applications",
+    ),
+    path(
+        "projects/<int:project_pk>/export/memberships/",
+        views.ProjectExportView.as_view(
+            export="memberships",
+            required_permission="update_project_roles_perm",
+        ),
+        name="project_export_memberships",
+    ),
+    path("metrics", views.metrics, name="metrics"),
 ]
@@ -1,19 +1,30 @@
+import asyncio
+
 from django.contrib.auth.decorators import login_required
-from django.db import transaction
+from django.db import DatabaseError, transaction
 from django.db import models
 from django.contrib import messages
 from django.template.loader import render_to_string
 from django.contrib.auth import get_user_model
 from django.core.exceptions import PermissionDenied
-from django.http import JsonResponse
+from django.conf import settings
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseBadRequest,
+    JsonResponse,
+)
 from django.urls import reverse_lazy
+from django.utils.crypto import constant_time_compare
 from django.utils.decorators import method_decorator
 from django.views.generic import (
+    View,
     ListView,
     DetailView,
     CreateView,
     UpdateView,
     DeleteView,
+    FormView,
 )
 from .decorators import (
     validate_permissions_application_review,
@@ -40,6 +51,7 @@ from .forms import (
     ProjectOpenRoleForm,
     ProjectOpenRoleSearchForm,
     TaskSearchForm,
+    TaskImportForm,
     ProjectApplicationSearchForm,
 )
 from projects.permission_mixins import (
@@ -50,16 +62,38 @@ from projects.permission_mixins import (
     MembershipPermissionRequiredMixin,
     BasePermissionMixin,
 )
+from projects.service.access import (
+    aget_project_access,
+    get_project_access,
+)
+from projects.service.application_review import (
+    REVIEW_DECISIONS,
+    review_applications,
+)
+from projects.service.conditional import ConditionalDetailMixin
+from projects.service.membership_cache import get_cached_membership
+from projects.service.export import EXPORT_FORMATS, export_response
+from projects.service.jobs import queue_stats, render_queue_stats
+from projects.service.db_pool import pool_stats, render_pool_stats
+from projects.service.metrics import PREFIX, registry
+from projects.service.pagination import (
+    AsyncCursorListMixin,
+    CursorPaginationMixin,
+)
+from projects.service.prefetch import prefetch_top
+from projects.service.search import search_projects
+from projects.service.task_import import import_tasks
 from django.shortcuts import redirect, get_object_or_404, render
 
 UserModel = get_user_model()
 
 
-class ProjectListView(ListView):
+class ProjectListView(AsyncCursorListMixin, ListView):
     model = Project
     template_name = "projects/project_list.html"
     context_object_name = "projects"
     paginate_by = 10
+    cursor_ordering = ("-score", "id")
     view_type = "all_projects"
 
     def get_context_data(self, *, object_list=None, **kwargs):
@@ -80,6 +114,11 @@ class ProjectListView(ListView):
         )
         return context
 
+    def get_cursor_ordering(self):
+        if "search_rank" in self.object_list.query.annotations:
+            return ("-search_rank", "id")
+        return self.cursor_ordering
+
     def get_queryset(self):
 
         qs = Project.objects.all()
@@ -93,7 +132,7 @@ class ProjectListView(ListView):
             open_to_candidates = form.cleaned_data.get("open_to_candidates")
 
             if project_name:
-                qs = qs.filter(name__icontains=project_name)
+                qs = search_projects(qs, project_name)
             if development_stage:
                 qs = qs.filter(development_stage=development_stage)
             if domain:
@@ -104,78 +143,92 @@ class ProjectListView(ListView):
         return qs
 
 
-class ProjectDetailView(DetailView):
+class ProjectDetailView(ConditionalDetailMixin, DetailView):
     model = Project
     template_name = "projects/project_detail.html"
     context_object_name = "project"
     pk_url_kwarg = "project_pk"
 
-    def get_queryset(self):
-        return Project.objects.select_related("owner").prefetch_related(
-            models.Prefetch(
+    detail_tasks_limit = 8
+    detail_open_roles_limit = 3
+    detail_ratings_limit = 3
+
+    def get_prefetch_lookups(self):
+        return [
+            prefetch_top(
                 "tasks",
-                queryset=Task.objects.filter(
-                    project_id=self.kwargs["project_pk"]
-                ).prefetch_related("tags", "assignee", "created_by"),
+                Task.objects.order_by("-created_at", "-id").prefetch_related(
+                    "tags"
+                ),
+                self.detail_tasks_limit,
             ),
-            models.Prefetch(
+            prefetch_top(
                 "ratings",
-                queryset=ProjectRating.objects.order_by(
-                    "-created_at"
+                ProjectRating.objects.order_by(
+                    "-created_at", "-id"
                 ).select_related("rated_by"),
+                self.detail_ratings_limit,
+            ),
+            prefetch_top(
+                "open_roles",
+                ProjectOpenRole.objects.order_by("-created_at", "-id"),
+                self.detail_open_roles_limit,
+            ),
+            models.Prefetch(
+                "memberships",
+                queryset=ProjectMembership.objects.select_related("user"),
             ),
-            "open_roles",
-            "memberships__user",
+        ]
+
+    async def get(self, request, *args, **kwargs):
+        self.access = await aget_project_access(
+            request, self.kwargs["project_pk"]
+        )
+        self.object = project = self.access.project
+
+        not_modified = self.not_modified()
+        if not_modified is not None:
+            return not_modified
+
+        # The prefetches don't depend on each other, so they are awaited
+        # together instead of one after another.
+        await asyncio.gather(
+            *(
+                models.aprefetch_related_objects([project], lookup)
+                for lookup in self.get_prefetch_lookups()
+            )
         )
 
+        context = self.get_context_data(object=project)
+        return self.add_validators(self.render_to_response(context))
+
+    def get_validator_stamps(self):
+        return [self.object.updated_at]
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         project = self.object
-        user = self.request.user
+        access = self.access
 
-        memberships = project.memberships.all()
-        tasks = project.tasks.all()[:8]
-        open_roles = project.open_roles.all()[:3]
         is_deployed = project.development_stage == "deployed"
 
-        is_owner = False
-        is_member = False
         can_rate = False
-        user_permissions = {}
-
-        if user.is_authenticated:
-            membership = user.get_member_of(project)
-            is_owner = project.owner == user
-            is_member = membership is not None
-
-            if membership:
-                permissions = [
-                    "edit_project_info_perm",
-                    "add_task_perm",
-                    "update_project_stage_perm",
-                    "manage_open_roles_perm",
-                ]
-                user_permissions = {
-                    perm: getattr(membership, perm, False)
-                    for perm in permissions
-                }
-
-            is_rated = project.ratings.filter(
-                project=project, rated_by=user
-            ).exists()
-            can_rate = not (is_member and is_owner and is_rated)
+        if access.user.is_authenticated:
+            can_rate = not (
+                access.is_member and access.is_owner and access.is_rated
+            )
 
         context.update(
             {
-                **user_permissions,
-                "memberships": memberships,
-                "tasks": tasks,
-                "open_roles": open_roles,
-                "is_owner": is_owner,
-                "is_member": is_member,
+                **access.as_context(),
+                "tasks_total": project.task_count,
+                "open_roles_total": project.open_roles_count,
+                "memberships": project.memberships.all(),
+                "tasks": project.top_tasks,
+                "open_roles": project.top_open_roles,
                 "can_rate": can_rate,
                 "is_deployed": is_deployed,
-                "ratings": project.ratings.all().order_by("-created_at")[:3],
+                "ratings": project.top_ratings,
             }
         )
 
@@ -245,33 +298,12 @@ class ProjectOpenRoleListView(BasePermissionMixin, ListView):
         context = super().get_context_data(**kwargs)
         role_name = self.request.GET.get("role_name", "")
 
-        user_permissions = {}
-        is_owner = False
-        is_member = False
-
-        if self.user.is_authenticated:
-            membership = self.user.get_member_of(self.project)
-            is_owner = self.project.owner == self.user
-            is_member = membership is not None
-
-            if membership:
-                permissions = ["manage_open_roles_perm"]
-
-                user_permissions = {
-                    perm: getattr(membership, perm, False)
-                    for perm in permissions
-                }
-
         context["search_form"] = ProjectOpenRoleSearchForm(
             initial={"role_name": role_name}
         )
         context["project"] = self.project
         context.update(
-            {
-                **user_permissions,
-                "is_owner": is_owner,
-                "is_member": is_member,
-            }
+            self.access.as_context(permissions=["manage_open_roles_perm"])
         )
 
         return context
@@ -294,14 +326,16 @@ class ProjectOpenRoleDeleteView(ProjectPermissionRequiredMixin, DeleteView):
         )
 
 
-class TaskListView(ListView):
+class TaskListView(CursorPaginationMixin, ListView):
     model = Task
     template_name = "projects/task_list.html"
     context_object_name = "tasks"
     paginate_by = 10
+    cursor_ordering = ("-created_at", "-id")
 
     def dispatch(self, request, *args, **kwargs):
-        self.project = get_object_or_404(Project, pk=kwargs["project_pk"])
+        self.access = get_project_access(request, kwargs["project_pk"])
+        self.project = self.access.project
         return super().dispatch(request, *args, **kwargs)
 
     def get_queryset(self):
@@ -329,37 +363,12 @@ class TaskListView(ListView):
     def get_context_data(self, **kwargs):
         context = super(TaskListView, self).get_context_data(**kwargs)
 
-        self.user = self.request.user
-
         title = self.request.GET.get("title", "")
         assignee = self.request.GET.get("assignee", "")
         status = self.request.GET.get("status", "")
 
-        user_permissions = {}
-        is_owner = False
-        is_member = False
-
-        if self.user.is_authenticated:
-            membership = self.user.get_member_of(self.project)
-            is_owner = self.project.owner == self.user
-            is_member = membership is not None
-
-            if membership:
-                permissions = ["add_task_perm"]
-
-                user_permissions = {
-                    perm: getattr(membership, perm, False)
-                    for perm in permissions
-                }
-
         context["project"] = self.project
-        context.update(
-            {
-                **user_permissions,
-                "is_owner": is_owner,
-                "is_member": is_member,
-            }
-        )
+        context.update(self.access.as_context(permissions=["add_task_perm"]))
 
         context["search_form"] = TaskSearchForm(
             initial={
@@ -373,33 +382,33 @@ class TaskListView(ListView):
 
 
 @method_decorator(login_required, name="dispatch")
-class TaskDetailView(TaskPermissionRequiredMixin, DetailView):
+class TaskDetailView(
+    TaskPermissionRequiredMixin, ConditionalDetailMixin, DetailView
+):
     model = Task
     template_name = "projects/task_detail.html"
     context_object_name = "task"
     pk_url_kwarg = "task_pk"
     required_permission = "view_task"
 
-    def get_queryset(self):
-        return (
-            Task.objects.filter(pk=self.kwargs["task_pk"])
-            .select_related("assignee", "created_by", "project__owner")
-            .prefetch_related("tags")
+    def get(self, request, *args, **kwargs):
+        # The task and its project were loaded by the permission check.
+        return self.not_modified() or self.add_validators(
+            super().get(request, *args, **kwargs)
         )
 
+    def get_validator_stamps(self):
+        return [self.task.updated_at, self.project.updated_at]
+
+    def get_object(self, queryset=None):
+        return self.task
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        update_task_perm = (
-            self.object.assignee == self.request.user
-            or self.object.created_by == self.request.user
-            or self.user.is_owner(self.project)
-        )
+        update_task_perm = self.can_edit_task() or self.is_owner()
 
-        if not hasattr(self, "project"):
-            self.project = get_object_or_404(
-                Project, pk=self.object.project.pk
-            )
+        if "project_pk" not in self.kwargs:
             context["view_type"] = "my_tasks"
 
         context["project"] = self.project
@@ -435,6 +444,9 @@ class ProjectUpdateView(ProjectPermissionRequiredMixin, UpdateView):
     pk_url_kwarg = "project_pk"
     required_permission = "edit_project_info_perm"
 
+    def get_object(self, queryset=None):
+        return self.project
+
     def get_success_url(self):
         return reverse_lazy(
             "projects:project_detail", kwargs={"project_pk": self.object.pk}
@@ -462,10 +474,8 @@ class ProjectStageUpdateView(ProjectPermissionRequiredMixin, UpdateView):
     pk_url_kwarg = "project_pk"
     required_permission = "update_project_stage_perm"
 
-    def get_queryset(self):
-        return Project.objects.select_related("owner").prefetch_related(
-            "memberships"
-        )
+    def get_object(self, queryset=None):
+        return self.project
 
     def get_success_url(self):
         return reverse_lazy(
@@ -498,8 +508,6 @@ class ProjectRatingCreateView(ProjectRatingPermissionMixin, CreateView):
                 {"form": ProjectRatingForm(), "project": self.project},
             )
 
-        self.project.update_avg_score()
-
         return super().form_valid(form)
 
     def get_success_url(self):
@@ -516,29 +524,26 @@ class ProjectRolesUpdateView(ProjectPermissionRequiredMixin, UpdateView):
     pk_url_kwarg = "project_pk"
     required_permission = "update_project_roles_perm"
 
+    def get_object(self, queryset=None):
+        return self.project
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        if self.request.POST:
-            formset = ProjectMembershipFormSet(
-                self.request.POST,
-                instance=self.object,
-                form_kwargs={"project": self.object},
-            )
-        else:
-            formset = ProjectMembershipFormSet(
-                instance=self.object, form_kwargs={"project": self.object}
-            )
-        context["formset"] = formset
+        context["formset"] = kwargs.get("formset") or self.get_formset()
         return context
 
-    def post(self, request, *args, **kwargs):
-        self.object = self.get_object()
-        formset = ProjectMembershipFormSet(
-            self.request.POST,
+    def get_formset(self):
+        return ProjectMembershipFormSet(
+            self.request.POST or None,
             instance=self.object,
+            queryset=self.object.memberships.select_related("user"),
             form_kwargs={"project": self.object},
         )
+
+    def post(self, request, *args, **kwargs):
+        self.object = self.get_object()
+        formset = self.get_formset()
         if formset.is_valid():
             formset.save()
             return redirect(self.get_success_url())
@@ -586,6 +591,42 @@ class TaskCreateView(ProjectPermissionRequiredMixin, CreateView):
         )
 
 
+@method_decorator(login_required, name="dispatch")
+class TaskImportView(ProjectPermissionRequiredMixin, FormView):
+    form_class = TaskImportForm
+    template_name = "projects/forms/task_import_form.html"
+    required_permission = "add_task_perm"
+
+    def form_valid(self, form):
+        result = import_tasks(
+            self.project,
+            self.user,
+            form.cleaned_data["file"].file,
+            form.cleaned_data["format"],
+        )
+
+        if not result.errors and not result.warnings:
+            messages.success(
+                self.request, f"Imported {result.created} task(s)."
+            )
+            return redirect("projects:task_list", self.project.pk)
+
+        messages.warning(
+            self.request,
+            f"Imported {result.created} task(s), "
+            f"{len(result.warnings)} with warnings; "
+            f"{len(result.errors)} row(s) were skipped.",
+        )
+        return self.render_to_response(
+            self.get_context_data(form=form, result=result)
+        )
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["project"] = self.project
+        return context
+
+
 @method_decorator(login_required, name="dispatch")
 class TaskUpdateView(TaskPermissionRequiredMixin, UpdateView):
     model = Task
@@ -594,6 +635,9 @@ class TaskUpdateView(TaskPermissionRequiredMixin, UpdateView):
     pk_url_kwarg = "task_pk"
     required_permission = "update_task"
 
+    def get_object(self, queryset=None):
+        return self.task
+
     def get_form(self, *args, **kwargs):
         form = super().get_form(*args, **kwargs)
         form.fields["assignee"].queryset = get_user_model().objects.filter(
@@ -606,9 +650,7 @@ class TaskUpdateView(TaskPermissionRequiredMixin, UpdateView):
 
         assignee = form.cleaned_data.get("assignee")
         if assignee:
-            if not ProjectMembership.objects.filter(
-                project=self.project, user=assignee
-            ).exists():
+            if not get_cached_membership(assignee.pk, self.project.pk):
                 raise PermissionDenied(
                     "Assignee must be a member of this project."
                 )
@@ -672,7 +714,9 @@ class ProjectApplicationListView(MembershipPermissionRequiredMixin, ListView):
 
     def get_queryset(self):
 
-        qs = self.project.applications.all()
+        qs = self.project.applications.select_related("user", "role").order_by(
+            "-created_at", "-id"
+        )
         self.view_type = getattr(self, "view_type", "active")
 
         form = ProjectApplicationSearchForm(self.request.GET)
@@ -694,6 +738,17 @@ class ProjectApplicationListView(MembershipPermissionRequiredMixin, ListView):
 
         return qs
 
+    def get_paginator(self, queryset, *args, **kwargs):
+        paginator = super().get_paginator(queryset, *args, **kwargs)
+        is_filtered = getattr(self, "user_username", "") or getattr(
+            self, "role", ""
+        )
+        if self.view_type == "active" and not is_filtered:
+            # Unfiltered, the active tab lists exactly the pending
+            # applications the project already counts.
+            paginator.count = self.project.pending_applications_count
+        return paginator
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
@@ -702,8 +757,95 @@ class ProjectApplicationListView(MembershipPermissionRequiredMixin, ListView):
         )
         context["view_type"] = self.view_type
         context["project"] = self.project
+        context["can_review"] = self.access.has_permission(
+            "manage_open_roles_perm"
+        )
         return context
 
+    def post(self, request, *args, **kwargs):
+        """Approve or reject every application ticked on the page."""
+        if not self.access.has_permission("manage_open_roles_perm"):
+            messages.warning(
+                request,
+                "You do not have permission to review these applications.",
+            )
+            return redirect("projects:applications_list", self.project.pk)
+
+        decision = request.POST.get("decision")
+        application_ids = [
+            int(value)
+            for value in request.POST.getlist("applications")
+            if value.isdigit()
+        ]
+        if decision not in REVIEW_DECISIONS or not application_ids:
+            messages.warning(
+                request, "Select the applications to approve or reject."
+            )
+            return redirect("projects:applications_list", self.project.pk)
+
+        try:
+            result = review_applications(
+                self.project, application_ids, decision
+            )
+        except DatabaseError:
+            messages.error(
+                request, "An error occurred while reviewing the applications."
+            )
+            return redirect("projects:applications_list", self.project.pk)
+
+        for outcome, verb in (
+            ("accepted", "Approved"),
+            ("rejected", "Rejected"),
+        ):
+            if usernames := result.usernames(outcome):
+                messages.success(
+                    request,
+                    f"{verb} {len(usernames)} application(s): "
+                    f"{', '.join(usernames)}.",
+                )
+        for outcome, reason in (
+            ("already_member", "already members of the project"),
+            ("processed", "already processed"),
+        ):
+            if usernames := result.usernames(outcome):
+                messages.warning(
+                    request, f"Skipped {', '.join(usernames)}: {reason}."
+                )
+        if missing := result.usernames("missing"):
+            messages.warning(
+                request, f"{len(missing)} application(s) were not found."
+            )
+
+        return redirect("projects:applications_list", self.project.pk)
+
+
+@method_decorator(login_required, name="dispatch")
+class ProjectExportView(ProjectPermissionRequiredMixin, View):
+    """
+    Stream a project's tasks, applications or memberships as CSV
+    (``?format=csv``, the default) or JSON Lines (``?format=jsonl``).
+    """
+
+    export = None
+
+    def has_required_permission(self):
+        # Without a finer permission the export is for the team only, like
+        # the task pages.
+        if not self.required_permission:
+            return self.is_owner() or self.is_member()
+        return super().has_required_permission()
+
+    def get(self, request, *args, **kwargs):
+        export_format = request.GET.get("format", "csv")
+        if export_format not in EXPORT_FORMATS:
+            return HttpResponseBadRequest(
+                f"Unknown export format: {export_format}"
+            )
+
+        return export_response(
+            request, self.export, self.project, export_format
+        )
+
 
 @login_required
 @validate_permissions_application_review
@@ -760,3 +902,28 @@ def application_reject(request, **kwargs):
         )
 
     return redirect("projects:applications_list", project.pk)
+
+
+def metrics(request):
+    """
+    Per-view request histograms, membership cache hits and misses,
+    connection pool stats and background job queue depth and latency in
+    the Prometheus text format. Scrapers authenticate with
+    ``Authorization: Bearer <METRICS_TOKEN>``; without a token configured
+    the endpoint only exists in DEBUG.
+    """
+    token = settings.METRICS_TOKEN
+    if token:
+        if not constant_time_compare(
+            request.headers.get("Authorization", ""), f"Bearer {token}"
+        ):
+            raise Http404
+    elif not settings.DEBUG:
+        raise Http404
+
+    return HttpResponse(
+        registry.render()
+        + render_pool_stats(pool_stats(), PREFIX)
+        + render_queue_stats(queue_stats(), PREFIX),
+        content_type="text/plain; version=0.0.4",
+    )
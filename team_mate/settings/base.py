@@ -21,6 +21,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "projects.middleware.RequestMetricsMiddleware",
+    "projects.middleware.NPlusOneMiddleware",
+    "projects.db_router.ReplicaRoutingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -51,6 +54,13 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "team_mate.wsgi.application"
 
+# Read replicas: aliases in DATABASES that list and detail reads may use.
+# A browser that wrote keeps reading from the primary for
+# REPLICA_STICKY_SECONDS so it sees its own changes.
+DATABASE_ROUTERS = ["projects.db_router.PrimaryReplicaRouter"]
+DATABASE_REPLICAS = []
+REPLICA_STICKY_SECONDS = int(os.environ.get("REPLICA_STICKY_SECONDS", 10))
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -100,6 +110,37 @@ AUTH_USER_MODEL = "users.Developer"
 LOGOUT_REDIRECT_URL = "projects:project_list"
 LOGIN_URL = "users:login"
 
+# Cache
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# Seconds a user's cached project memberships live before being rebuilt.
+MEMBERSHIP_CACHE_TIMEOUT = 300
+
+# Developer suggestions: minimum trigram word similarity for a typo to
+# still match, and seconds a suggestion (and the in-memory trigram index
+# used instead of pg_trgm outside Postgres) may be stale.
+DEVELOPER_SUGGEST_THRESHOLD = 0.3
+DEVELOPER_SUGGEST_CACHE_SECONDS = 60
+
+# Background jobs (projects.service.jobs): run handlers inline at enqueue()
+# instead of queueing them for manage.py run_workers.
+JOBS_RUN_INLINE = False
+
+# Metrics
+METRICS_ENABLED = True
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+
+# N+1 query detection: MODE is "off", "log", "header" or "raise".
+NPLUSONE = {
+    "MODE": os.environ.get("NPLUSONE_MODE", "off"),
+    "THRESHOLD": 3,
+    "SAMPLE_RATE": float(os.environ.get("NPLUSONE_SAMPLE_RATE", "1.0")),
+}
+
 # Crispy Forms
 CRISPY_ALLOWED_TEMPLATE_PACKS = "bootstrap5"
 CRISPY_TEMPLATE_PACK = "bootstrap5"
@@ -17,6 +17,23 @@ DATABASES = {
     }
 }
 
+# Point SQLITE_REPLICA at a copy of db.sqlite3 to try replica routing.
+SQLITE_REPLICA = os.environ.get("SQLITE_REPLICA")
+if SQLITE_REPLICA:
+    DATABASES["replica"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": SQLITE_REPLICA,
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS = ["replica"]
+
+# No job worker is needed locally; JOBS_RUN_INLINE=0 queues jobs for
+# manage.py run_workers instead.
+JOBS_RUN_INLINE = os.environ.get("JOBS_RUN_INLINE", "1") == "1"
+
+# Fail tests on N+1 queries, flag them in a response header otherwise.
+NPLUSONE["MODE"] = "raise" if "test" in sys.argv else "header"
+
 ENABLE_DEBUG_TOOLBAR = DEBUG and "test" not in sys.argv
 if ENABLE_DEBUG_TOOLBAR:
     INTERNAL_IPS = [
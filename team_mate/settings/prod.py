@@ -19,5 +19,53 @@ DATABASES = {
         "PASSWORD": os.environ.get("POSTGRES_PASSWORD"),
         "HOST": os.environ.get("POSTGRES_HOST"),
         "PORT": int(os.environ.get("POSTGRES_DB_PORT")),
+        # Connections come from a psycopg_pool pool instead of being opened
+        # per request; pooling requires CONN_MAX_AGE to stay 0. With health
+        # checks on, the pool tests a connection before lending it out.
+        "CONN_MAX_AGE": 0,
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            # Lets developer suggestions match typos through pg_trgm's <%
+            # operator, which uses this threshold.
+            "options": "-c pg_trgm.word_similarity_threshold="
+            f"{DEVELOPER_SUGGEST_THRESHOLD}",
+            "pool": {
+                "min_size": int(os.environ.get("DB_POOL_MIN_SIZE", 2)),
+                "max_size": int(os.environ.get("DB_POOL_MAX_SIZE", 10)),
+                # Seconds a request waits for a connection before failing.
+                "timeout": float(os.environ.get("DB_POOL_TIMEOUT", 10)),
+                "max_lifetime": float(
+                    os.environ.get("DB_POOL_MAX_LIFETIME", 1800)
+                ),
+                "max_idle": float(os.environ.get("DB_POOL_MAX_IDLE", 600)),
+            },
+        },
+    }
+}
+
+# Comma-separated read replica hosts sharing the primary's credentials.
+REPLICA_HOSTS = [
+    host.strip()
+    for host in os.environ.get("POSTGRES_REPLICA_HOSTS", "").split(",")
+    if host.strip()
+]
+for index, host in enumerate(REPLICA_HOSTS, start=1):
+    DATABASES[f"replica{index}"] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "TEST": {"MIRROR": "default"},
+    }
+DATABASE_REPLICAS = [
+    f"replica{index}" for index, _ in enumerate(REPLICA_HOSTS, start=1)
+]
+
+# The cache must be shared between the web and job worker processes: the
+# membership cache is invalidated in the process making the change, and a
+# per-process cache would keep serving stale permissions everywhere else.
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
     }
 }
@@ -14,6 +14,8 @@ class DeveloperSearchForm(forms.Form):
                 "id": "voice-search",
                 "placeholder": "Search developers...",
                 "class": "form-control",
+                "list": "developer-suggestions",
+                "autocomplete": "off",
             }
         ),
     )
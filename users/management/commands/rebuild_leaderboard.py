@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from users.service.leaderboard import rebuild_leaderboard
+
+
+class Command(BaseCommand):
+    help = "Recompute every leaderboard entry and rank from scratch."
+
+    def handle(self, *args, **options):
+        """Entrypoint for command"""
+        count = rebuild_leaderboard()
+        self.stdout.write(
+            self.style.SUCCESS(f"Leaderboard rebuilt: {count} developers.")
+        )
@@ -0,0 +1,82 @@
+# Generated by Django 5.2.7 on 2026-10-17 19:46
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Avg, FloatField, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_leaderboard(apps, schema_editor):
+    Developer = apps.get_model("users", "Developer")
+    LeaderboardEntry = apps.get_model("users", "LeaderboardEntry")
+
+    rows = (
+        Developer.objects.annotate(
+            avg=Coalesce(
+                Avg("projects__score"), Value(0.0), output_field=FloatField()
+            )
+        )
+        .order_by("-avg", "username")
+        .values_list("id", "username", "avg")
+    )
+
+    entries = []
+    previous_score = None
+    rank = 0
+    for position, (developer_id, username, avg) in enumerate(rows, start=1):
+        if avg != previous_score:
+            rank = position
+            previous_score = avg
+        entries.append(
+            LeaderboardEntry(
+                developer_id=developer_id,
+                username=username,
+                avg_score=avg,
+                rank=rank,
+            )
+        )
+
+    LeaderboardEntry.objects.bulk_create(entries, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0005_developer_avg_projects_score"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LeaderboardEntry",
+            fields=[
+                (
+                    "developer",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="leaderboard_entry",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("username", models.CharField(max_length=150)),
+                ("avg_score", models.FloatField(default=0)),
+                ("rank", models.PositiveIntegerField(default=1)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["rank", "username"],
+                        name="users_leade_rank_acc6c7_idx",
+                    ),
+                    models.Index(
+                        fields=["avg_score"],
+                        name="users_leade_avg_sco_361650_idx",
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(populate_leaderboard, migrations.RunPython.noop),
+    ]
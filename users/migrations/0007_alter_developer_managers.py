@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-17 19:49
+
+import users.service.managers
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0006_leaderboardentry"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="developer",
+            managers=[
+                ("objects", users.service.managers.DeveloperManager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations
+
+POSTGRES_FORWARDS = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX users_leaderboardentry_username_trgm_idx "
+    "ON users_leaderboardentry USING gin (username gin_trgm_ops)",
+]
+
+POSTGRES_BACKWARDS = [
+    "DROP INDEX IF EXISTS users_leaderboardentry_username_trgm_idx",
+]
+
+
+def _run(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0007_alter_developer_managers"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run(POSTGRES_FORWARDS), _run(POSTGRES_BACKWARDS)
+        ),
+    ]
@@ -3,6 +3,7 @@ from django.contrib.auth.models import AbstractUser
 from django.db.models import Avg
 from team_mate.settings import base
 from projects.models import Project, ProjectMembership
+from users.service.managers import DeveloperManager
 
 user_model = base.AUTH_USER_MODEL
 
@@ -33,6 +34,8 @@ class Developer(AbstractUser):
     telegram_contact = models.CharField(max_length=255, blank=True)
     discord_contact = models.CharField(max_length=255, blank=True)
 
+    objects = DeveloperManager()
+
     def __str__(self):
         return self.username
 
@@ -77,3 +80,25 @@ class DeveloperRatings(models.Model):
     )
     rating = models.FloatField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
+
+
+class LeaderboardEntry(models.Model):
+    developer = models.OneToOneField(
+        user_model,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="leaderboard_entry",
+    )
+    username = models.CharField(max_length=150)
+    avg_score = models.FloatField(default=0)
+    rank = models.PositiveIntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["rank", "username"]),
+            models.Index(fields=["avg_score"]),
+        ]
+
+    def __str__(self):
+        return f"#{self.rank} {self.username}"
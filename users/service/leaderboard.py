@@ -0,0 +1,181 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import (
+    Avg,
+    Case,
+    F,
+    FloatField,
+    Func,
+    OuterRef,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from projects.models import ProjectMembership
+from users.models import LeaderboardEntry
+
+
+def _rank_of(score, exclude_pk):
+    return (
+        LeaderboardEntry.objects.filter(avg_score__gt=score)
+        .exclude(pk=exclude_pk)
+        .count()
+        + 1
+    )
+
+
+def _shift_expression(changes):
+    """
+    Build the rank delta for rows that did not change themselves: a row
+    with score ``s`` gains one place for every developer that fell from
+    above ``s`` to at most ``s`` and loses one for every developer that
+    rose above it. The delta is constant between consecutive scores.
+    """
+    bounds = sorted(
+        {score for entry, new in changes for score in (entry.avg_score, new)}
+    )
+    whens = []
+
+    for lower, upper in zip(bounds, bounds[1:]):
+        delta = sum(new > lower for _, new in changes) - sum(
+            entry.avg_score > lower for entry, _ in changes
+        )
+        whens.append(When(avg_score__lt=upper, then=Value(delta)))
+
+    return bounds, Case(*whens, default=Value(0))
+
+
+def _move_many(changes):
+    """
+    Move every ``(entry, new_score)`` pair at once: one range UPDATE shifts
+    the rows in between, one bulk UPDATE stores the new scores and one more
+    recomputes the moved rows' ranks, however many developers moved.
+    """
+    moved_ids = [entry.pk for entry, _ in changes]
+    bounds, shift = _shift_expression(changes)
+
+    LeaderboardEntry.objects.filter(
+        avg_score__gte=bounds[0], avg_score__lt=bounds[-1]
+    ).exclude(pk__in=moved_ids).update(rank=F("rank") + shift)
+
+    now = timezone.now()
+    for entry, new_score in changes:
+        entry.avg_score = new_score
+        entry.updated_at = now
+    LeaderboardEntry.objects.bulk_update(
+        [entry for entry, _ in changes], ["avg_score", "updated_at"]
+    )
+
+    higher = LeaderboardEntry.objects.filter(
+        avg_score__gt=OuterRef("avg_score")
+    ).annotate(count=Func(F("pk"), function="COUNT"))
+    LeaderboardEntry.objects.filter(pk__in=moved_ids).update(
+        rank=Subquery(higher.values("count")) + 1
+    )
+
+
+def _average_scores(developer_ids):
+    return dict(
+        ProjectMembership.objects.filter(user_id__in=developer_ids)
+        .order_by()
+        .values("user_id")
+        .annotate(avg=Avg("project__score"))
+        .values_list("user_id", "avg")
+    )
+
+
+def add_developer(developer):
+    with transaction.atomic():
+        LeaderboardEntry.objects.filter(avg_score__lt=0).update(
+            rank=F("rank") + 1
+        )
+        LeaderboardEntry.objects.create(
+            developer=developer,
+            username=developer.username,
+            avg_score=0,
+            rank=_rank_of(0, developer.pk),
+        )
+
+
+def remove_developer(developer_id):
+    with transaction.atomic():
+        entry = (
+            LeaderboardEntry.objects.select_for_update()
+            .filter(pk=developer_id)
+            .first()
+        )
+        if entry is None:
+            return
+
+        entry.delete()
+        LeaderboardEntry.objects.filter(avg_score__lt=entry.avg_score).update(
+            rank=F("rank") - 1
+        )
+
+
+def refresh_developers(developer_ids):
+    """
+    Recompute the average project score of the given developers and move
+    their leaderboard rows; untouched developers keep their rows.
+    """
+    developer_ids = set(developer_ids)
+    if not developer_ids:
+        return
+
+    scores = _average_scores(developer_ids)
+
+    with transaction.atomic():
+        entries = LeaderboardEntry.objects.select_for_update().filter(
+            developer_id__in=developer_ids
+        )
+        changes = []
+        for entry in entries:
+            new_score = float(scores.get(entry.developer_id) or 0)
+            if new_score != entry.avg_score:
+                changes.append((entry, new_score))
+
+        if changes:
+            _move_many(changes)
+
+
+def rebuild_leaderboard(batch_size=1000):
+    """
+    Recompute every row from scratch, e.g. after ``loaddata`` or bulk
+    imports that bypass signals. Returns the number of entries written.
+    """
+    rows = (
+        get_user_model()
+        .objects.annotate(
+            avg=Coalesce(
+                Avg("projects__score"), Value(0.0), output_field=FloatField()
+            )
+        )
+        .order_by("-avg", "username")
+        .values_list("id", "username", "avg")
+    )
+
+    entries = []
+    previous_score = None
+    rank = 0
+
+    for position, (developer_id, username, avg) in enumerate(rows, start=1):
+        if avg != previous_score:
+            rank = position
+            previous_score = avg
+        entries.append(
+            LeaderboardEntry(
+                developer_id=developer_id,
+                username=username,
+                avg_score=avg,
+                rank=rank,
+            )
+        )
+
+    with transaction.atomic():
+        LeaderboardEntry.objects.all().delete()
+        LeaderboardEntry.objects.bulk_create(entries, batch_size=batch_size)
+
+    return len(entries)
@@ -0,0 +1,37 @@
+from django.contrib.auth.models import UserManager
+from django.db.models import (
+    Avg,
+    DecimalField,
+    FloatField,
+    OuterRef,
+    Subquery,
+    Value,
+)
+from django.db.models.functions import Cast, Coalesce
+
+from projects.models import ProjectMembership
+
+
+class DeveloperManager(UserManager):
+
+    def update_avg_project_scores(self, developer_ids):
+        """
+        Recompute ``avg_projects_score`` for the given developers with a
+        single correlated UPDATE instead of one query pair per developer.
+        """
+        avg_score = (
+            ProjectMembership.objects.filter(user=OuterRef("pk"))
+            .order_by()
+            .values("user")
+            .annotate(avg=Avg("project__score"))
+            .values("avg")
+        )
+        return self.filter(pk__in=developer_ids).update(
+            avg_projects_score=Cast(
+                Coalesce(
+                    Subquery(avg_score, output_field=FloatField()),
+                    Value(0.0),
+                ),
+                DecimalField(max_digits=3, decimal_places=2),
+            )
+        )
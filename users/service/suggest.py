@@ -0,0 +1,246 @@
+import hashlib
+import heapq
+import re
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import BooleanField, FloatField
+from django.db.models.expressions import RawSQL
+
+from users.models import LeaderboardEntry
+
+SUGGEST_LIMIT = 10
+MAX_SUGGEST_LIMIT = 25
+MAX_QUERY_LENGTH = 150
+
+_WORD = re.compile(r"[^\W_]+")
+
+# Bumped whenever a username is added, renamed or removed. Cached results
+# and every process's ``TrigramIndex`` are tied to the version they were
+# built at.
+_VERSION_KEY = "developer_suggest:version"
+
+
+def normalize_query(query):
+    return " ".join((query or "").lower().split())[:MAX_QUERY_LENGTH]
+
+
+def trigrams(text):
+    """
+    The trigrams pg_trgm extracts from ``text``: every alphanumeric word,
+    lower-cased and padded with two spaces in front and one behind.
+    """
+    grams = set()
+    for word in _WORD.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _row(entry_id, username, avg_score, rank, similarity):
+    return {
+        "id": entry_id,
+        "username": username,
+        "avg_score": avg_score,
+        "rank": rank,
+        "similarity": round(similarity, 3),
+    }
+
+
+def _postgres_suggest(query, limit):
+    # ``<%`` is pg_trgm's word similarity operator; its threshold comes from
+    # pg_trgm.word_similarity_threshold, set on the connection in prod.
+    table = LeaderboardEntry._meta.db_table
+    prefix = query.replace("\\", "\\\\").replace("%", "\\%")
+    prefix = prefix.replace("_", "\\_") + "%"
+
+    entries = (
+        LeaderboardEntry.objects.alias(
+            is_match=RawSQL(
+                f"(%s <%% {table}.username OR {table}.username ILIKE %s)",
+                (query, prefix),
+                output_field=BooleanField(),
+            ),
+            is_prefix=RawSQL(
+                f"{table}.username ILIKE %s",
+                (prefix,),
+                output_field=BooleanField(),
+            ),
+        )
+        .annotate(
+            similarity=RawSQL(
+                f"word_similarity(%s, {table}.username)",
+                (query,),
+                output_field=FloatField(),
+            ),
+            closeness=RawSQL(
+                f"similarity(%s, {table}.username)",
+                (query,),
+                output_field=FloatField(),
+            ),
+        )
+        .filter(is_match=True)
+        .order_by(
+            "-is_prefix",
+            "-similarity",
+            "-closeness",
+            "-avg_score",
+            "username",
+        )
+        .values_list("pk", "username", "avg_score", "rank", "similarity")
+    )
+    return [_row(*entry) for entry in entries[:limit]]
+
+
+class TrigramIndex:
+    """
+    In-memory stand-in for a pg_trgm index over leaderboard usernames, for
+    databases without pg_trgm. ``search`` approximates word similarity as
+    the share of the query's trigrams found anywhere in the username and
+    breaks ties by pg_trgm's ``similarity`` of the whole strings.
+    """
+
+    def __init__(self, rows):
+        self.rows = []
+        self.names = []
+        self.sizes = []
+        self.postings = {}
+        for position, row in enumerate(rows):
+            grams = trigrams(row[1])
+            self.rows.append(row)
+            self.names.append(row[1].lower())
+            self.sizes.append(len(grams))
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(position)
+
+    @classmethod
+    def build(cls):
+        return cls(
+            LeaderboardEntry.objects.values_list(
+                "pk", "username", "avg_score", "rank"
+            ).iterator(chunk_size=5000)
+        )
+
+    def search(self, query, limit, threshold):
+        grams = trigrams(query)
+        if not grams:
+            return []
+
+        shared = Counter()
+        for gram in grams:
+            shared.update(self.postings.get(gram, ()))
+
+        matches = []
+        for position, count in shared.items():
+            similarity = count / len(grams)
+            is_prefix = self.names[position].startswith(query)
+            if similarity >= threshold or is_prefix:
+                closeness = count / (len(grams) + self.sizes[position] - count)
+                matches.append(
+                    (
+                        is_prefix,
+                        similarity,
+                        closeness,
+                        self.rows[position][2],
+                        position,
+                    )
+                )
+
+        return [
+            _row(*self.rows[match[-1]], match[1])
+            for match in heapq.nlargest(limit, matches)
+        ]
+
+
+_index = None
+_index_built_at = 0.0
+_index_version = None
+_index_lock = threading.Lock()
+
+
+def _current_version():
+    version = cache.get(_VERSION_KEY)
+    if version is None:
+        version = 1
+        cache.add(_VERSION_KEY, version, timeout=None)
+    return version
+
+
+def _bump():
+    try:
+        cache.incr(_VERSION_KEY)
+    except ValueError:
+        cache.set(_VERSION_KEY, 2, timeout=None)
+
+
+def get_index():
+    """
+    The process's ``TrigramIndex``, rebuilt once it is older than
+    ``DEVELOPER_SUGGEST_CACHE_SECONDS`` or after ``invalidate_index()`` in
+    any process.
+    """
+    global _index, _index_built_at, _index_version
+
+    max_age = settings.DEVELOPER_SUGGEST_CACHE_SECONDS
+    version = _current_version()
+    with _index_lock:
+        if (
+            _index is None
+            or _index_version != version
+            or time.monotonic() - _index_built_at > max_age
+        ):
+            _index = TrigramIndex.build()
+            _index_built_at = time.monotonic()
+            _index_version = version
+        return _index
+
+
+def invalidate_index():
+    """
+    Drop the suggestion index and cached results after usernames changed.
+    The version is bumped right away and again once the surrounding
+    transaction commits, so results built from not yet committed rows in
+    between cannot outlive the write.
+    """
+    global _index
+
+    with _index_lock:
+        _index = None
+    _bump()
+
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(_bump)
+
+
+def _suggest(query, limit):
+    if connection.vendor == "postgresql":
+        return _postgres_suggest(query, limit)
+    return get_index().search(
+        query, limit, settings.DEVELOPER_SUGGEST_THRESHOLD
+    )
+
+
+def suggest_developers(query, limit=SUGGEST_LIMIT):
+    """
+    Up to ``limit`` leaderboard entries whose username matches ``query``,
+    typos included: usernames starting with the query first, then by
+    trigram similarity, then by average project score. Results are cached
+    per normalized query for ``DEVELOPER_SUGGEST_CACHE_SECONDS``, or until
+    a username is added, renamed or removed.
+    """
+    query = normalize_query(query)
+    limit = max(1, min(limit, MAX_SUGGEST_LIMIT))
+    if not query:
+        return []
+
+    digest = hashlib.md5(query.encode(), usedforsecurity=False).hexdigest()
+    return cache.get_or_set(
+        f"developer_suggest:{limit}:{digest}",
+        lambda: _suggest(query, limit),
+        settings.DEVELOPER_SUGGEST_CACHE_SECONDS,
+        version=_current_version(),
+    )
@@ -0,0 +1,61 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from projects.models import Project, ProjectMembership
+from projects.service.deferred import defer_once
+from users.models import LeaderboardEntry
+from users.service.leaderboard import (
+    add_developer,
+    refresh_developers,
+    remove_developer,
+)
+from users.service.suggest import invalidate_index
+
+Developer = get_user_model()
+
+
+@receiver(post_save, sender=Developer)
+def leaderboard_developer_saved(sender, instance, created, **kwargs):
+    if created:
+        add_developer(instance)
+        invalidate_index()
+        return
+
+    update_fields = kwargs.get("update_fields")
+    if update_fields is None or "username" in update_fields:
+        renamed = (
+            LeaderboardEntry.objects.filter(developer=instance)
+            .exclude(username=instance.username)
+            .update(username=instance.username)
+        )
+        if renamed:
+            invalidate_index()
+
+
+@receiver(pre_delete, sender=Developer)
+def leaderboard_developer_deleted(sender, instance, **kwargs):
+    remove_developer(instance.pk)
+    invalidate_index()
+
+
+# Memberships added or removed together (a new project, a roles formset, a
+# deleted project) refresh each developer once, after the commit.
+@receiver(post_save, sender=ProjectMembership)
+def leaderboard_membership_saved(sender, instance, created, **kwargs):
+    if created:
+        defer_once(refresh_developers, instance.user_id)
+
+
+@receiver(post_delete, sender=ProjectMembership)
+def leaderboard_membership_deleted(sender, instance, **kwargs):
+    defer_once(refresh_developers, instance.user_id)
+
+
+@receiver(post_save, sender=Project)
+def leaderboard_project_score_changed(sender, instance, created, **kwargs):
+    update_fields = kwargs.get("update_fields")
+    if created or (update_fields is not None and "score" not in update_fields):
+        return
+
+    refresh_developers(instance.memberships.values_list("user_id", flat=True))
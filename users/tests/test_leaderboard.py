@@ -0,0 +1,99 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from projects.models import Project, ProjectMembership
+from users.models import LeaderboardEntry
+from users.service.leaderboard import rebuild_leaderboard
+
+user_model = get_user_model()
+
+
+class LeaderboardTest(TestCase):
+
+    def setUp(self):
+        self.alice = user_model.objects.create_user(
+            username="alice", password="pass"
+        )
+        self.bob = user_model.objects.create_user(
+            username="bob", password="pass"
+        )
+        self.carol = user_model.objects.create_user(
+            username="carol", password="pass"
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project = Project.objects.create(
+                name="Alpha", owner=self.alice
+            )
+            ProjectMembership.objects.create(
+                project=self.project, user=self.bob
+            )
+
+    def ranks(self):
+        return dict(LeaderboardEntry.objects.values_list("username", "rank"))
+
+    def set_score(self, project, score):
+        project.score = score
+        project.save(update_fields=["score"])
+
+    def assert_matches_rebuild(self):
+        incremental = set(
+            LeaderboardEntry.objects.values_list(
+                "developer_id", "avg_score", "rank"
+            )
+        )
+        rebuild_leaderboard()
+        rebuilt = set(
+            LeaderboardEntry.objects.values_list(
+                "developer_id", "avg_score", "rank"
+            )
+        )
+        self.assertEqual(incremental, rebuilt)
+
+    def test_new_developers_share_rank(self):
+        self.assertEqual(self.ranks(), {"alice": 1, "bob": 1, "carol": 1})
+
+    def test_score_change_moves_members(self):
+        self.set_score(self.project, 4.5)
+
+        self.assertEqual(self.ranks(), {"alice": 1, "bob": 1, "carol": 3})
+        self.assert_matches_rebuild()
+
+    def test_membership_changes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            other = Project.objects.create(name="Beta", owner=self.carol)
+        self.set_score(self.project, 3)
+        self.set_score(other, 5)
+
+        self.assertEqual(self.ranks(), {"carol": 1, "alice": 2, "bob": 2})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ProjectMembership.objects.create(project=other, user=self.bob)
+        self.assertEqual(self.ranks(), {"carol": 1, "bob": 2, "alice": 3})
+        self.assert_matches_rebuild()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ProjectMembership.objects.get(
+                project=other, user=self.bob
+            ).delete()
+        self.assertEqual(self.ranks(), {"carol": 1, "alice": 2, "bob": 2})
+        self.assert_matches_rebuild()
+
+    def test_deleting_developer_closes_gap(self):
+        other = Project.objects.create(name="Beta", owner=self.carol)
+        self.set_score(other, 5)
+        self.set_score(self.project, 3)
+
+        self.carol.delete()
+
+        self.assertEqual(self.ranks(), {"alice": 1, "bob": 1})
+        self.assert_matches_rebuild()
+
+    def test_search_keeps_global_rank(self):
+        self.set_score(self.project, 4)
+        self.client.force_login(self.carol)
+
+        response = self.client.get("/leaderboard/", {"username": "car"})
+
+        entries = list(response.context["entries"])
+        self.assertEqual([e.username for e in entries], ["carol"])
+        self.assertEqual(entries[0].rank, 3)
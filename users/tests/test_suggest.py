@@ -0,0 +1,123 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from users.models import LeaderboardEntry
+from users.service.suggest import (
+    TrigramIndex,
+    invalidate_index,
+    suggest_developers,
+    trigrams,
+)
+
+user_model = get_user_model()
+
+
+class TrigramIndexTest(SimpleTestCase):
+    def setUp(self):
+        # (id, username, avg_score, rank)
+        self.index = TrigramIndex(
+            [
+                (1, "alice", 4.0, 2),
+                (2, "malice_dev", 3.0, 3),
+                (3, "alicia", 4.5, 1),
+                (4, "bob", 1.0, 4),
+            ]
+        )
+
+    def usernames(self, query, limit=10):
+        return [
+            row["username"] for row in self.index.search(query, limit, 0.3)
+        ]
+
+    def test_trigrams_match_pg_trgm(self):
+        # SELECT show_trgm('Foo_bar');
+        self.assertEqual(
+            trigrams("Foo_bar"),
+            {"  f", " fo", "foo", "oo ", "  b", " ba", "bar", "ar "},
+        )
+
+    def test_prefix_matches_rank_first(self):
+        self.assertEqual(self.usernames("ali"), ["alice", "alicia"])
+        self.assertEqual(self.usernames("malic")[:2], ["malice_dev", "alice"])
+
+    def test_tolerates_typos(self):
+        self.assertEqual(self.usernames("alise")[0], "alice")
+        self.assertIn("bob", self.usernames("bobb"))
+
+    def test_score_breaks_ties(self):
+        index = TrigramIndex([(1, "sam", 1.0, 2), (2, "sam", 3.0, 1)])
+
+        self.assertEqual(
+            [row["id"] for row in index.search("sam", 2, 0.3)], [2, 1]
+        )
+
+    def test_limit_and_no_match(self):
+        self.assertEqual(len(self.usernames("ali", limit=1)), 1)
+        self.assertEqual(self.usernames("zzz"), [])
+
+
+class DeveloperSuggestTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        invalidate_index()
+        for username in ("alice", "alicia", "bob"):
+            user_model.objects.create_user(username=username, password="pass")
+        LeaderboardEntry.objects.filter(username="alice").update(avg_score=4)
+        self.url = reverse("users:developer_suggest")
+
+    def test_returns_ranked_json(self):
+        response = self.client.get(self.url, {"q": " ALI ", "limit": "5"})
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["query"], "ali")
+        self.assertEqual(
+            [row["username"] for row in data["results"]], ["alice", "alicia"]
+        )
+        alice = user_model.objects.get(username="alice")
+        self.assertEqual(
+            data["results"][0]["url"],
+            reverse("users:profile", args=[alice.pk]),
+        )
+
+    def test_is_cacheable_per_query(self):
+        first = self.client.get(self.url, {"q": "ali"})
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url, {"q": "Ali"})
+
+        self.assertIn("public", first["Cache-Control"])
+        self.assertIn("max-age=60", first["Cache-Control"])
+        self.assertNotIn("Cookie", first.get("Vary", ""))
+        self.assertEqual(first.json()["results"], second.json()["results"])
+
+    def test_new_developers_are_suggested(self):
+        suggest_developers("carl")
+
+        user_model.objects.create_user(username="carlos", password="pass")
+
+        self.assertEqual(
+            [row["username"] for row in suggest_developers("carl")],
+            ["carlos"],
+        )
+
+    def test_renamed_and_deleted_developers_drop_out(self):
+        self.assertEqual(len(suggest_developers("alic")), 2)
+
+        alicia = user_model.objects.get(username="alicia")
+        alicia.username = "zoe"
+        alicia.save()
+        self.assertEqual(
+            [row["username"] for row in suggest_developers("alic")],
+            ["alice"],
+        )
+
+        user_model.objects.get(username="alice").delete()
+        self.assertEqual(suggest_developers("alic"), [])
+
+    def test_empty_query(self):
+        response = self.client.get(self.url, {"q": "  "})
+
+        self.assertEqual(response.json()["results"], [])
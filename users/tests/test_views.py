@@ -33,3 +33,15 @@ class DevelopersViewsTest(TestCase):
         self.assertContains(response, self.user.username)
         self.assertContains(response, "Alpha Project")
         self.assertContains(response, "Beta Project")
+
+    def test_leaderboard_cursor_pages(self):
+        for i in range(12):
+            user_model.objects.create_user(username=f"dev{i:02}", password="p")
+
+        response = self.client.get("/leaderboard/")
+        self.assertEqual(len(response.context["entries"]), 10)
+
+        next_cursor = response.context["page_obj"].next_cursor
+        response = self.client.get("/leaderboard/", {"cursor": next_cursor})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["entries"]), 3)
@@ -16,6 +16,11 @@ urlpatterns = [
         name="profile",
     ),
     path("leaderboard/", views.LeaderboardView.as_view(), name="leaderboard"),
+    path(
+        "developers/suggest/",
+        views.developer_suggest,
+        name="developer_suggest",
+    ),
     path(
         "profile/<int:user_pk>/update/",
         views.DeveloperUpdateView.as_view(),
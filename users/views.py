@@ -1,13 +1,26 @@
+import asyncio
+
 from django.contrib.auth import get_user_model, login
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
-from django.shortcuts import redirect
-from django.urls import reverse_lazy
+from django.http import JsonResponse
+from django.shortcuts import aget_object_or_404, redirect
+from django.urls import reverse, reverse_lazy
+from django.utils.cache import patch_cache_control
 from django.utils.decorators import method_decorator
 from django.views.generic import ListView, DetailView, UpdateView
-from django.db.models import Avg
+from django.db.models import Q
 from django.views.generic import FormView
 
 from projects.models import ProjectMembership, Project, Task
+from projects.service.access import aget_request_user
+from projects.service.pagination import AsyncCursorListMixin
+from users.models import LeaderboardEntry
+from users.service.suggest import (
+    SUGGEST_LIMIT,
+    normalize_query,
+    suggest_developers,
+)
 from users.forms import (
     DeveloperSearchForm,
     DeveloperForm,
@@ -35,29 +48,24 @@ class RegisterView(FormView):
         )
 
 
-class LeaderboardView(ListView):
-    model = user_model
+class LeaderboardView(AsyncCursorListMixin, ListView):
+    model = LeaderboardEntry
     template_name = "users/leaderboard.html"
-    context_object_name = "developers"
+    context_object_name = "entries"
     paginate_by = 10
+    cursor_ordering = ("rank", "username")
 
     def get_context_data(self, *, object_list=None, **kwargs):
         context = super(LeaderboardView, self).get_context_data(**kwargs)
-        username = self.request.GET.get("project_name", "")
+        username = self.request.GET.get("username", "")
         context["search_form"] = DeveloperSearchForm(
             initial={"username": username}
         )
-        page_obj = context.get("page_obj")
-
-        if page_obj:
-            context["start_rank"] = (page_obj.number - 1) * self.paginate_by
-        else:
-            context["start_rank"] = 0
 
         return context
 
     def get_queryset(self):
-        qs = get_user_model().objects.all()
+        qs = LeaderboardEntry.objects.select_related("developer")
         form = DeveloperSearchForm(self.request.GET)
 
         if form.is_valid():
@@ -66,40 +74,70 @@ class LeaderboardView(ListView):
             if username:
                 qs = qs.filter(username__icontains=username)
 
-        qs = qs.annotate(avg_score=Avg("projects__score")).order_by(
-            "-avg_score", "username"
-        )
-
         return qs
 
 
+def developer_suggest(request):
+    """
+    Search-as-you-type suggestions for the leaderboard search box:
+    ``?q=<prefix>&limit=<k>`` returns the best matching developers as JSON.
+    The answer only depends on the URL, so browsers and proxies may cache
+    it.
+    """
+    query = request.GET.get("q", "")
+    try:
+        limit = int(request.GET.get("limit", SUGGEST_LIMIT))
+    except ValueError:
+        limit = SUGGEST_LIMIT
+
+    results = [
+        {**row, "url": reverse("users:profile", args=[row["id"]])}
+        for row in suggest_developers(query, limit)
+    ]
+    response = JsonResponse(
+        {"query": normalize_query(query), "results": results}
+    )
+    patch_cache_control(
+        response,
+        public=True,
+        max_age=settings.DEVELOPER_SUGGEST_CACHE_SECONDS,
+    )
+    return response
+
+
 class DeveloperDetailView(DetailView):
     model = get_user_model()
     template_name = "users/profile.html"
     context_object_name = "developer"
     pk_url_kwarg = "user_pk"
 
-    def get_queryset(self):
-        return (
-            get_user_model()
-            .objects.filter(pk=self.kwargs["user_pk"])
-            .prefetch_related("projects")
+    async def get(self, request, *args, **kwargs):
+        # The profile, the best projects and the session user are
+        # independent reads, so they are awaited together.
+        self.object, self.projects, _ = await asyncio.gather(
+            aget_object_or_404(self.model, pk=self.kwargs["user_pk"]),
+            self.aget_projects(),
+            aget_request_user(request),
         )
+        context = self.get_context_data(object=self.object)
+        return self.render_to_response(context)
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        developer = self.object
-        is_developer = developer == self.request.user
-
+    async def aget_projects(self):
         project_ids = ProjectMembership.objects.filter(
-            user=developer
+            user_id=self.kwargs["user_pk"]
         ).values_list("project_id", flat=True)
 
-        context["is_developer"] = is_developer
+        return [
+            project
+            async for project in Project.objects.filter(
+                id__in=project_ids
+            ).order_by("-score")[:5]
+        ]
 
-        context["projects"] = Project.objects.filter(
-            id__in=project_ids
-        ).order_by("-score")[:5]
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["is_developer"] = self.object == self.request.user
+        context["projects"] = self.projects
 
         return context
 
@@ -147,10 +185,13 @@ class MyProjectListView(ListView):
     paginate_by = 10
 
     def get_queryset(self):
-        qs = (
-            self.request.user.projects.all()
-            | self.request.user.owned_projects.all()
-        ).distinct()
+        user = self.request.user
+        project_ids = ProjectMembership.objects.filter(user=user).values(
+            "project_id"
+        )
+        qs = Project.objects.filter(
+            Q(id__in=project_ids) | Q(owner=user)
+        ).order_by("-created_at", "id")
         return qs
 
 